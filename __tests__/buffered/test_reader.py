@@ -0,0 +1,98 @@
+import asyncio
+
+from favicorn.buffered import BufferedSocketReader, ReadBufferPool
+from favicorn.i.reader import ReadData
+from favicorn.timer_wheel import get_timer_wheel
+
+import pytest
+
+
+class FakeTransport(asyncio.ReadTransport):
+    def __init__(self) -> None:
+        self.reading = True
+
+    def pause_reading(self) -> None:
+        self.reading = False
+
+    def resume_reading(self) -> None:
+        self.reading = True
+
+
+def feed(reader: BufferedSocketReader, data: bytes) -> None:
+    while data:
+        buffer = reader.get_buffer(-1)
+        chunk = data[: len(buffer)]
+        buffer[: len(chunk)] = chunk
+        reader.buffer_updated(len(chunk))
+        data = data[len(chunk) :]
+
+
+async def read_after_feed(
+    reader: BufferedSocketReader, data: bytes
+) -> ReadData:
+    read_task = asyncio.create_task(reader.read())
+    await asyncio.sleep(0)
+    feed(reader, data)
+    result = await read_task
+    assert result is not None
+    return result
+
+
+def build_reader(
+    min_size: int = 16, max_size: int = 64
+) -> tuple[BufferedSocketReader, FakeTransport]:
+    transport = FakeTransport()
+    pool = ReadBufferPool(min_size=min_size, max_size=max_size)
+    return BufferedSocketReader(transport, pool, get_timer_wheel()), transport
+
+
+async def test_reader_returns_memoryview_slices() -> None:
+    reader, _ = build_reader()
+    feed(reader, b"GET / HTTP/1.1\r\n")
+    data = await reader.read()
+    assert isinstance(data, memoryview)
+    assert data.tobytes() == b"GET / HTTP/1.1\r\n"
+    feed(reader, b"Host: a\r\n")
+    assert await reader.read(count=4) == b"Host"
+    assert await reader.read() == b": a\r\n"
+
+
+async def test_reader_grows_and_pauses_at_max_size() -> None:
+    reader, transport = build_reader()
+    feed(reader, b"x" * 64)
+    assert len(reader.buffer) == 64
+    assert not transport.reading
+    assert await reader.read() == b"x" * 64
+    assert not transport.reading
+    assert await read_after_feed(reader, b"y") == b"y"
+    assert transport.reading
+
+
+async def test_reader_shrinks_after_small_reads() -> None:
+    reader, _ = build_reader()
+    feed(reader, b"x" * 40)
+    assert await reader.read() == b"x" * 40
+    assert len(reader.buffer) == 64
+    for _ in range(reader.shrink_after_cycles + 1):
+        assert await read_after_feed(reader, b"y") == b"y"
+    assert len(reader.buffer) == 32
+
+
+async def test_reader_wait_timeout_and_eof() -> None:
+    reader, _ = build_reader()
+    assert await reader.wait(timeout=0.01) is False
+    assert await reader.read(timeout=0.01) is None
+    assert await read_after_feed(reader, b"data") == b"data"
+    reader.feed_eof()
+    assert await reader.read() is None
+
+
+@pytest.mark.parametrize("min_size,max_size", [(16, 16), (16, 64)])
+async def test_reader_keeps_unread_data_on_reuse(
+    min_size: int, max_size: int
+) -> None:
+    reader, _ = build_reader(min_size, max_size)
+    feed(reader, b"a" * 10)
+    assert await reader.read(count=8) == b"a" * 8
+    feed(reader, b"b" * 6)
+    assert await reader.read() == b"aabbbbbb"
@@ -1,4 +1,10 @@
-from favicorn.controllers.asgi import ASGIControllerFactory
+import asyncio
+import tempfile
+import threading
+from typing import IO, cast
+
+from favicorn.controllers.asgi import ASGIController, ASGIControllerFactory
+from favicorn.controllers.asgi.responses import RESPONSE_413
 from favicorn.i.event_bus import (
     ControllerReceiveEvent,
     ControllerSendEvent,
@@ -18,8 +24,7 @@ from __tests__.factories import (
     http_serializer_factories,
 )
 
-
-CONTROLLER_RECEIVE_EVENT = ControllerReceiveEvent(count=None, timeout=None)
+CONTROLLER_RECEIVE_EVENT = ControllerReceiveEvent(count=65536, timeout=None)
 
 
 @pytest.mark.parametrize("event_bus_factory", event_bus_factories)
@@ -166,3 +171,434 @@ async def test_controller_returns_400_on_invalid_http_request(
     assert not controller.is_keepalive()
     with pytest.raises(StopAsyncIteration):
         await safe_async(event_bus.__anext__())
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+@pytest.mark.parametrize("http_parser_factory", http_parser_factories)
+@pytest.mark.parametrize("http_serializer_factory", http_serializer_factories)
+async def test_controller_serves_requests_after_reset(
+    event_bus_factory: IEventBusFactory,
+    http_parser_factory: IHTTPParserFactory,
+    http_serializer_factory: IHTTPSerializerFactory,
+) -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"Content-Length", b"0")],
+            }
+        )
+        await send(
+            {"type": "http.response.body", "body": b"", "more_body": False}
+        )
+
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factory,
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factory, http_serializer_factory
+        ),
+    ).build()
+    event_bus = controller.get_event_bus()
+    serializer = http_serializer_factory.build()
+    for path in (b"/first", b"/second"):
+        await safe_async(controller.start(client=None))
+        assert CONTROLLER_RECEIVE_EVENT == await safe_async(
+            event_bus.__anext__()
+        )
+        event_bus.provide_for_receive(
+            b"GET " + path + b" HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        )
+        assert ControllerSendEvent(
+            data=serializer.serialize_metadata(
+                ResponseMetadata(
+                    status=200, headers=((b"Content-Length", b"0"),)
+                )
+            )
+        ) == await safe_async(event_bus.__anext__())
+        assert ControllerSendEvent(data=b"") == await safe_async(
+            event_bus.__anext__()
+        )
+        with pytest.raises(StopAsyncIteration):
+            await safe_async(event_bus.__anext__())
+        await safe_async(controller.stop())
+        assert controller.is_keepalive()
+        controller.reset()
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+async def test_controller_rejects_unexpected_events(
+    event_bus_factory: IEventBusFactory,
+) -> None:
+    errors = []
+
+    async def app(scope, receive, send) -> None:  # type: ignore
+        assert await receive() == {
+            "type": "http.request",
+            "body": b"",
+            "more_body": False,
+        }
+        for event in (
+            {"type": "http.response.body", "body": b""},
+            {"type": "http.response.unknown"},
+        ):
+            try:
+                await send(event)
+            except RuntimeError as error:
+                errors.append(str(error))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+        try:
+            await send({"type": "http.response.body", "body": b""})
+        except RuntimeError as error:
+            errors.append(str(error))
+
+    http_serializer_factory = http_serializer_factories[0]
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factory,
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factories[0], http_serializer_factory
+        ),
+    ).build()
+    event_bus = controller.get_event_bus()
+    serializer = http_serializer_factory.build()
+    await safe_async(controller.start(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    assert ControllerSendEvent(
+        data=serializer.serialize_metadata(
+            ResponseMetadata(status=204, headers=[])
+        )
+    ) == await safe_async(event_bus.__anext__())
+    await safe_async(controller.stop())
+    assert errors == [
+        "Unexpected event http.response.body",
+        "Unhandled event type: http.response.unknown",
+        "No events was expected",
+    ]
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+async def test_controller_runs_inline(
+    event_bus_factory: IEventBusFactory,
+) -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        if scope["path"] == "/block":
+            await asyncio.Event().wait()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factory,
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factories[0], http_serializer_factories[0]
+        ),
+    ).build()
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    await safe_async(event_bus.__anext__())
+    await safe_async(task)
+    controller.reset()
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(
+        b"GET /block HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await safe_async(task)
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+async def test_controller_run_reraises_swallowed_cancellation(
+    event_bus_factory: IEventBusFactory,
+) -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": [],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+
+    http_serializer_factory = http_serializer_factories[0]
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factory,
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factories[0], http_serializer_factory
+        ),
+    ).build()
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    await asyncio.sleep(0.01)
+    task.cancel()
+    assert ControllerSendEvent(
+        data=http_serializer_factory.build().serialize_metadata(
+            ResponseMetadata(status=204, headers=[])
+        )
+    ) == await safe_async(event_bus.__anext__())
+    with pytest.raises(asyncio.CancelledError):
+        await safe_async(task)
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+async def test_controller_answers_before_reading_whole_body(
+    event_bus_factory: IEventBusFactory,
+) -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        tasks = asyncio.all_tasks()
+        event = await receive()
+        assert event["body"] == b"hello"
+        assert event["more_body"]
+        assert asyncio.all_tasks() == tasks
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factory,
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factories[0], http_serializer_factories[0]
+        ),
+    ).build()
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(
+        b"POST / HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Content-Length: 1000\r\n\r\n"
+        b"hello"
+    )
+    assert ControllerSendEvent(
+        data=http_serializer_factories[0]
+        .build()
+        .serialize_metadata(ResponseMetadata(status=204, headers=[]))
+    ) == await safe_async(event_bus.__anext__())
+    await safe_async(task)
+
+
+def is_spooled_to_disk(spool: IO[bytes] | None) -> bool:
+    if isinstance(spool, tempfile.SpooledTemporaryFile):
+        return cast(bool, spool._rolled)  # type: ignore[attr-defined]
+    return spool is not None
+
+
+@pytest.mark.parametrize("body_spool_threshold", [0, 16])
+async def test_controller_spools_body_to_disk(
+    body_spool_threshold: int,
+) -> None:
+    body = bytes(range(100))
+    events: list[tuple[bytes, bool]] = []
+
+    async def app(scope, receive, send) -> None:  # type: ignore
+        more_body = True
+        while more_body:
+            event = await receive()
+            spool = controller.event_manager.body_spool
+            events.append((event["body"], is_spooled_to_disk(spool)))
+            more_body = event["more_body"]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = cast(
+        ASGIController,
+        ASGIControllerFactory(
+            app,
+            event_bus_factory=event_bus_factories[0],
+            http_protocol_factory=HTTPProtocolFactory(
+                http_parser_factories[0], http_serializer_factories[0]
+            ),
+            body_spool_threshold=body_spool_threshold,
+            body_spool_chunk_size=40,
+        ).build(),
+    )
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(
+        b"POST / HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Content-Length: 100\r\n\r\n" + body
+    )
+    await safe_async(event_bus.__anext__())
+    await safe_async(task)
+    assert events == [
+        (body[:40], True),
+        (body[40:80], True),
+        (body[80:], False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "request_bytes",
+    [
+        b"POST / HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Content-Length: 11\r\n\r\n",
+        b"POST / HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        b"6\r\nhello \r\n5\r\nworld\r\n0\r\n\r\n",
+    ],
+)
+@pytest.mark.parametrize("body_spool_threshold", [None, 4])
+async def test_controller_rejects_too_large_body(
+    request_bytes: bytes,
+    body_spool_threshold: int | None,
+) -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        while (await receive())["more_body"]:
+            pass
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = ASGIControllerFactory(
+        app,
+        event_bus_factory=event_bus_factories[0],
+        http_protocol_factory=HTTPProtocolFactory(
+            http_parser_factories[0], http_serializer_factories[0]
+        ),
+        body_spool_threshold=body_spool_threshold,
+        max_body_size=10,
+    ).build()
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(request_bytes)
+    assert ControllerSendEvent(
+        data=http_serializer_factories[0]
+        .build()
+        .serialize_static_response(RESPONSE_413.metadata, RESPONSE_413.body)
+    ) == await safe_async(event_bus.__anext__())
+    await safe_async(task)
+    assert not controller.is_keepalive()
+
+
+async def test_controller_keeps_small_chunked_body_in_memory() -> None:
+    events: list[tuple[bytes, bool, IO[bytes] | None]] = []
+
+    async def app(scope, receive, send) -> None:  # type: ignore
+        event = await receive()
+        spool = controller.event_manager.body_spool
+        events.append((event["body"], event["more_body"], spool))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = cast(
+        ASGIController,
+        ASGIControllerFactory(
+            app,
+            event_bus_factory=event_bus_factories[0],
+            http_protocol_factory=HTTPProtocolFactory(
+                http_parser_factories[0], http_serializer_factories[0]
+            ),
+            body_spool_threshold=64,
+        ).build(),
+    )
+    event_bus = controller.get_event_bus()
+    task = asyncio.create_task(controller.run(client=None))
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(
+        b"POST / HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        b"6\r\nhello \r\n"
+    )
+    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    event_bus.provide_for_receive(b"5\r\nworld\r\n0\r\n\r\n")
+    await safe_async(event_bus.__anext__())
+    await safe_async(task)
+    assert events == [(b"hello world", False, None)]
+
+
+async def test_controller_closes_spool_after_pending_io() -> None:
+    async def app(scope, receive, send) -> None:  # type: ignore
+        pass
+
+    controller = cast(
+        ASGIController,
+        ASGIControllerFactory(
+            app,
+            event_bus_factory=event_bus_factories[0],
+            http_protocol_factory=HTTPProtocolFactory(
+                http_parser_factories[0], http_serializer_factories[0]
+            ),
+        ).build(),
+    )
+    event_manager = controller.event_manager
+    spool = tempfile.TemporaryFile()
+    event_manager.body_spool = spool
+    started = threading.Event()
+    release = threading.Event()
+
+    def write(data: bytes) -> int:
+        started.set()
+        release.wait()
+        return spool.write(data)
+
+    task = asyncio.create_task(event_manager.run_spool_io(write, b"data"))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    event_manager.close_body_spool()
+    assert event_manager.body_spool is None
+    assert not spool.closed
+    release.set()
+    for _ in range(100):
+        if spool.closed:
+            break
+        await asyncio.sleep(0.01)
+    assert spool.closed
@@ -0,0 +1,90 @@
+import gc
+import sys
+
+from favicorn.controllers.asgi.scope_builder import ASGIScopeBuilder
+from favicorn.i.protocols.http.request_metadata import RequestMetadata
+
+
+def build_metadata(websocket: bool = False) -> RequestMetadata:
+    return RequestMetadata(
+        path="/users",
+        method="GET",
+        raw_path=b"/users",
+        http_version="1.1",
+        query_string=b"page=2",
+        headers=[(b"host", b"localhost"), (b"accept", b"*/*")],
+        keep_alive=True,
+        websocket=websocket,
+    )
+
+
+def test_scope_builder_fills_template() -> None:
+    builder = ASGIScopeBuilder(server=("127.0.0.1", 8000), root_path="/api")
+    metadata = build_metadata()
+    scope = builder.build(metadata, ("127.0.0.1", 50000))
+    assert scope == {
+        "type": "http",
+        "scheme": "http",
+        "asgi": {"spec_version": "2.3", "version": "3.0"},
+        "extensions": {
+            "http.response.pathsend": {},
+            "http.response.zerocopysend": {},
+        },
+        "root_path": "/api",
+        "server": ("127.0.0.1", 8000),
+        "path": "/users",
+        "http_version": "1.1",
+        "raw_path": b"/users",
+        "query_string": b"page=2",
+        "headers": metadata.headers,
+        "client": ("127.0.0.1", 50000),
+        "method": "GET",
+    }
+    assert scope["headers"] is metadata.headers
+    assert scope["asgi"] is not builder.build(metadata, None)["asgi"]
+    websocket_scope = builder.build(build_metadata(websocket=True), None)
+    assert websocket_scope["type"] == "websocket"
+    assert websocket_scope["scheme"] == "ws"
+    assert websocket_scope["root_path"] == "/api"
+    assert websocket_scope["extensions"] == {}
+
+
+def test_scope_builder_isolates_scopes() -> None:
+    builder = ASGIScopeBuilder()
+    metadata = build_metadata()
+    scope = builder.build(metadata, None)
+    scope["asgi"]["version"] = "2.0"
+    scope["extensions"]["http.response.pathsend"]["enabled"] = True
+    scope["extensions"]["custom"] = {}
+    websocket_scope = builder.build(build_metadata(websocket=True), None)
+    websocket_scope["extensions"]["custom"] = {}
+    assert builder.build(metadata, None) == {
+        **scope,
+        "asgi": {"spec_version": "2.3", "version": "3.0"},
+        "extensions": {
+            "http.response.pathsend": {},
+            "http.response.zerocopysend": {},
+        },
+    }
+    assert (
+        builder.build(build_metadata(websocket=True), None)["extensions"] == {}
+    )
+
+
+def test_scope_builder_allocations() -> None:
+    builder = ASGIScopeBuilder(server=("127.0.0.1", 8000))
+    metadata = build_metadata()
+    client = ("127.0.0.1", 50000)
+    count = 1000
+    scopes = []
+    builder.build(metadata, client)
+    gc.disable()
+    try:
+        blocks_before = sys.getallocatedblocks()
+        for _ in range(count):
+            scopes.append(builder.build(metadata, client))
+        blocks_per_scope = (sys.getallocatedblocks() - blocks_before) / count
+    finally:
+        gc.enable()
+    assert len(scopes) == count
+    assert blocks_per_scope < 8.5
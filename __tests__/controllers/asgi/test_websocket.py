@@ -27,6 +27,7 @@ from __tests__.factories import (
 
 
 CONTROLLER_RECEIVE_EVENT = ControllerReceiveEvent(count=None, timeout=None)
+METADATA_RECEIVE_EVENT = ControllerReceiveEvent(count=65536, timeout=None)
 
 
 @pytest.mark.parametrize("event_bus_factory", event_bus_factories)
@@ -47,7 +48,7 @@ async def test_controller_not_supporting_websockets(
     event_bus = controller.get_event_bus()
     http_serializer = http_serializer_factory.build()
     await safe_async(controller.start(client=None))
-    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    assert METADATA_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
     event_bus.provide_for_receive(
         b"GET / HTTP/1.1\r\n"
         b"Host: localhost\r\n"
@@ -123,7 +124,7 @@ async def test_controller_supporting_websockets(
     )
     await safe_async(controller.start(client=None))
 
-    assert CONTROLLER_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
+    assert METADATA_RECEIVE_EVENT == await safe_async(event_bus.__anext__())
     sec_websocket_key = create_websocket_client_key()
     sec_websocket_accept = websocket_serializer.create_accept_token(
         sec_websocket_key
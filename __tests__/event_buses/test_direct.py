@@ -0,0 +1,61 @@
+from typing import BinaryIO
+
+from favicorn.event_buses import DirectEventBus
+from favicorn.i.reader import ISocketReader
+from favicorn.i.writer import ISocketWriter
+
+
+class FakeReader(ISocketReader):
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    async def read(
+        self, timeout: float | None = None, count: int | None = None
+    ) -> bytes | None:
+        data = self.data[:count]
+        self.data = self.data[len(data) :]
+        return data or None
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        return len(self.data) > 0
+
+
+class FakeWriter(ISocketWriter):
+    def __init__(self) -> None:
+        self.data = b""
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        pass
+
+    async def drain(self) -> None:
+        pass
+
+    async def flush(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_address(self) -> tuple[str, int] | None:
+        return None
+
+    async def close(self) -> None:
+        pass
+
+
+async def test_attached_event_bus_dispatches_directly() -> None:
+    reader, writer = FakeReader(b"request"), FakeWriter()
+    event_bus = DirectEventBus()
+    assert event_bus.attach(reader, writer)
+    assert await event_bus.receive(count=3) == b"req"
+    assert await event_bus.receive() == b"uest"
+    assert await event_bus.receive() is None
+    event_bus.send(b"response")
+    assert writer.data == b"response"
+    event_bus.close()
+    assert [event async for event in event_bus] == []
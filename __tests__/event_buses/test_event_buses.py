@@ -47,3 +47,18 @@ async def test_event_bus_dont_closes_when_have_pending_events(
     assert ControllerSendEvent(data) == await event_bus.__anext__()
     with pytest.raises(StopAsyncIteration):
         await event_bus.__anext__()
+
+
+@pytest.mark.parametrize("event_bus_factory", event_bus_factories)
+async def test_event_bus_drain_waits_for_queued_data(
+    event_bus_factory: IEventBusFactory,
+) -> None:
+    event_bus = event_bus_factory.build()
+    await asyncio.wait_for(event_bus.drain(), timeout=0.1)
+    data = b"x" * 100000
+    event_bus.send(data)
+    drain_task = asyncio.create_task(event_bus.drain())
+    await asyncio.sleep(0.1)
+    assert not drain_task.done()
+    assert ControllerSendEvent(data=data) == await event_bus.__anext__()
+    await asyncio.wait_for(drain_task, timeout=0.1)
@@ -1,4 +1,4 @@
-from favicorn.event_buses import DequeEventBusFactory
+from favicorn.event_buses import DequeEventBusFactory, DirectEventBusFactory
 from favicorn.i.event_bus import IEventBusFactory
 from favicorn.i.protocols.http.parser import IHTTPParserFactory
 from favicorn.i.protocols.http.serializer import IHTTPSerializerFactory
@@ -9,8 +9,13 @@ from favicorn.i.protocols.websocket.serializer import (
 from favicorn.protocols.http.parsers import (
     H11HTTPParserFactory,
     HTTPToolsParserFactory,
+    LLHTTPParserFactory,
+)
+from favicorn.protocols.http.serializers import (
+    HTTPBaseSerializerFactory,
+    HTTPNativeSerializerFactory,
+    HTTPPrecompiledSerializerFactory,
 )
-from favicorn.protocols.http.serializers import HTTPBaseSerializerFactory
 from favicorn.protocols.websocket.parsers import (
     WSProtoWebsocketParserFactory,
 )
@@ -24,19 +29,32 @@ import httptools
 
 import wsproto
 
+try:
+    import favicorn_core
+except ImportError:
+    favicorn_core = None
+
 
 event_bus_factories: list[IEventBusFactory] = [
     DequeEventBusFactory(),
+    DirectEventBusFactory(),
 ]
 
 http_parser_factories: list[IHTTPParserFactory] = [
     H11HTTPParserFactory(h11),
     HTTPToolsParserFactory(httptools),
 ]
+if hasattr(favicorn_core, "RequestParser"):
+    http_parser_factories.append(LLHTTPParserFactory(favicorn_core))
 
 http_serializer_factories: list[IHTTPSerializerFactory] = [
     HTTPBaseSerializerFactory(),
+    HTTPPrecompiledSerializerFactory(),
 ]
+if hasattr(favicorn_core, "ResponseSerializer"):
+    http_serializer_factories.append(
+        HTTPNativeSerializerFactory(favicorn_core)
+    )
 websocket_parser_factories: list[IWebsocketParserFactory] = [
     WSProtoWebsocketParserFactory(wsproto),
 ]
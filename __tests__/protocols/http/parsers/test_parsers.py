@@ -2,6 +2,7 @@ from favicorn.i.protocols.http.parser import (
     HTTPParsingException,
     IHTTPParserFactory,
 )
+from favicorn.i.protocols.http.request_metadata import RequestMetadata
 
 import pytest
 
@@ -91,3 +92,239 @@ async def test_raise_error_on_h11_request_with_invalid_host(
         assert error is None
         assert parser.is_metadata_ready()
         assert parser.get_body() == b""
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_requests_after_reset(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    parser = parser_factory.build()
+    for t_request in test_requests:
+        parser.feed_data(t_request.request_bytes)
+        assert parser.get_error() is None
+        assert_metadata_equals(
+            parser.get_metadata(), t_request.expected_metadata
+        )
+        assert parser.get_body() == t_request.expected_body
+        parser.reset()
+        assert not parser.is_metadata_ready()
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_pipelined_requests(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    pipelined_requests = [
+        test_requests[0],
+        test_requests[2],
+        test_requests[-1],
+    ]
+    parser = parser_factory.build()
+    parser.feed_data(
+        b"".join(t_request.request_bytes for t_request in pipelined_requests)
+    )
+    for index, t_request in enumerate(pipelined_requests):
+        if index != 0:
+            parser.reset()
+            assert parser.has_buffered_data()
+        assert parser.get_error() is None
+        assert_metadata_equals(
+            parser.get_metadata(), t_request.expected_metadata
+        )
+        assert parser.get_body() == t_request.expected_body
+        assert not parser.is_more_body()
+    parser.reset()
+    assert not parser.has_buffered_data()
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+@pytest.mark.parametrize("t_request", test_requests)
+async def test_parse_request_byte_by_byte(
+    parser_factory: IHTTPParserFactory,
+    t_request: TestRequest,
+) -> None:
+    parser = parser_factory.build()
+    body = b""
+    for index in range(len(t_request.request_bytes)):
+        parser.feed_data(t_request.request_bytes[index : index + 1])
+        assert parser.get_error() is None
+        if parser.is_metadata_ready():
+            body += parser.get_body() or b""
+    assert_metadata_equals(parser.get_metadata(), t_request.expected_metadata)
+    assert body == t_request.expected_body
+    assert not parser.is_more_body()
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_large_headers(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    headers = [(b"x-header-%d" % index, b"v" * 50) for index in range(100)]
+    headers.append((b"cookie", b"c" * 8000))
+    request_bytes = (
+        b"GET /large HTTP/1.1\r\nHost: localhost\r\n"
+        + b"".join(b"%s: %s\r\n" % header for header in headers)
+        + b"\r\n"
+    )
+    parser = parser_factory.build()
+    for offset in range(0, len(request_bytes), 1000):
+        assert not parser.is_metadata_ready()
+        parser.feed_data(memoryview(request_bytes)[offset : offset + 1000])
+    assert parser.get_error() is None
+    metadata = parser.get_metadata()
+    assert metadata.path == "/large"
+    assert list(metadata.headers) == [(b"host", b"localhost"), *headers]
+    assert parser.get_body() == b""
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_pipelined_requests_split_across_reads(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    pipelined_requests = [
+        test_requests[0],
+        test_requests[2],
+        test_requests[4],
+        test_requests[5],
+    ]
+    data = b"".join(
+        t_request.request_bytes for t_request in pipelined_requests
+    )
+    parser = parser_factory.build()
+    parsed: list[tuple[RequestMetadata, bytes]] = []
+    body = b""
+    for offset in range(0, len(data), 7):
+        parser.feed_data(data[offset : offset + 7])
+        while parser.is_metadata_ready():
+            assert parser.get_error() is None
+            body += parser.get_body() or b""
+            if parser.is_more_body():
+                break
+            parsed.append((parser.get_metadata(), body))
+            body = b""
+            parser.reset()
+    assert len(parsed) == len(pipelined_requests)
+    for (metadata, body), t_request in zip(parsed, pipelined_requests):
+        assert_metadata_equals(metadata, t_request.expected_metadata)
+        assert body == t_request.expected_body
+    assert not parser.has_buffered_data()
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_body_in_chunks(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    parser = parser_factory.build()
+    parser.feed_data(
+        b"POST /upload HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Content-Length: 10\r\n\r\n"
+        b"hello"
+    )
+    assert parser.get_error() is None
+    assert parser.is_metadata_ready()
+    assert parser.get_body() == b"hello"
+    assert parser.is_more_body()
+    assert parser.get_body() is None
+    parser.feed_data(b"world")
+    assert parser.get_body() == b"world"
+    assert not parser.is_more_body()
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_body_queues_chunks(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    parser = parser_factory.build()
+    parser.feed_data(
+        b"POST /upload HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n1\r\n \r\n"
+    )
+    assert parser.is_metadata_ready()
+    parser.feed_data(b"5\r\nworld\r\n")
+    assert parser.is_more_body()
+    assert parser.get_body() == b"hello world"
+    assert parser.get_body() is None
+    parser.feed_data(b"1\r\n!\r\n0\r\n\r\n")
+    assert not parser.is_more_body()
+    assert parser.get_body() == b"!"
+    assert parser.get_body() is None
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_upgrade_request(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    parser = parser_factory.build()
+    parser.feed_data(
+        b"GET /ws HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Connection: Upgrade\r\n"
+        b"Upgrade: websocket\r\n"
+        b"Sec-WebSocket-Version: 13\r\n"
+        b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n\r\n"
+    )
+    assert parser.get_error() is None
+    assert parser.is_metadata_ready()
+    metadata = parser.get_metadata()
+    assert metadata.path == "/ws"
+    assert metadata.is_websocket()
+    assert metadata.websocket is True
+    assert (
+        metadata.get_header(b"sec-websocket-key")
+        == b"dGhlIHNhbXBsZSBub25jZQ=="
+    )
+
+
+@pytest.mark.parametrize("parser_factory", http_parser_factories)
+async def test_parse_request_flags(
+    parser_factory: IHTTPParserFactory,
+) -> None:
+    parser = parser_factory.build()
+    parser.feed_data(
+        b"POST /upload HTTP/1.1\r\n"
+        b"HOST: localhost\r\n"
+        b"Connection: Close\r\n"
+        b"Content-Length: 5\r\n"
+        b"Expect: 100-continue\r\n"
+        b"X-Custom-Header: value\r\n\r\n"
+        b"hello"
+    )
+    assert parser.get_error() is None
+    metadata = parser.get_metadata()
+    assert metadata.keep_alive is False
+    assert metadata.websocket is False
+    assert metadata.content_length == 5
+    assert metadata.expect_continue is True
+    assert metadata.host == b"localhost"
+    assert [name for name, _ in metadata.headers] == [
+        b"host",
+        b"connection",
+        b"content-length",
+        b"expect",
+        b"x-custom-header",
+    ]
+    assert metadata.get_header(b"x-custom-header") == b"value"
+    assert metadata.get_header(b"cookie") is None
+
+
+def test_request_metadata_header_index() -> None:
+    metadata = RequestMetadata(
+        path="/",
+        method="GET",
+        raw_path=b"/",
+        http_version="1.1",
+        query_string=None,
+        headers=(
+            (b"connection", b"close"),
+            (b"upgrade", b"WebSocket"),
+            (b"connection", b"keep-alive"),
+        ),
+    )
+    assert metadata.keep_alive is None
+    assert metadata.get_header(b"connection") == b"close"
+    assert metadata.get_header_index() is metadata.get_header_index()
+    assert not metadata.is_keepalive()
+    assert metadata.is_websocket()
@@ -1,5 +1,7 @@
 import time
+from http import HTTPStatus
 
+from favicorn.i.protocols.http.response_metadata import ResponseMetadata
 from favicorn.i.protocols.http.serializer import IHTTPSerializerFactory
 
 import pytest
@@ -9,17 +11,60 @@ from __tests__.factories import http_serializer_factories
 from .conftest import TestResponse, test_responses
 
 
+def expected_metadata_bytes(
+    t_response: TestResponse, before: float, after: float
+) -> tuple[bytes, ...]:
+    return (
+        t_response.expected_metadata_bytes(before),
+        t_response.expected_metadata_bytes(after),
+    )
+
+
 @pytest.mark.parametrize("serializer_factory", http_serializer_factories)
 @pytest.mark.parametrize("t_response", test_responses)
 async def test_serialize_response(
     serializer_factory: IHTTPSerializerFactory,
     t_response: TestResponse,
 ) -> None:
-    timestamp = time.time()
     serializer = serializer_factory.build()
-    assert t_response.expected_metadata_bytes(
-        timestamp
-    ) == serializer.serialize_metadata(t_response.metadata)
+    before = time.time()
+    metadata_bytes = serializer.serialize_metadata(t_response.metadata)
+    assert metadata_bytes in expected_metadata_bytes(
+        t_response, before, time.time()
+    )
     assert t_response.expected_body_bytes == serializer.serialize_body(
         t_response.body,
     )
+
+
+@pytest.mark.parametrize("serializer_factory", http_serializer_factories)
+@pytest.mark.parametrize("t_response", test_responses)
+async def test_serialize_static_response(
+    serializer_factory: IHTTPSerializerFactory,
+    t_response: TestResponse,
+) -> None:
+    serializer = serializer_factory.build()
+    for _ in range(2):
+        before = time.time()
+        response_bytes = serializer.serialize_static_response(
+            t_response.metadata, t_response.body
+        )
+        assert response_bytes in (
+            expected + t_response.expected_body_bytes
+            for expected in expected_metadata_bytes(
+                t_response, before, time.time()
+            )
+        )
+
+
+@pytest.mark.parametrize("serializer_factory", http_serializer_factories)
+@pytest.mark.parametrize("status", list(HTTPStatus))
+async def test_serialize_reason_phrase(
+    serializer_factory: IHTTPSerializerFactory,
+    status: HTTPStatus,
+) -> None:
+    serializer = serializer_factory.build()
+    head = serializer.serialize_metadata(
+        ResponseMetadata(status=status.value, headers=[])
+    )
+    assert head.startswith(f"HTTP/1.1 {status} {status.phrase}\r\n".encode())
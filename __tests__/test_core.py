@@ -1,36 +1,217 @@
 import asyncio
+import logging
+import os
+import socket
 from ipaddress import IPv4Address
-from typing import AsyncGenerator
+from typing import Any, Generator
 
-from httpx import AsyncClient
+from favicorn.core import NativeCommandType, NativeEventType
 
 import pytest
 
-from favicorn_core import Server
+favicorn_core = pytest.importorskip("favicorn_core")
+if not hasattr(favicorn_core, "Server"):
+    pytest.skip("favicorn_core is not built", allow_module_level=True)
 
 
 @pytest.fixture
-def server() -> Server:
-    return Server(IPv4Address('0.0.0.0'), 8000)
+def sock() -> Generator[socket.socket, None, None]:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    try:
+        yield sock
+    finally:
+        sock.close()
 
 
 @pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
-    async with AsyncClient(base_url="http://0.0.0.0:8000/") as c:
-        yield c
+def server(sock: socket.socket) -> Generator[Any, None, None]:
+    server = favicorn_core.Server(sock.fileno())
+    try:
+        yield server
+    finally:
+        server.close()
 
 
+async def receive_events(server: Any, count: int) -> list[Any]:
+    events: list[Any] = []
+    while len(events) < count:
+        events += await asyncio.wait_for(server.receive(), timeout=1)
+    return events
+
+
+@pytest.mark.skipif(os.geteuid() == 0, reason="root can bind any port")
 def test_invalid_port() -> None:
     with pytest.raises(RuntimeError) as exc:
-        Server(IPv4Address('127.0.0.1'), 30)
-    assert str(exc.value) == "Error binding socket: Permission denied"
+        favicorn_core.Server(IPv4Address("127.0.0.1"), 30)
+    assert str(exc.value) == "Error binding socket: permission denied"
 
 
-async def test_server(server: Server, client: AsyncClient) -> None:
+async def test_server(server: Any, sock: socket.socket) -> None:
     future = server.receive()
     assert isinstance(future, asyncio.Future)
-    client_task = asyncio.create_task(client.get('/home'))
-    print(client_task)
+    reader, writer = await asyncio.open_connection(*sock.getsockname())
+    writer.write(b"ping")
+    events = await asyncio.wait_for(future, timeout=1)
+    connection_id, event_type, peername = events[0]
+    assert event_type == NativeEventType.CONNECTION_MADE
+    assert peername == writer.get_extra_info("sockname")
+    data = b"".join(event[2] for event in events[1:])
+    while len(data) < 4:
+        data += b"".join(event[2] for event in await receive_events(server, 1))
+    assert data == b"ping"
+    events = server.exchange_events(
+        [
+            (connection_id, NativeCommandType.WRITE, b"pong"),
+            (connection_id, NativeCommandType.CLOSE, None),
+        ]
+    )
+    assert await reader.read() == b"pong"
+    assert events + await receive_events(server, 2 - len(events)) == [
+        (connection_id, NativeEventType.DATA_WRITTEN, 4),
+        (connection_id, NativeEventType.CONNECTION_LOST, None),
+    ]
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_server_spreads_connections_between_loops() -> None:
+    with socket.socket() as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(("127.0.0.1", 0))
+        server = favicorn_core.Server(sock.fileno(), 4)
+        streams = []
+        try:
+            assert server.loops_count == 4
+            for _ in range(32):
+                streams.append(
+                    await asyncio.open_connection(*sock.getsockname())
+                )
+            events = await receive_events(server, 32)
+            assert {event[1] for event in events} == {
+                NativeEventType.CONNECTION_MADE
+            }
+            assert len({(event[0] - 1) % 4 for event in events}) > 1
+        finally:
+            for _, writer in streams:
+                writer.close()
+            server.close()
+
+
+async def test_server_reuses_buffers(server: Any, sock: socket.socket) -> None:
+    reader, writer = await asyncio.open_connection(*sock.getsockname())
+    (connection_id, _, _), *events = await receive_events(server, 1)
+    for _ in range(3):
+        writer.write(b"ping")
+        events += await receive_events(server, 1 - len(events))
+        assert events == [
+            (connection_id, NativeEventType.DATA_RECEIVED, b"ping")
+        ]
+        events = server.exchange_events(
+            [(connection_id, NativeCommandType.WRITE, b"pong")]
+        )
+        assert await reader.readexactly(4) == b"pong"
+        events += await receive_events(server, 1 - len(events))
+        assert events == [(connection_id, NativeEventType.DATA_WRITTEN, 4)]
+        events = []
+    [stats] = server.get_stats()
+    assert stats["buffer_hits"] > 0
+    assert stats["buffer_released"] == 6
+    assert stats["write_request_hits"] == 2
+    assert stats["write_request_misses"] == 1
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_server_idle_timer(server: Any, sock: socket.socket) -> None:
+    _, writer = await asyncio.open_connection(*sock.getsockname())
+    [(connection_id, _, _)] = await receive_events(server, 1)
+    events = server.exchange_events(
+        [(connection_id, NativeCommandType.START_IDLE_TIMER, (10, 4))]
+    )
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(server.receive(), timeout=0.1)
+    events += server.exchange_events(
+        [(connection_id, NativeCommandType.START_IDLE_TIMER, (10, 0))]
+    )
+    assert events + await receive_events(server, 1 - len(events)) == [
+        (connection_id, NativeEventType.IDLE_TIMEOUT, None)
+    ]
+    server.exchange_events(
+        [(connection_id, NativeCommandType.START_IDLE_TIMER, (50, 0))]
+    )
+    writer.write(b"ping")
+    events = await receive_events(server, 1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(server.receive(), timeout=0.1)
+    assert {event[1] for event in events} == {NativeEventType.DATA_RECEIVED}
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_server_accepts_buffer_payloads(
+    server: Any, sock: socket.socket
+) -> None:
+    reader, writer = await asyncio.open_connection(*sock.getsockname())
+    [(connection_id, _, _)] = await receive_events(server, 1)
+    with pytest.raises(TypeError):
+        server.exchange_events([(connection_id, NativeCommandType.WRITE)])
+    with pytest.raises(TypeError):
+        server.exchange_events([(connection_id, NativeCommandType.WRITE, 1)])
+    server.exchange_events(
+        [
+            (connection_id, NativeCommandType.WRITE, bytearray(b"po")),
+            (connection_id, NativeCommandType.WRITE, memoryview(b"xng")[1:]),
+        ]
+    )
+    assert await reader.readexactly(4) == b"pong"
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_server_releases_unused_payloads(
+    server: Any, sock: socket.socket
+) -> None:
+    reader, writer = await asyncio.open_connection(*sock.getsockname())
+    [(connection_id, _, _)] = await receive_events(server, 1)
+    with pytest.raises(ValueError):
+        server.exchange_events([(connection_id, 42, b"ping")])
+    events = server.exchange_events(
+        [
+            (connection_id, NativeCommandType.PAUSE_READING, b"ping"),
+            (connection_id, NativeCommandType.RESUME_READING, b"ping"),
+            (connection_id, NativeCommandType.WRITE, b"pong"),
+        ]
+    )
+    assert await reader.readexactly(4) == b"pong"
+    assert events + await receive_events(server, 1 - len(events)) == [
+        (connection_id, NativeEventType.DATA_WRITTEN, 4)
+    ]
+    [stats] = server.get_stats()
+    assert stats["buffer_released"] == 3
+    writer.close()
+    await writer.wait_closed()
+
 
-    results = await asyncio.gather(client_task, future)
-    print(results)
+async def test_server_logs(server: Any, sock: socket.socket) -> None:
+    _, writer = await asyncio.open_connection(*sock.getsockname())
+    await receive_events(server, 1)
+    assert server.drain_logs() == []
+    server.set_log_level(logging.DEBUG)
+    writer.close()
+    await writer.wait_closed()
+    [(connection_id, _, _)] = await receive_events(server, 1)
+    assert server.drain_logs() == [
+        (logging.DEBUG, connection_id, "EOF received"),
+    ]
+    _, writer = await asyncio.open_connection(*sock.getsockname())
+    [(connection_id, _, (host, port))] = await receive_events(server, 1)
+    assert server.drain_logs() == [
+        (
+            logging.DEBUG,
+            connection_id,
+            f"Connection accepted from {host}:{port}",
+        ),
+    ]
+    writer.close()
+    await writer.wait_closed()
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Callable
+
+from favicorn.reader import SocketReader
+from favicorn.timer_wheel import Timer, TimerWheel
+
+
+class ManualTimerWheel(TimerWheel):
+    callbacks: list[Callable[[], None]]
+
+    def __init__(self) -> None:
+        super().__init__(asyncio.get_running_loop())
+        self.callbacks = []
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        self.callbacks.append(callback)
+        return Timer(0, callback, self)
+
+    def cancel(self, timer: Timer) -> None:
+        if timer.callback in self.callbacks:
+            self.callbacks.remove(timer.callback)
+
+    def fire(self) -> None:
+        for callback in self.callbacks:
+            callback()
+
+
+async def test_reader_returns_none_on_timeout() -> None:
+    stream_reader = asyncio.StreamReader()
+    wheel = ManualTimerWheel()
+    reader = SocketReader(stream_reader, 1024, wheel)
+    read_task = asyncio.create_task(reader.read(timeout=1))
+    await asyncio.sleep(0)
+    wheel.fire()
+    assert await read_task is None
+    assert wheel.callbacks == []
+    stream_reader.feed_data(b"late")
+    assert await reader.read(timeout=1) == b"late"
+
+
+async def test_reader_prefers_data_over_timeout_of_same_loop_pass() -> None:
+    stream_reader = asyncio.StreamReader()
+    wheel = ManualTimerWheel()
+    reader = SocketReader(stream_reader, 1024, wheel)
+    read_task = asyncio.create_task(reader.read(timeout=1))
+    await asyncio.sleep(0)
+    stream_reader.feed_data(b"data")
+    wheel.fire()
+    assert await read_task == b"data"
+
+
+async def test_reader_keeps_data_arriving_after_timeout() -> None:
+    stream_reader = asyncio.StreamReader()
+    wheel = ManualTimerWheel()
+    reader = SocketReader(stream_reader, 1024, wheel)
+    read_task = asyncio.create_task(reader.read(timeout=1))
+    await asyncio.sleep(0)
+    wheel.fire()
+    stream_reader.feed_data(b"data")
+    data = await read_task
+    if data is None:
+        data = await reader.read(timeout=1)
+    assert data == b"data"
@@ -0,0 +1,393 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncGenerator
+
+from favicorn import ASGIFavicornBuilder
+from favicorn.builders.asgi import (
+    Engine,
+    EventBusImpl,
+    RequestExecutionImpl,
+    TransportImpl,
+)
+
+import pytest
+
+try:
+    import favicorn_core
+except ImportError:
+    favicorn_core = None
+
+STREAM_CHUNK = b"x" * 65536
+STREAM_CHUNKS_COUNT = 512
+streamed_chunks_count = 0
+
+
+async def stream_app(send) -> None:  # type: ignore
+    global streamed_chunks_count
+    streamed_chunks_count = 0
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (
+                    b"Content-Length",
+                    str(len(STREAM_CHUNK) * STREAM_CHUNKS_COUNT).encode(),
+                )
+            ],
+        }
+    )
+    for _ in range(STREAM_CHUNKS_COUNT):
+        await send(
+            {
+                "type": "http.response.body",
+                "body": STREAM_CHUNK,
+                "more_body": True,
+            }
+        )
+        streamed_chunks_count += 1
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def file_app(scope, send) -> None:  # type: ignore
+    path = scope["query_string"].decode()
+    if scope["path"] == "/http.response.pathsend":
+        size = os.path.getsize(path)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"Content-Length", str(size).encode())],
+            }
+        )
+        await send({"type": "http.response.pathsend", "path": path})
+        return
+    with open(path, "rb") as file:
+        size = os.path.getsize(path) - 10
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"Content-Length", str(size).encode())],
+            }
+        )
+        file.seek(10)
+        await send(
+            {
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "count": 100,
+                "more_body": True,
+            }
+        )
+        await send(
+            {
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "offset": 110,
+            }
+        )
+
+
+async def upload_app(receive, send) -> None:  # type: ignore
+    size = 0
+    max_chunk_size = 0
+    more_body = True
+    while more_body:
+        event = await receive()
+        size += len(event["body"])
+        max_chunk_size = max(max_chunk_size, len(event["body"]))
+        more_body = event["more_body"]
+        await asyncio.sleep(0.001)
+    response_body = f"{size}:{max_chunk_size}".encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Content-Length", str(len(response_body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": response_body})
+
+
+async def app(scope, receive, send) -> None:  # type: ignore
+    if scope["path"] == "/upload":
+        await upload_app(receive, send)
+        return
+    if scope["path"] == "/stream":
+        await stream_app(send)
+        return
+    if scope["path"][1:] in scope["extensions"]:
+        await file_app(scope, send)
+        return
+    body = b""
+    more_body = True
+    while more_body:
+        event = await receive()
+        body += event["body"]
+        more_body = event["more_body"]
+    response_body = scope["path"].encode() + b":" + body
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Content-Length", str(len(response_body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": response_body})
+
+
+@pytest.fixture(
+    params=[
+        ("asyncio", "streams", "deque", "inline"),
+        ("asyncio", "streams", "direct", "inline"),
+        ("asyncio", "streams", "direct", "task"),
+        ("asyncio", "buffered", "deque", "inline"),
+        ("asyncio", "buffered", "direct", "inline"),
+        pytest.param(
+            ("native", "buffered", "direct", "inline"),
+            marks=pytest.mark.skipif(
+                not hasattr(favicorn_core, "Server"),
+                reason="favicorn_core is not built",
+            ),
+        ),
+    ]
+)
+async def port(request: pytest.FixtureRequest) -> AsyncGenerator[int, None]:
+    engine: Engine
+    transport_impl: TransportImpl
+    event_bus_impl: EventBusImpl
+    request_execution_impl: RequestExecutionImpl
+    (
+        engine,
+        transport_impl,
+        event_bus_impl,
+        request_execution_impl,
+    ) = request.param
+    builder = ASGIFavicornBuilder(
+        app=app,
+        http_parser_impl="httptools",
+        port=0,
+        transport_impl=transport_impl,
+        event_bus_impl=event_bus_impl,
+        keepalive_timeout_s=1,
+        header_read_timeout_s=1,
+        engine=engine,
+        request_execution_impl=request_execution_impl,
+    )
+    server = builder.build()
+    await server.init()
+    await server.start_serving()
+    try:
+        yield builder.inet_provider.acquire().getsockname()[1]
+    finally:
+        await server.close()
+
+
+async def read_response(reader: asyncio.StreamReader) -> bytes:
+    head = await reader.readuntil(b"\r\n\r\n")
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return head.split(b"\r\n")[0] + b"|" + await reader.readexactly(length)
+
+
+async def test_server_keepalive_requests(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"GET /first HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/first:"
+        writer.write(
+            b"POST /second HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: 5\r\n\r\n"
+            b"hello"
+        )
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/second:hello"
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_pipelined_requests(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(
+            b"GET /first HTTP/1.1\r\nHost: localhost\r\n\r\n"
+            b"POST /second HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: 5\r\n\r\n"
+            b"hello"
+            b"GET /third HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        )
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/first:"
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/second:hello"
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/third:"
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_suspends_send_for_slow_reader(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"GET /stream HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await asyncio.sleep(0.5)
+        assert streamed_chunks_count < STREAM_CHUNKS_COUNT // 4
+        await reader.readuntil(b"\r\n\r\n")
+        await reader.readexactly(len(STREAM_CHUNK) * STREAM_CHUNKS_COUNT)
+        assert streamed_chunks_count == STREAM_CHUNKS_COUNT
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_sends_files(port: int, tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    content = os.urandom(300000)
+    path.write_bytes(content)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for extension, expected in (
+            ("http.response.pathsend", content),
+            ("http.response.zerocopysend", content[10:]),
+        ):
+            writer.write(
+                f"GET /{extension}?{path} HTTP/1.1\r\n".encode()
+                + b"Host: localhost\r\n\r\n"
+            )
+            assert (
+                await read_response(reader) == b"HTTP/1.1 200 OK|" + expected
+            )
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_closes_idle_connection(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"GET /first HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/first:"
+        assert await asyncio.wait_for(reader.read(), timeout=3) == b""
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_times_out_incomplete_headers(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"GET /first HTTP/1.1\r\nHost: local")
+        response = await asyncio.wait_for(reader.read(), timeout=3)
+        assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_large_request_body(port: int) -> None:
+    body = b"x" * (1 << 20)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(
+            b"POST /echo HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n"
+        )
+        writer.write(body)
+        await writer.drain()
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/echo:" + body
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def test_server_streams_large_request_body(port: int) -> None:
+    body_size = len(STREAM_CHUNK) * 128
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(
+            b"POST /upload HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: " + str(body_size).encode() + b"\r\n\r\n"
+        )
+        for _ in range(128):
+            writer.write(STREAM_CHUNK)
+            await writer.drain()
+        status, _, response_body = (await read_response(reader)).partition(
+            b"|"
+        )
+        assert status == b"HTTP/1.1 200 OK"
+        size, max_chunk_size = map(int, response_body.split(b":"))
+        assert size == body_size
+        assert max_chunk_size <= 65536
+        writer.write(b"GET /next HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|/next:"
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+@pytest.fixture(
+    params=[
+        "asyncio",
+        pytest.param(
+            "native",
+            marks=pytest.mark.skipif(
+                not hasattr(favicorn_core, "Server"),
+                reason="favicorn_core is not built",
+            ),
+        ),
+    ]
+)
+async def spooling_port(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[int, None]:
+    builder = ASGIFavicornBuilder(
+        app=app,
+        http_parser_impl="httptools",
+        port=0,
+        transport_impl="buffered",
+        event_bus_impl="direct",
+        keepalive_timeout_s=1,
+        engine=request.param,
+        body_spool_threshold=65536,
+        body_spool_chunk_size=1048576,
+    )
+    server = builder.build()
+    await server.init()
+    await server.start_serving()
+    try:
+        yield builder.inet_provider.acquire().getsockname()[1]
+    finally:
+        await server.close()
+
+
+async def test_server_spools_large_request_body(spooling_port: int) -> None:
+    body_size = len(STREAM_CHUNK) * 64
+    reader, writer = await asyncio.open_connection("127.0.0.1", spooling_port)
+    try:
+        writer.write(
+            b"POST /upload HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: " + str(body_size).encode() + b"\r\n\r\n"
+        )
+        for _ in range(64):
+            writer.write(STREAM_CHUNK)
+            await writer.drain()
+        assert (
+            await read_response(reader)
+            == b"HTTP/1.1 200 OK|" + str(body_size).encode() + b":1048576"
+        )
+        writer.write(
+            b"POST /upload HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+            b"5\r\nhello\r\n5\r\nworld\r\n0\r\n\r\n"
+        )
+        assert await read_response(reader) == b"HTTP/1.1 200 OK|10:10"
+    finally:
+        writer.close()
+        await writer.wait_closed()
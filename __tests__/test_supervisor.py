@@ -0,0 +1,128 @@
+import gc
+import os
+import signal
+import socket
+import time
+
+from favicorn import ASGIFavicornBuilder, Supervisor
+from favicorn.i.server import IServer
+from favicorn.socket_providers import InetSocketProvider
+
+import pytest
+
+
+async def app(scope, receive, send) -> None:  # type: ignore
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Content-Length", b"0")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def request(port: int, timeout: float = 5) -> bytes:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), 1) as sock:
+                sock.sendall(
+                    b"GET / HTTP/1.1\r\n"
+                    b"Host: localhost\r\n"
+                    b"Connection: close\r\n\r\n"
+                )
+                return sock.recv(1024)
+        except ConnectionError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def wait_for_restart(
+    supervisor: Supervisor, pid: int, timeout: float = 5
+) -> None:
+    deadline = time.monotonic() + timeout
+    while pid in supervisor.workers and time.monotonic() < deadline:
+        supervisor.reap_workers()
+        time.sleep(0.05)
+
+
+@pytest.mark.parametrize("reuse_port,port", [(False, 8001), (True, 8002)])
+def test_supervisor_restarts_crashed_worker(
+    reuse_port: bool, port: int
+) -> None:
+    supervisor = ASGIFavicornBuilder(
+        app=app,
+        http_parser_impl="h11",
+        port=port,
+        workers=2,
+        reuse_port=reuse_port,
+    ).build_supervisor()
+    supervisor.start()
+    try:
+        assert len(supervisor.workers) == 2
+        assert request(port).startswith(b"HTTP/1.1 200 OK\r\n")
+        crashed_pid = next(iter(supervisor.workers))
+        os.kill(crashed_pid, signal.SIGKILL)
+        wait_for_restart(supervisor, crashed_pid)
+        assert len(supervisor.workers) == 2
+        assert crashed_pid not in supervisor.workers
+        assert request(port).startswith(b"HTTP/1.1 200 OK\r\n")
+    finally:
+        supervisor.stop()
+        gc.unfreeze()
+    assert supervisor.workers == {}
+
+
+def test_supervisor_backs_off_crashing_worker() -> None:
+    spawned = []
+
+    def server_factory() -> IServer:
+        raise RuntimeError("Worker failed to start")
+
+    class CountingSupervisor(Supervisor):
+        def spawn_worker(self, index: int) -> int:
+            spawned.append(time.monotonic())
+            return super().spawn_worker(index)
+
+    supervisor = CountingSupervisor(
+        server_factory=server_factory,
+        socket_provider=InetSocketProvider("127.0.0.1", 0),
+        workers_count=1,
+        reuse_port=True,
+        restart_backoff_s=0.2,
+    )
+    supervisor.start()
+    try:
+        deadline = time.monotonic() + 1
+        while time.monotonic() < deadline:
+            supervisor.reap_workers()
+            time.sleep(0.01)
+    finally:
+        supervisor.stop()
+        gc.unfreeze()
+    assert 3 <= len(spawned) <= 5
+    assert supervisor.quick_failures[0] >= 3
+    assert spawned[-1] - spawned[-2] >= 0.2
+
+
+def test_supervisor_workers_ignore_sigint() -> None:
+    supervisor = ASGIFavicornBuilder(
+        app=app,
+        http_parser_impl="h11",
+        port=8003,
+        workers=1,
+    ).build_supervisor()
+    supervisor.start()
+    try:
+        assert request(8003).startswith(b"HTTP/1.1 200 OK\r\n")
+        pid = next(iter(supervisor.workers))
+        os.kill(pid, signal.SIGINT)
+        time.sleep(0.2)
+        supervisor.reap_workers()
+        assert pid in supervisor.workers
+        assert request(8003).startswith(b"HTTP/1.1 200 OK\r\n")
+    finally:
+        supervisor.stop()
+        gc.unfreeze()
@@ -0,0 +1,23 @@
+import asyncio
+
+from favicorn.timer_wheel import TimerWheel, get_timer_wheel
+
+
+async def test_timers_fire_after_delay() -> None:
+    timer_wheel = TimerWheel(asyncio.get_running_loop(), resolution=0.05)
+    fired: list[int] = []
+    timer_wheel.schedule(0.2, lambda: fired.append(2))
+    timer_wheel.schedule(0.1, lambda: fired.append(1))
+    cancelled = timer_wheel.schedule(0.1, lambda: fired.append(3))
+    cancelled.cancel()
+    await asyncio.sleep(0.05)
+    assert fired == []
+    await asyncio.sleep(0.3)
+    assert fired == [1, 2]
+    assert timer_wheel.buckets == {}
+    assert timer_wheel.handle is None
+
+
+async def test_timer_wheel_is_shared_per_loop() -> None:
+    assert get_timer_wheel() is get_timer_wheel()
+    assert get_timer_wheel().loop is asyncio.get_running_loop()
@@ -0,0 +1,82 @@
+import asyncio
+import socket
+from typing import Any
+
+from favicorn.write_coalescer import WriteCoalescer
+from favicorn.writer import SocketWriter
+
+import pytest
+
+
+class FakeTransport(asyncio.WriteTransport):
+    def __init__(self, sock: socket.socket | None = None) -> None:
+        super().__init__()
+        self.sock = sock
+        self.calls: list[list[bytes]] = []
+
+    def write(self, data: Any) -> None:
+        self.calls.append([data])
+
+    def writelines(self, list_of_data: Any) -> None:
+        self.calls.append(list(list_of_data))
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return self.sock if name == "socket" else default
+
+
+async def test_writes_of_one_turn_are_coalesced() -> None:
+    transport = FakeTransport()
+    coalescer = WriteCoalescer(transport, cork=False)
+    body = memoryview(b"body")
+    coalescer.write(b"head")
+    coalescer.write(body)
+    coalescer.write(b"")
+    assert transport.calls == []
+    await asyncio.sleep(0)
+    assert transport.calls == [[b"head", body]]
+    assert transport.calls[0][1] is body
+    coalescer.write(b"next")
+    coalescer.uncork()
+    assert transport.calls == [[b"head", body], [b"next"]]
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "TCP_CORK"), reason="TCP_CORK is unavailable"
+)
+async def test_socket_is_corked_for_one_turn() -> None:
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        with socket.create_connection(server.getsockname()) as sock:
+            transport = FakeTransport(sock)
+            coalescer = WriteCoalescer(transport, cork=True)
+            coalescer.write(b"head")
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_CORK)
+            await asyncio.sleep(0)
+            assert transport.calls == [[b"head"]]
+            assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_CORK)
+            coalescer.write(b"body")
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_CORK)
+            coalescer.uncork()
+            assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_CORK)
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "TCP_CORK"), reason="TCP_CORK is unavailable"
+)
+async def test_streamed_chunk_is_not_held_by_cork() -> None:
+    loop = asyncio.get_running_loop()
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        _, writer = await asyncio.open_connection(*server.getsockname())
+        peer, _ = server.accept()
+        peer.setblocking(False)
+        try:
+            socket_writer = SocketWriter(writer, cork=True)
+            socket_writer.write(b"chunk")
+            await socket_writer.drain()
+            data = await asyncio.wait_for(loop.sock_recv(peer, 5), 0.1)
+            assert data == b"chunk"
+        finally:
+            peer.close()
+            await socket_writer.close()
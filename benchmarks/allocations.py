@@ -0,0 +1,145 @@
+"""
+Compares memory allocated per keep-alive request when a controller is
+built for every request against reusing one controller per connection.
+
+    python -m benchmarks.allocations --requests 10000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, BinaryIO, Callable
+
+from benchmarks.apps import empty_app
+
+from favicorn.controllers.asgi import ASGIControllerFactory
+from favicorn.event_buses import DirectEventBusFactory
+from favicorn.i.controller import IController, IControllerFactory
+from favicorn.i.protocols.http.parser import IHTTPParserFactory
+from favicorn.i.protocols.http.protocol import HTTPProtocolFactory
+from favicorn.i.reader import ISocketReader
+from favicorn.i.writer import ISocketWriter
+from favicorn.protocols.http.parsers import (
+    H11HTTPParserFactory,
+    HTTPToolsParserFactory,
+)
+from favicorn.protocols.http.serializers import HTTPBaseSerializerFactory
+
+import h11
+
+import httptools
+
+REQUEST = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+class RequestReader(ISocketReader):
+    async def read(
+        self, timeout: float | None = None, count: int | None = None
+    ) -> bytes | None:
+        return REQUEST
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        return True
+
+
+class NullWriter(ISocketWriter):
+    def write(self, data: bytes) -> None:
+        pass
+
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        pass
+
+    async def drain(self) -> None:
+        pass
+
+    async def flush(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_address(self) -> tuple[str, int] | None:
+        return ("127.0.0.1", 8000)
+
+    async def close(self) -> None:
+        pass
+
+
+async def serve(controller: IController) -> None:
+    await controller.start(client=None)
+    async for _ in controller.get_event_bus():
+        pass
+    await controller.stop()
+
+
+def build_mode(factory: IControllerFactory) -> Callable[[], Awaitable[None]]:
+    reader, writer = RequestReader(), NullWriter()
+
+    async def process_request() -> None:
+        controller = factory.build()
+        controller.get_event_bus().attach(reader, writer)
+        await serve(controller)
+
+    return process_request
+
+
+def reset_mode(factory: IControllerFactory) -> Callable[[], Awaitable[None]]:
+    controller = factory.build()
+    controller.get_event_bus().attach(RequestReader(), NullWriter())
+
+    async def process_request() -> None:
+        controller.reset()
+        await serve(controller)
+
+    return process_request
+
+
+async def measure(
+    process_request: Callable[[], Awaitable[None]], requests: int
+) -> tuple[float, float]:
+    for _ in range(100):
+        await process_request()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await process_request()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    allocated = 0
+    for _ in range(requests):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await process_request()
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return allocated / requests, elapsed / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=10000)
+    args = parser.parse_args()
+    parser_factories: dict[str, IHTTPParserFactory] = {
+        "h11": H11HTTPParserFactory(h11),
+        "httptools": HTTPToolsParserFactory(httptools),
+    }
+    print(
+        f"{'parser':>10} {'mode':>6} {'bytes/request':>14} {'us/request':>11}"
+    )
+    for name, parser_factory in parser_factories.items():
+        factory = ASGIControllerFactory(
+            app=empty_app,
+            event_bus_factory=DirectEventBusFactory(),
+            http_protocol_factory=HTTPProtocolFactory(
+                parser_factory, HTTPBaseSerializerFactory()
+            ),
+        )
+        for mode, make in (("build", build_mode), ("reset", reset_mode)):
+            allocated, latency = await measure(make(factory), args.requests)
+            print(f"{name:>10} {mode:>6} {allocated:>14.0f} {latency:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,9 @@
+async def empty_app(scope, receive, send) -> None:  # type: ignore
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Content-Length", b"0")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -0,0 +1,128 @@
+"""
+Measures server CPU usage while a large number of keep-alive connections
+stay idle, which is dominated by the cost of the read timers.
+
+    python -m benchmarks.idle_connections --connections 50000
+
+The open file limit has to allow two sockets per connection.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import time
+
+from benchmarks.apps import empty_app
+
+from favicorn import ASGIFavicornBuilder
+from favicorn.builders.asgi import Engine, TransportImpl
+
+REQUEST = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+def raise_open_files_limit() -> int:
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def server_main(
+    port: int, transport_impl: TransportImpl, engine: Engine
+) -> None:
+    raise_open_files_limit()
+    builder = ASGIFavicornBuilder(
+        app=empty_app,
+        http_parser_impl="httptools",
+        port=port,
+        transport_impl=transport_impl,
+        keepalive_timeout_s=3600,
+        engine=engine,
+    )
+
+    async def serve() -> None:
+        server = builder.build()
+        await server.init()
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def get_cpu_time(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as file:
+        fields = file.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def open_connection(
+    port: int,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(REQUEST)
+    await reader.readuntil(b"\r\n\r\n")
+    return reader, writer
+
+
+async def wait_for_server(port: int) -> None:
+    for _ in range(100):
+        try:
+            _, writer = await open_connection(port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"Server on port {port} did not start")
+
+
+async def measure(args: argparse.Namespace, pid: int) -> None:
+    await wait_for_server(args.port)
+    connections = []
+    for _ in range(0, args.connections, args.batch):
+        connections += await asyncio.gather(
+            *(open_connection(args.port) for _ in range(args.batch))
+        )
+    await asyncio.sleep(1)
+    cpu_time = get_cpu_time(pid)
+    start = time.monotonic()
+    await asyncio.sleep(args.duration)
+    elapsed = time.monotonic() - start
+    usage = (get_cpu_time(pid) - cpu_time) / elapsed * 100
+    print(
+        f"{args.engine}/{args.transport}: "
+        f"{len(connections)} idle connections, "
+        f"server cpu usage {usage:.2f}%"
+    )
+    for _, writer in connections:
+        writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8060)
+    parser.add_argument("--connections", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument(
+        "--transport", choices=["streams", "buffered"], default="buffered"
+    )
+    parser.add_argument(
+        "--engine", choices=["asyncio", "native"], default="asyncio"
+    )
+    args = parser.parse_args()
+    if raise_open_files_limit() < args.connections + 100:
+        parser.error("open file limit is too low for this many connections")
+    server = multiprocessing.Process(
+        target=server_main, args=(args.port, args.transport, args.engine)
+    )
+    server.start()
+    try:
+        assert server.pid is not None
+        asyncio.run(measure(args, server.pid))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures the cost of moving data between the favicorn_core libuv thread
+and asyncio: round-trip latency of a one byte echo, process CPU usage
+while the core is idle and buffer pool hit rates.
+
+    python -m benchmarks.native_bridge --requests 10000
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from typing import Any
+
+from favicorn.core import NativeCommandType, NativeEventType
+
+import favicorn_core
+
+
+def client_main(
+    address: tuple[str, int], requests: int, latencies: list[float]
+) -> None:
+    with socket.create_connection(address) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for _ in range(requests):
+            start = time.perf_counter()
+            sock.sendall(b"x")
+            sock.recv(1)
+            latencies.append(time.perf_counter() - start)
+
+
+async def echo(server: Any, client: threading.Thread) -> None:
+    events: list[Any] = []
+    while client.is_alive():
+        if not events:
+            try:
+                events = await asyncio.wait_for(server.receive(), 0.1)
+            except asyncio.TimeoutError:
+                continue
+        events = server.exchange_events(
+            [
+                (connection_id, NativeCommandType.WRITE, payload)
+                for connection_id, event_type, payload in events
+                if event_type == NativeEventType.DATA_RECEIVED
+            ]
+        )
+
+
+async def measure_idle_cpu(duration: float) -> float:
+    cpu_time = time.process_time()
+    start = time.monotonic()
+    await asyncio.sleep(duration)
+    return (time.process_time() - cpu_time) / (time.monotonic() - start)
+
+
+def hit_rate(stats: dict[str, int], name: str) -> float:
+    total = stats[f"{name}_hits"] + stats[f"{name}_misses"]
+    return stats[f"{name}_hits"] / max(total, 1) * 100
+
+
+async def main(args: argparse.Namespace) -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        server = favicorn_core.Server(sock.fileno())
+        try:
+            idle_usage = await measure_idle_cpu(args.idle_duration)
+            latencies: list[float] = []
+            client = threading.Thread(
+                target=client_main,
+                args=(sock.getsockname(), args.requests, latencies),
+            )
+            client.start()
+            await echo(server, client)
+            client.join()
+            stats = server.get_stats()
+        finally:
+            server.close()
+    latencies.sort()
+    print(f"idle cpu usage: {idle_usage * 100:.2f}%")
+    print(
+        f"round trip: p50 {statistics.median(latencies) * 1e6:.1f}us, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f}us"
+    )
+    for index, loop_stats in enumerate(stats):
+        print(
+            f"loop {index}: "
+            f"buffer hit rate {hit_rate(loop_stats, 'buffer'):.2f}%, "
+            f"write request hit rate "
+            f"{hit_rate(loop_stats, 'write_request'):.2f}%, "
+            f"{loop_stats['buffer_oversized']} oversized buffers"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--idle-duration", type=float, default=2)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,86 @@
+"""
+Compares request parsing throughput of the http parser implementations:
+a browser-like GET with a dozen headers and a small POST with a body.
+
+    python -m benchmarks.parsers --requests 100000
+"""
+
+import argparse
+import time
+
+from favicorn.i.protocols.http.parser import IHTTPParserFactory
+from favicorn.protocols.http.parsers import (
+    H11HTTPParserFactory,
+    HTTPToolsParserFactory,
+    LLHTTPParserFactory,
+)
+
+import h11
+
+import httptools
+
+try:
+    import favicorn_core
+except ImportError:
+    favicorn_core = None
+
+REQUESTS = {
+    "get": (
+        b"GET /api/v1/users/42?fields=name,email HTTP/1.1\r\n"
+        b"Host: example.com\r\n"
+        b"User-Agent: Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101\r\n"
+        b"Accept: text/html,application/xhtml+xml,application/xml\r\n"
+        b"Accept-Language: en-US,en;q=0.5\r\n"
+        b"Accept-Encoding: gzip, deflate, br\r\n"
+        b"Referer: https://example.com/users\r\n"
+        b"Connection: keep-alive\r\n"
+        b"Cookie: session=8f14e45fceea167a5a36dedd4bea2543\r\n"
+        b"Upgrade-Insecure-Requests: 1\r\n"
+        b"Sec-Fetch-Dest: document\r\n"
+        b"Sec-Fetch-Mode: navigate\r\n"
+        b"Cache-Control: max-age=0\r\n\r\n"
+    ),
+    "post": (
+        b"POST /api/v1/users HTTP/1.1\r\n"
+        b"Host: example.com\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: 38\r\n\r\n"
+        b'{"name": "John", "email": "j@ex.com"}\n'
+    ),
+}
+
+
+def measure(
+    parser_factory: IHTTPParserFactory, request: bytes, count: int
+) -> float:
+    parser = parser_factory.build()
+    start = time.perf_counter()
+    for _ in range(count):
+        parser.feed_data(request)
+        parser.get_metadata()
+        parser.get_body()
+        parser.reset()
+    return time.perf_counter() - start
+
+
+def main(args: argparse.Namespace) -> None:
+    parser_factories: dict[str, IHTTPParserFactory] = {
+        "h11": H11HTTPParserFactory(h11),
+        "httptools": HTTPToolsParserFactory(httptools),
+    }
+    if hasattr(favicorn_core, "RequestParser"):
+        parser_factories["llhttp"] = LLHTTPParserFactory(favicorn_core)
+    for request_name, request in REQUESTS.items():
+        for name, parser_factory in parser_factories.items():
+            elapsed = measure(parser_factory, request, args.requests)
+            print(
+                f"{request_name:>4} {name:>9}: "
+                f"{args.requests / elapsed:,.0f} req/s, "
+                f"{elapsed / args.requests * 1e6:.2f}us per request"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100000)
+    main(parser.parse_args())
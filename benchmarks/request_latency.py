@@ -0,0 +1,103 @@
+"""
+Measures single-connection keep-alive latency for each way of running
+the application: a task per request, an eagerly started task and inline
+in the connection coroutine.
+
+    python -m benchmarks.request_latency --requests 20000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+
+from benchmarks.apps import empty_app
+
+from favicorn import ASGIFavicornBuilder
+from favicorn.builders.asgi import EventBusImpl, RequestExecutionImpl
+
+REQUEST = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+MODES: list[tuple[EventBusImpl, RequestExecutionImpl]] = [
+    ("deque", "task"),
+    ("direct", "task"),
+    ("direct", "eager"),
+    ("direct", "inline"),
+]
+
+
+def server_main(
+    port: int,
+    event_bus_impl: EventBusImpl,
+    request_execution_impl: RequestExecutionImpl,
+) -> None:
+    builder = ASGIFavicornBuilder(
+        app=empty_app,
+        http_parser_impl="httptools",
+        port=port,
+        transport_impl="buffered",
+        event_bus_impl=event_bus_impl,
+        request_execution_impl=request_execution_impl,
+    )
+
+    async def serve() -> None:
+        server = builder.build()
+        await server.init()
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def connect(port: int) -> socket.socket:
+    for _ in range(100):
+        try:
+            sock = socket.create_connection(("127.0.0.1", port))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return sock
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server on port {port} did not start")
+
+
+def measure(port: int, requests: int) -> list[float]:
+    latencies = []
+    with connect(port) as sock:
+        for index in range(requests + 1000):
+            start = time.perf_counter()
+            sock.sendall(REQUEST)
+            response = b""
+            while not response.endswith(b"\r\n\r\n"):
+                response += sock.recv(4096)
+            if index >= 1000:
+                latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8070)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    for event_bus_impl, request_execution_impl in MODES:
+        server = multiprocessing.Process(
+            target=server_main,
+            args=(args.port, event_bus_impl, request_execution_impl),
+        )
+        server.start()
+        try:
+            latencies = sorted(measure(args.port, args.requests))
+        finally:
+            server.terminate()
+            server.join()
+        print(
+            f"{event_bus_impl:>6}/{request_execution_impl:<6}: "
+            f"p50 {statistics.median(latencies) * 1e6:.1f}us, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f}us, "
+            f"{len(latencies) / sum(latencies):,.0f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
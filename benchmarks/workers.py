@@ -0,0 +1,148 @@
+"""
+Measures requests per second of the pre-fork supervisor for a growing
+number of workers and reports how throughput scales per core.
+
+    python benchmarks/workers.py --max-workers 4 --duration 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REQUEST = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+ROOT = Path(__file__).parent.parent
+
+
+def wait_for_port(port: int, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 1).close()
+            return
+        except ConnectionError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server on port {port} did not start")
+
+
+def client_main(
+    port: int,
+    connections: int,
+    duration: float,
+    results: "multiprocessing.Queue[int]",
+) -> None:
+    socks = [
+        socket.create_connection(("127.0.0.1", port))
+        for _ in range(connections)
+    ]
+    completed = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        for sock in socks:
+            sock.sendall(REQUEST)
+        for sock in socks:
+            data = b""
+            while b"\r\n\r\n" not in data:
+                data += sock.recv(65536)
+            completed += 1
+    results.put(completed)
+
+
+def run_python_load(
+    port: int, clients: int, connections: int, duration: float
+) -> float:
+    results: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=client_main, args=(port, connections, duration, results)
+        )
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    total = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total / duration
+
+
+def run_wrk_load(port: int, connections: int, duration: float) -> float:
+    output = subprocess.check_output(
+        [
+            "wrk",
+            f"-c{connections}",
+            f"-d{int(duration)}s",
+            f"-t{os.cpu_count() or 1}",
+            f"http://127.0.0.1:{port}/",
+        ],
+        text=True,
+    )
+    for line in output.splitlines():
+        if line.startswith("Requests/sec:"):
+            return float(line.split()[1])
+    raise ValueError(f"Unexpected wrk output: {output}")
+
+
+def measure(args: argparse.Namespace, workers: int) -> float:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "favicorn",
+            "benchmarks.apps:empty_app",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "WARNING",
+        ]
+        + ["--engine", args.engine, "--native-loops", str(args.native_loops)]
+        + (["--reuse-port"] if args.reuse_port else []),
+        cwd=ROOT,
+    )
+    try:
+        wait_for_port(args.port)
+        if shutil.which("wrk"):
+            return run_wrk_load(args.port, args.connections, args.duration)
+        return run_python_load(
+            args.port, args.clients, args.connections, args.duration
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--reuse-port", action="store_true")
+    parser.add_argument(
+        "--engine", choices=["asyncio", "native"], default="asyncio"
+    )
+    parser.add_argument("--native-loops", type=int, default=1)
+    args = parser.parse_args()
+    baseline = None
+    print(f"{'workers':>8} {'rps':>12} {'rps/worker':>12} {'scaling':>8}")
+    workers = 1
+    while workers <= args.max_workers:
+        rps = measure(args, workers)
+        baseline = baseline or rps
+        print(
+            f"{workers:>8} {rps:>12.0f} {rps / workers:>12.0f} "
+            f"{rps / baseline:>8.2f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
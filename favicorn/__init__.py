@@ -5,6 +5,7 @@ from .connections import (
 )
 from .server import Server as Favicorn
 from .socket_providers import InetSocketProvider, UnixSocketProvider
+from .supervisor import Supervisor
 
 __all__ = (
     "Favicorn",
@@ -13,4 +14,5 @@ __all__ = (
     "TCPConnection",
     "TCPConnectionFactory",
     "ASGIFavicornBuilder",
+    "Supervisor",
 )
@@ -0,0 +1,17 @@
+from .connection_manager import (
+    BufferedConnectionManager,
+    BufferedConnectionManagerFactory,
+)
+from .pool import ReadBufferPool
+from .protocol import BufferedSocketProtocol
+from .reader import BufferedSocketReader
+from .writer import BufferedSocketWriter
+
+__all__ = (
+    "BufferedConnectionManager",
+    "BufferedConnectionManagerFactory",
+    "BufferedSocketProtocol",
+    "BufferedSocketReader",
+    "BufferedSocketWriter",
+    "ReadBufferPool",
+)
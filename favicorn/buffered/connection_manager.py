@@ -0,0 +1,73 @@
+import asyncio
+import socket
+
+from favicorn.i.connection import IConnectionFactory
+from favicorn.i.connection_manager import (
+    IConnectionManager,
+    IConnectionManagerFactory,
+)
+
+from .pool import ReadBufferPool
+from .protocol import BufferedSocketProtocol
+
+
+class BufferedConnectionManager(IConnectionManager):
+    def __init__(
+        self,
+        connection_factory: IConnectionFactory,
+        pool: ReadBufferPool,
+        cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+    ) -> None:
+        self.connection_factory = connection_factory
+        self.pool = pool
+        self.cork = cork
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+
+    def build_protocol(self) -> BufferedSocketProtocol:
+        return BufferedSocketProtocol(
+            connection_factory=self.connection_factory,
+            pool=self.pool,
+            cork=self.cork,
+            write_high_water_mark=self.write_high_water_mark,
+            write_low_water_mark=self.write_low_water_mark,
+        )
+
+    async def create_server(self, sock: socket.socket) -> asyncio.Server:
+        return await asyncio.get_running_loop().create_server(
+            self.build_protocol,
+            sock=sock,
+            start_serving=False,
+        )
+
+
+class BufferedConnectionManagerFactory(IConnectionManagerFactory):
+    def __init__(
+        self,
+        min_read_buffer_size: int = 8192,
+        max_read_buffer_size: int = 262144,
+        cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+    ) -> None:
+        self.min_read_buffer_size = min_read_buffer_size
+        self.max_read_buffer_size = max_read_buffer_size
+        self.cork = cork
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+
+    def build(
+        self, connection_factory: IConnectionFactory
+    ) -> IConnectionManager:
+        return BufferedConnectionManager(
+            connection_factory=connection_factory,
+            pool=ReadBufferPool(
+                min_size=self.min_read_buffer_size,
+                max_size=self.max_read_buffer_size,
+            ),
+            cork=self.cork,
+            write_high_water_mark=self.write_high_water_mark,
+            write_low_water_mark=self.write_low_water_mark,
+        )
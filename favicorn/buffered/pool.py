@@ -0,0 +1,39 @@
+from collections import defaultdict
+
+
+class ReadBufferPool:
+    min_size: int
+    max_size: int
+    max_free_buffers: int
+    free_buffers: defaultdict[int, list[bytearray]]
+
+    def __init__(
+        self,
+        min_size: int = 8192,
+        max_size: int = 262144,
+        max_free_buffers: int = 256,
+    ) -> None:
+        assert min_size & (min_size - 1) == 0, "min_size must be power of 2"
+        assert max_size & (max_size - 1) == 0, "max_size must be power of 2"
+        assert max_size >= min_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_free_buffers = max_free_buffers
+        self.free_buffers = defaultdict(list)
+
+    def get_size_class(self, size: int) -> int:
+        size_class = self.min_size
+        while size_class < size and size_class < self.max_size:
+            size_class <<= 1
+        return size_class
+
+    def acquire(self, size: int) -> bytearray:
+        size_class = self.get_size_class(size)
+        if free := self.free_buffers[size_class]:
+            return free.pop()
+        return bytearray(size_class)
+
+    def release(self, buffer: bytearray) -> None:
+        free = self.free_buffers[len(buffer)]
+        if len(free) < self.max_free_buffers:
+            free.append(buffer)
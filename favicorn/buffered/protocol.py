@@ -0,0 +1,82 @@
+import asyncio
+from typing import cast
+
+from favicorn.i.connection import IConnectionFactory
+from favicorn.timer_wheel import get_timer_wheel
+
+from .pool import ReadBufferPool
+from .reader import BufferedSocketReader
+from .writer import BufferedSocketWriter
+
+
+class BufferedSocketProtocol(asyncio.BufferedProtocol):
+    reader: BufferedSocketReader
+    writer: BufferedSocketWriter
+    task: asyncio.Task[None]
+
+    def __init__(
+        self,
+        connection_factory: IConnectionFactory,
+        pool: ReadBufferPool,
+        cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+    ) -> None:
+        self.connection_factory = connection_factory
+        self.pool = pool
+        self.cork = cork
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.reader = self.build_reader(cast(asyncio.ReadTransport, transport))
+        self.writer = self.build_writer(
+            cast(asyncio.WriteTransport, transport)
+        )
+        self.task = asyncio.get_running_loop().create_task(self.main())
+
+    def build_reader(
+        self, transport: asyncio.ReadTransport
+    ) -> BufferedSocketReader:
+        return BufferedSocketReader(transport, self.pool, get_timer_wheel())
+
+    def build_writer(
+        self, transport: asyncio.WriteTransport
+    ) -> BufferedSocketWriter:
+        return BufferedSocketWriter(
+            transport,
+            cork=self.cork,
+            high_water_mark=self.write_high_water_mark,
+            low_water_mark=self.write_low_water_mark,
+        )
+
+    async def main(self) -> None:
+        connection = self.connection_factory.build(
+            reader=self.reader,
+            writer=self.writer,
+        )
+        try:
+            await connection.main()
+        finally:
+            await connection.close()
+            self.reader.dispose()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.reader.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.reader.buffer_updated(nbytes)
+
+    def eof_received(self) -> bool:
+        self.reader.feed_eof()
+        return True
+
+    def pause_writing(self) -> None:
+        self.writer.pause_writing()
+
+    def resume_writing(self) -> None:
+        self.writer.resume_writing()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.reader.feed_eof()
+        self.writer.connection_lost()
@@ -0,0 +1,156 @@
+import asyncio
+
+from favicorn.i.reader import ISocketReader, ReadData
+from favicorn.timer_wheel import TimerWheel
+
+from .pool import ReadBufferPool
+
+
+class BufferedSocketReader(ISocketReader):
+    transport: asyncio.ReadTransport
+    pool: ReadBufferPool
+    buffer: bytearray
+    view: memoryview
+    start: int
+    end: int
+    waiter: asyncio.Future[None] | None
+
+    shrink_after_cycles = 16
+
+    def __init__(
+        self,
+        transport: asyncio.ReadTransport,
+        pool: ReadBufferPool,
+        timer_wheel: TimerWheel,
+    ) -> None:
+        self.transport = transport
+        self.pool = pool
+        self.timer_wheel = timer_wheel
+        self.set_buffer(pool.acquire(pool.min_size))
+        self.eof = False
+        self.paused = False
+        self.released = True
+        self.waiter = None
+        self.max_unread = 0
+        self.idle_cycles_count = 0
+
+    def set_buffer(self, buffer: bytearray) -> None:
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.start = 0
+        self.end = 0
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self.end == len(self.buffer):
+            self.make_room()
+        return self.view[self.end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.end += nbytes
+        if self.end - self.start > self.max_unread:
+            self.max_unread = self.end - self.start
+        if self.end == len(self.buffer) and not self.can_make_room():
+            self.paused = True
+            self.transport.pause_reading()
+        self.wakeup()
+
+    def feed_eof(self) -> None:
+        self.eof = True
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def can_make_room(self) -> bool:
+        capacity = len(self.buffer)
+        return (
+            self.end < capacity
+            or (self.released and self.start > 0)
+            or capacity < self.pool.max_size
+        )
+
+    def make_room(self) -> None:
+        capacity = len(self.buffer)
+        unread = self.end - self.start
+        if (
+            self.released
+            and self.start > 0
+            and (unread * 2 <= capacity or capacity >= self.pool.max_size)
+        ):
+            if not self.shrink_if_idle():
+                self.buffer[:unread] = self.view[
+                    self.start : self.end
+                ].tobytes()
+                self.start = 0
+                self.end = unread
+            return
+        self.replace_buffer(self.pool.acquire(capacity * 2))
+
+    def replace_buffer(self, buffer: bytearray) -> None:
+        unread = self.end - self.start
+        buffer[:unread] = self.view[self.start : self.end]
+        old_buffer = self.buffer
+        self.set_buffer(buffer)
+        self.end = unread
+        if self.released:
+            self.pool.release(old_buffer)
+
+    def release(self) -> None:
+        self.released = True
+        if self.start == self.end and not self.shrink_if_idle():
+            self.start = self.end = 0
+        if self.paused and self.can_make_room():
+            self.paused = False
+            self.transport.resume_reading()
+
+    def shrink_if_idle(self) -> bool:
+        capacity = len(self.buffer)
+        max_unread, self.max_unread = self.max_unread, 0
+        if capacity == self.pool.min_size:
+            return False
+        if max_unread * 4 >= capacity:
+            self.idle_cycles_count = 0
+            return False
+        self.idle_cycles_count += 1
+        if self.idle_cycles_count < self.shrink_after_cycles:
+            return False
+        self.idle_cycles_count = 0
+        self.replace_buffer(self.pool.acquire(capacity // 2))
+        return True
+
+    async def wait_for_data(self, timeout: float | None) -> None:
+        self.waiter = asyncio.get_running_loop().create_future()
+        timer = None
+        if timeout is not None:
+            timer = self.timer_wheel.schedule(timeout, self.wakeup)
+        try:
+            await self.waiter
+        finally:
+            self.waiter = None
+            if timer is not None:
+                timer.cancel()
+
+    async def read(
+        self, timeout: float | None = None, count: int | None = None
+    ) -> ReadData | None:
+        self.release()
+        if self.start == self.end and not self.eof:
+            await self.wait_for_data(timeout)
+        if self.start == self.end:
+            return None
+        end = self.end if count is None else min(self.end, self.start + count)
+        data = self.view[self.start : end]
+        self.start = end
+        self.released = False
+        return data
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        self.release()
+        if self.start == self.end and not self.eof:
+            await self.wait_for_data(timeout)
+        return self.start != self.end
+
+    def dispose(self) -> None:
+        self.view.release()
+        self.pool.release(self.buffer)
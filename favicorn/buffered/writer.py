@@ -0,0 +1,86 @@
+import asyncio
+from typing import BinaryIO
+
+from favicorn.i.writer import ISocketWriter
+from favicorn.write_coalescer import WriteCoalescer
+
+
+class BufferedSocketWriter(ISocketWriter):
+    transport: asyncio.WriteTransport
+    coalescer: WriteCoalescer
+    drain_waiter: asyncio.Future[None] | None
+    closed: asyncio.Future[None]
+
+    def __init__(
+        self,
+        transport: asyncio.WriteTransport,
+        cork: bool = False,
+        high_water_mark: int = 65536,
+        low_water_mark: int = 16384,
+    ) -> None:
+        self.transport = transport
+        transport.set_write_buffer_limits(
+            high=high_water_mark, low=low_water_mark
+        )
+        self.coalescer = WriteCoalescer(
+            transport, cork, max_pending_size=high_water_mark
+        )
+        self.paused = False
+        self.drain_waiter = None
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def write(self, data: bytes) -> None:
+        self.coalescer.write(data)
+
+    async def flush(self) -> None:
+        self.coalescer.uncork()
+        await self.drain()
+
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        self.coalescer.uncork()
+        if not self.transport.is_closing():
+            await asyncio.get_running_loop().sendfile(
+                self.transport, file, offset, count
+            )
+
+    async def drain(self) -> None:
+        if not self.paused or self.transport.is_closing():
+            return
+        self.coalescer.uncork()
+        self.drain_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.drain_waiter
+        finally:
+            self.drain_waiter = None
+
+    def pause_writing(self) -> None:
+        self.paused = True
+
+    def resume_writing(self) -> None:
+        self.paused = False
+        if self.drain_waiter is not None and not self.drain_waiter.done():
+            self.drain_waiter.set_result(None)
+
+    def connection_lost(self) -> None:
+        self.resume_writing()
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    def is_closing(self) -> bool:
+        return self.transport.is_closing()
+
+    def get_address(self) -> tuple[str, int] | None:
+        if info := self.transport.get_extra_info("peername"):
+            return (str(info[0]), int(info[1]))
+        return None
+
+    async def close(self) -> None:
+        self.coalescer.flush()
+        if self.transport.is_closing():
+            return
+        if self.transport.can_write_eof():
+            self.transport.write_eof()
+        self.transport.close()
+        await self.closed
@@ -18,34 +18,61 @@ try:
 except ImportError:
     wsproto = None  # type: ignore [assignment]
 
+try:
+    import favicorn_core
+except ImportError:
+    favicorn_core = None
+
+from ..buffered import BufferedConnectionManagerFactory
+from ..connection_manager import ConnectionManagerFactory
 from ..connections import TCPConnectionFactory
 from ..controllers.asgi import ASGIControllerFactory
-from ..event_buses import DequeEventBusFactory
+from ..core import NativeServer
+from ..event_buses import DequeEventBusFactory, DirectEventBusFactory
 from ..i.builder import IBuilder
+from ..i.connection_manager import IConnectionManagerFactory
+from ..i.event_bus import IEventBusFactory
 from ..i.protocols.http.parser import IHTTPParserFactory
 from ..i.protocols.http.protocol import HTTPProtocolFactory
+from ..i.protocols.http.serializer import IHTTPSerializerFactory
 from ..i.protocols.websocket.protocol import WebsocketProtocolFactory
 from ..i.server import IServer
 from ..protocols.http.parsers import (
     H11HTTPParserFactory,
     HTTPToolsParserFactory,
+    LLHTTPParserFactory,
+)
+from ..protocols.http.serializers import (
+    HTTPBaseSerializerFactory,
+    HTTPNativeSerializerFactory,
+    HTTPPrecompiledSerializerFactory,
 )
-from ..protocols.http.serializers import HTTPBaseSerializerFactory
 from ..protocols.websocket.parsers import WSProtoWebsocketParserFactory
 from ..protocols.websocket.serializers import (
     WSProtoWebsocketSerializerFactory,
 )
 from ..server import Server
 from ..socket_providers import InetSocketProvider
+from ..supervisor import Supervisor
 
 
-HTTPParserImpl = Literal["httptools"] | Literal["h11"]
+HTTPParserImpl = Literal["httptools"] | Literal["h11"] | Literal["llhttp"]
 WSImpl = Literal["wsproto"]
+TransportImpl = Literal["streams"] | Literal["buffered"]
+EventBusImpl = Literal["deque"] | Literal["direct"]
+HTTPSerializerImpl = (
+    Literal["base"] | Literal["precompiled"] | Literal["native"]
+)
+Engine = Literal["asyncio"] | Literal["native"]
+RequestExecutionImpl = Literal["task"] | Literal["eager"] | Literal["inline"]
 
 
 class ASGIServerBuilder(IBuilder):
     ws_protocol: WebsocketProtocolFactory | None
     h_parser_factory: IHTTPParserFactory
+    connection_manager_factory: IConnectionManagerFactory
+    event_bus_factory: IEventBusFactory
+    h_serializer_factory: IHTTPSerializerFactory
 
     def __init__(
         self,
@@ -54,15 +81,85 @@ class ASGIServerBuilder(IBuilder):
         host: str = "127.0.0.1",
         port: int = 8000,
         ws_impl: WSImpl | None = None,
+        workers: int = 1,
+        reuse_port: bool = False,
+        transport_impl: TransportImpl = "streams",
+        tcp_cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+        event_bus_impl: EventBusImpl = "deque",
+        http_serializer_impl: HTTPSerializerImpl = "base",
+        keepalive_timeout_s: float = 5,
+        header_read_timeout_s: float | None = None,
+        body_read_timeout_s: float | None = None,
+        body_buffer_size: int = 65536,
+        body_spool_threshold: int | None = None,
+        body_spool_chunk_size: int = 1048576,
+        max_body_size: int | None = None,
+        engine: Engine = "asyncio",
+        native_loops_count: int = 1,
+        root_path: str = "",
+        request_execution_impl: RequestExecutionImpl = "inline",
     ) -> None:
         self.app = app
+        self.server = (host, port)
+        self.root_path = root_path
+        self.workers = workers
+        self.reuse_port = reuse_port
+        self.keepalive_timeout_s = keepalive_timeout_s
+        self.header_read_timeout_s = header_read_timeout_s
+        self.body_read_timeout_s = body_read_timeout_s
+        self.body_buffer_size = body_buffer_size
+        self.body_spool_threshold = body_spool_threshold
+        self.body_spool_chunk_size = body_spool_chunk_size
+        self.max_body_size = max_body_size
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
         self.inet_provider = InetSocketProvider(
             host=host,
             port=port,
             reuse_address=True,
+            reuse_port=reuse_port or native_loops_count > 1,
         )
         self.init_http_parser(http_parser_impl)
         self.init_ws_protocol(ws_impl)
+        self.init_transport(
+            transport_impl,
+            cork=tcp_cork,
+            write_high_water_mark=write_high_water_mark,
+            write_low_water_mark=write_low_water_mark,
+        )
+        self.init_event_bus(event_bus_impl, write_high_water_mark)
+        self.init_http_serializer(http_serializer_impl)
+        self.init_engine(engine)
+        self.init_request_execution(request_execution_impl)
+        self.native_loops_count = native_loops_count
+
+    def init_engine(self, engine: Engine) -> None:
+        match engine:
+            case "asyncio":
+                pass
+            case "native":
+                assert hasattr(
+                    favicorn_core, "Server"
+                ), "favicorn_core is not built"
+            case _:
+                raise ValueError(f"{engine} engine is unknown")
+        self.engine = engine
+
+    def init_request_execution(self, impl: RequestExecutionImpl) -> None:
+        match impl:
+            case "task":
+                self.eager_start = False
+                self.inline_requests = False
+            case "eager":
+                self.eager_start = True
+                self.inline_requests = False
+            case "inline":
+                self.eager_start = True
+                self.inline_requests = True
+            case _:
+                raise ValueError(f"{impl} request execution is unknown")
 
     def init_http_parser(self, impl: HTTPParserImpl) -> None:
         match impl:
@@ -72,11 +169,34 @@ class ASGIServerBuilder(IBuilder):
             case "h11":
                 assert h11 is not None, "h11 is not installed"
                 self.h_parser_factory = H11HTTPParserFactory(h11)
+            case "llhttp":
+                assert hasattr(
+                    favicorn_core, "RequestParser"
+                ), "favicorn_core is not built"
+                self.h_parser_factory = LLHTTPParserFactory(favicorn_core)
             case _:
                 raise ValueError(
                     f"{impl} http parser implementation is unknown"
                 )
 
+    def init_http_serializer(self, impl: HTTPSerializerImpl) -> None:
+        match impl:
+            case "base":
+                self.h_serializer_factory = HTTPBaseSerializerFactory()
+            case "precompiled":
+                self.h_serializer_factory = HTTPPrecompiledSerializerFactory()
+            case "native":
+                assert hasattr(
+                    favicorn_core, "ResponseSerializer"
+                ), "favicorn_core is not built"
+                self.h_serializer_factory = HTTPNativeSerializerFactory(
+                    favicorn_core
+                )
+            case _:
+                raise ValueError(
+                    f"{impl} http serializer implementation is unknown"
+                )
+
     def init_ws_protocol(self, impl: WSImpl | None) -> None:
         if impl is None:
             self.ws_protocol = None
@@ -93,18 +213,90 @@ class ASGIServerBuilder(IBuilder):
                     f"{impl} websocket protocol implementation is unknown"
                 )
 
+    def init_transport(
+        self,
+        impl: TransportImpl,
+        cork: bool,
+        write_high_water_mark: int,
+        write_low_water_mark: int,
+    ) -> None:
+        match impl:
+            case "streams":
+                self.connection_manager_factory = ConnectionManagerFactory(
+                    cork=cork,
+                    write_high_water_mark=write_high_water_mark,
+                    write_low_water_mark=write_low_water_mark,
+                )
+            case "buffered":
+                self.connection_manager_factory = (
+                    BufferedConnectionManagerFactory(
+                        cork=cork,
+                        write_high_water_mark=write_high_water_mark,
+                        write_low_water_mark=write_low_water_mark,
+                    )
+                )
+            case _:
+                raise ValueError(f"{impl} transport implementation is unknown")
+
+    def init_event_bus(
+        self, impl: EventBusImpl, write_high_water_mark: int
+    ) -> None:
+        match impl:
+            case "deque":
+                self.event_bus_factory = DequeEventBusFactory(
+                    max_queued_size=write_high_water_mark
+                )
+            case "direct":
+                self.event_bus_factory = DirectEventBusFactory(
+                    max_queued_size=write_high_water_mark
+                )
+            case _:
+                raise ValueError(f"{impl} event bus implementation is unknown")
+
     def build(self) -> IServer:
-        return Server(
-            connection_factory=TCPConnectionFactory(
-                controller_factory=ASGIControllerFactory(
-                    app=self.app,
-                    event_bus_factory=DequeEventBusFactory(),
-                    http_protocol_factory=HTTPProtocolFactory(
-                        self.h_parser_factory,
-                        HTTPBaseSerializerFactory(),
-                    ),
-                    websocket_protocol_factory=self.ws_protocol,
+        connection_factory = TCPConnectionFactory(
+            controller_factory=ASGIControllerFactory(
+                app=self.app,
+                event_bus_factory=self.event_bus_factory,
+                http_protocol_factory=HTTPProtocolFactory(
+                    self.h_parser_factory,
+                    self.h_serializer_factory,
                 ),
+                websocket_protocol_factory=self.ws_protocol,
+                header_read_timeout_s=self.header_read_timeout_s,
+                body_read_timeout_s=self.body_read_timeout_s,
+                server=self.server,
+                root_path=self.root_path,
+                eager_start=self.eager_start,
+                body_buffer_size=self.body_buffer_size,
+                body_spool_threshold=self.body_spool_threshold,
+                body_spool_chunk_size=self.body_spool_chunk_size,
+                max_body_size=self.max_body_size,
             ),
+            keepalive_timeout_s=self.keepalive_timeout_s,
+            inline_requests=self.inline_requests,
+        )
+        match self.engine:
+            case "native":
+                return NativeServer(
+                    favicorn_core=favicorn_core,
+                    socket_provider=self.inet_provider,
+                    connection_factory=connection_factory,
+                    loops_count=self.native_loops_count,
+                    write_high_water_mark=self.write_high_water_mark,
+                    write_low_water_mark=self.write_low_water_mark,
+                )
+            case _:
+                return Server(
+                    connection_factory=connection_factory,
+                    socket_provider=self.inet_provider,
+                    connection_manager_factory=self.connection_manager_factory,
+                )
+
+    def build_supervisor(self) -> Supervisor:
+        return Supervisor(
+            server_factory=self.build,
             socket_provider=self.inet_provider,
+            workers_count=self.workers,
+            reuse_port=self.reuse_port,
         )
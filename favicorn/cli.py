@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import logging
+import sys
+from typing import Sequence, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from asgiref.typing import ASGI3Application
+
+from .builders import ASGIServerBuilder
+from .builders.asgi import Engine, HTTPParserImpl, WSImpl
+from .supervisor import serve
+
+
+def import_app(path: str) -> "ASGI3Application":
+    module_name, _, attrs = path.partition(":")
+    if not module_name or not attrs:
+        raise ValueError(f'App path "{path}" must be in format module:app')
+    app = importlib.import_module(module_name)
+    for attr in attrs.split("."):
+        app = getattr(app, attr)
+    return cast("ASGI3Application", app)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="favicorn")
+    parser.add_argument("app", help="ASGI application in format module:app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--http-parser",
+        choices=["httptools", "h11", "llhttp"],
+        default=(
+            "httptools" if importlib.util.find_spec("httptools") else "h11"
+        ),
+    )
+    parser.add_argument("--ws", choices=["wsproto"], default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--reuse-port",
+        action="store_true",
+        help="Open SO_REUSEPORT socket in every worker "
+        "instead of sharing the inherited one",
+    )
+    parser.add_argument(
+        "--engine", choices=["asyncio", "native"], default="asyncio"
+    )
+    parser.add_argument(
+        "--native-loops",
+        type=int,
+        default=1,
+        help="Number of libuv loop threads used by the native engine",
+    )
+    parser.add_argument(
+        "--root-path",
+        default="",
+        help="ASGI root_path of the application when mounted under a prefix",
+    )
+    parser.add_argument(
+        "--body-spool-threshold",
+        type=int,
+        default=None,
+        help="Spool request bodies larger than this many bytes "
+        "to a temporary file",
+    )
+    parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=None,
+        help="Answer 413 to requests with larger bodies",
+    )
+    parser.add_argument("--log-level", default="INFO")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="[%(asctime)s][%(process)d][%(levelname)s] %(message)s",
+    )
+    sys.path.insert(0, ".")
+    builder = ASGIServerBuilder(
+        app=import_app(args.app),
+        http_parser_impl=cast(HTTPParserImpl, args.http_parser),
+        host=args.host,
+        port=args.port,
+        ws_impl=cast(WSImpl | None, args.ws),
+        workers=args.workers,
+        reuse_port=args.reuse_port,
+        engine=cast(Engine, args.engine),
+        native_loops_count=args.native_loops,
+        root_path=args.root_path,
+        body_spool_threshold=args.body_spool_threshold,
+        max_body_size=args.max_body_size,
+    )
+    if args.workers == 1 and not args.reuse_port:
+        try:
+            asyncio.run(serve(builder.build()))
+        except KeyboardInterrupt:
+            pass
+        return
+    builder.build_supervisor().run()
@@ -1,16 +1,35 @@
 import asyncio
+import socket
 
 from .i.connection import IConnectionFactory
+from .i.connection_manager import (
+    IConnectionManager,
+    IConnectionManagerFactory,
+)
 from .reader import SocketReader
+from .timer_wheel import get_timer_wheel
 from .writer import SocketWriter
 
 
-class ConnectionManager:
+class ConnectionManager(IConnectionManager):
     def __init__(
         self,
         connection_factory: IConnectionFactory,
+        cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
     ) -> None:
         self.connection_factory = connection_factory
+        self.cork = cork
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+
+    async def create_server(self, sock: socket.socket) -> asyncio.Server:
+        return await asyncio.start_server(
+            self.handler,
+            sock=sock,
+            start_serving=False,
+        )
 
     async def handler(
         self,
@@ -19,11 +38,40 @@ class ConnectionManager:
     ) -> None:
         connection = self.connection_factory.build(
             reader=SocketReader(
-                stream_reader=stream_reader, default_read_count=4028
+                stream_reader=stream_reader,
+                default_read_count=4028,
+                timer_wheel=get_timer_wheel(),
+            ),
+            writer=SocketWriter(
+                stream_writer=stream_writer,
+                cork=self.cork,
+                high_water_mark=self.write_high_water_mark,
+                low_water_mark=self.write_low_water_mark,
             ),
-            writer=SocketWriter(stream_writer=stream_writer),
         )
         try:
             await connection.main()
         finally:
             await connection.close()
+
+
+class ConnectionManagerFactory(IConnectionManagerFactory):
+    def __init__(
+        self,
+        cork: bool = False,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+    ) -> None:
+        self.cork = cork
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+
+    def build(
+        self, connection_factory: IConnectionFactory
+    ) -> IConnectionManager:
+        return ConnectionManager(
+            connection_factory,
+            cork=self.cork,
+            write_high_water_mark=self.write_high_water_mark,
+            write_low_water_mark=self.write_low_water_mark,
+        )
@@ -1,39 +1,59 @@
 from favicorn.i.connection import IConnection, IConnectionFactory
-from favicorn.i.controller import IControllerFactory
+from favicorn.i.controller import IController, IControllerFactory
 from favicorn.i.event_bus import (
     ControllerReceiveEvent,
     ControllerSendEvent,
     IEventBus,
 )
-from favicorn.reader import SocketReader
-from favicorn.writer import SocketWriter
+from favicorn.i.reader import ISocketReader
+from favicorn.i.writer import ISocketWriter
 
 
 class TCPConnection(IConnection):
+    controller: IController | None
+
     def __init__(
         self,
-        reader: SocketReader,
-        writer: SocketWriter,
+        reader: ISocketReader,
+        writer: ISocketWriter,
         controller_factory: IControllerFactory,
         keepalive_timeout_s: float,
+        inline_requests: bool = False,
     ) -> None:
         self.reader = reader
         self.writer = writer
         self.keepalive = True
+        self.controller = None
         self.client = writer.get_address()
         self.controller_factory = controller_factory
         self.keepalive_timeout_s = keepalive_timeout_s
+        self.inline_requests = inline_requests
+        self.inline = False
 
     async def main(self) -> None:
         while (
             not self.writer.is_closing()
             and self.keepalive
-            and await self.reader.wait(timeout=self.keepalive_timeout_s)
+            and await self.wait_for_request()
         ):
             await self.process_request()
 
+    async def wait_for_request(self) -> bool:
+        if self.controller is not None:
+            self.controller.reset()
+            if self.controller.has_buffered_data():
+                return True
+        return await self.reader.wait(timeout=self.keepalive_timeout_s)
+
     async def process_request(self) -> None:
-        controller = self.controller_factory.build()
+        controller = self.get_controller()
+        if self.inline:
+            try:
+                await controller.run(client=self.client)
+                self.keepalive = controller.is_keepalive()
+            finally:
+                await self.writer.flush()
+            return
         event_bus = controller.get_event_bus()
         await controller.start(client=self.client)
         try:
@@ -43,6 +63,15 @@ class TCPConnection(IConnection):
             await controller.stop()
             await self.writer.flush()
 
+    def get_controller(self) -> IController:
+        if self.controller is None:
+            self.controller = self.controller_factory.build()
+            attached = self.controller.get_event_bus().attach(
+                self.reader, self.writer
+            )
+            self.inline = self.inline_requests and attached
+        return self.controller
+
     async def process_controller_events(self, event_bus: IEventBus) -> None:
         async for event in event_bus:
             if isinstance(event, ControllerReceiveEvent):
@@ -53,6 +82,7 @@ class TCPConnection(IConnection):
                 )
             elif isinstance(event, ControllerSendEvent):
                 self.writer.write(event.data)
+                await self.writer.drain()
             else:
                 raise ValueError(f"Unhandled event type {type(event)}")
 
@@ -65,18 +95,21 @@ class TCPConnectionFactory(IConnectionFactory):
         self,
         controller_factory: IControllerFactory,
         keepalive_timeout_s: float = 5,
+        inline_requests: bool = False,
     ) -> None:
         self.controller_factory = controller_factory
         self.keepalive_timeout_s = keepalive_timeout_s
+        self.inline_requests = inline_requests
 
     def build(
         self,
-        reader: SocketReader,
-        writer: SocketWriter,
+        reader: ISocketReader,
+        writer: ISocketWriter,
     ) -> IConnection:
         return TCPConnection(
             reader=reader,
             writer=writer,
             controller_factory=self.controller_factory,
             keepalive_timeout_s=self.keepalive_timeout_s,
+            inline_requests=self.inline_requests,
         )
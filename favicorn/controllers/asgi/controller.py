@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+import sys
+from typing import Coroutine, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from asgiref.typing import ASGI3Application
@@ -15,6 +16,16 @@ from favicorn.i.protocols.http.request_metadata import RequestMetadata
 from favicorn.i.protocols.websocket.protocol import WebsocketProtocol
 
 from .event_manager import ASGIEventManager
+from .scope_builder import ASGIScopeBuilder
+
+
+def is_cancelling() -> bool:
+    task = asyncio.current_task()
+    return (
+        task is not None
+        and hasattr(task, "cancelling")
+        and task.cancelling() > 0
+    )
 
 
 class ASGIController(IController):
@@ -31,8 +42,19 @@ class ASGIController(IController):
         logger: logging.Logger,
         http_protocol: HTTPProtocol,
         websocket_protocol: WebsocketProtocol | None,
+        header_read_timeout_s: float | None = None,
+        body_read_timeout_s: float | None = None,
+        scope_builder: ASGIScopeBuilder | None = None,
+        eager_start: bool = False,
+        body_buffer_size: int = 65536,
+        body_spool_threshold: int | None = None,
+        body_spool_chunk_size: int = 1048576,
+        max_body_size: int | None = None,
     ) -> None:
         self.task = None
+        self.eager_start = eager_start
+        self.body_buffer_size = body_buffer_size
+        self.header_read_timeout_s = header_read_timeout_s
         self.logger = logger
         self.event_bus = event_bus
         self.http_parser = http_protocol.parser
@@ -42,10 +64,30 @@ class ASGIController(IController):
             event_bus=event_bus,
             http_protocol=http_protocol,
             websocket_protocol=websocket_protocol,
+            body_read_timeout_s=body_read_timeout_s,
+            scope_builder=scope_builder,
+            body_buffer_size=body_buffer_size,
+            body_spool_threshold=body_spool_threshold,
+            body_spool_chunk_size=body_spool_chunk_size,
+            max_body_size=max_body_size,
         )
 
     async def start(self, client: tuple[str, int] | None) -> None:
-        self.task = asyncio.create_task(self.main(client))
+        self.task = self.create_task(self.main(client))
+
+    def create_task(
+        self, coro: Coroutine[None, None, None]
+    ) -> asyncio.Task[None]:
+        if sys.version_info >= (3, 12) and self.eager_start:
+            return asyncio.Task(
+                coro, loop=asyncio.get_running_loop(), eager_start=True
+            )
+        return asyncio.create_task(coro)
+
+    async def run(self, client: tuple[str, int] | None) -> None:
+        await self.main(client)
+        if self.event_manager.is_app_cancelled() or is_cancelling():
+            raise asyncio.CancelledError()
 
     async def main(self, client: tuple[str, int] | None) -> None:
         await self.event_manager.launch_app(
@@ -55,8 +97,17 @@ class ASGIController(IController):
         self.event_bus.close()
 
     async def wait_for_metadata(self) -> RequestMetadata | None:
+        loop = asyncio.get_running_loop()
+        deadline = None
+        if self.header_read_timeout_s is not None:
+            deadline = loop.time() + self.header_read_timeout_s
         while not self.http_parser.is_metadata_ready():
-            data = await self.event_bus.receive()
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - loop.time(), 0)
+            data = await self.event_bus.receive(
+                count=self.body_buffer_size, timeout=timeout
+            )
             if data is None:
                 return None
             self.http_parser.feed_data(data)
@@ -74,6 +125,15 @@ class ASGIController(IController):
         except asyncio.CancelledError:
             pass
 
+    def reset(self) -> None:
+        self.task = None
+        self.event_bus.reset()
+        self.http_parser.reset()
+        self.event_manager.reset()
+
+    def has_buffered_data(self) -> bool:
+        return self.http_parser.has_buffered_data()
+
     def get_event_bus(self) -> IEventBus:
         return self.event_bus
 
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, cast
+import tempfile
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    IO,
+    NoReturn,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     from asgiref.typing import (
@@ -12,6 +23,7 @@ if TYPE_CHECKING:
         HTTPResponseStartEvent,
         HTTPResponseTrailersEvent,
         WebSocketAcceptEvent,
+        WebSocketCloseEvent,
         WebSocketSendEvent,
         Scope,
     )
@@ -25,15 +37,38 @@ from favicorn.i.protocols.websocket.protocol import WebsocketProtocol
 from .responses import (
     PredefinedResponse,
     RESPONSE_400,
+    RESPONSE_413,
     RESPONSE_500,
     RESPONSE_WEBSOCKETS_IS_NOT_SUPPORTED,
 )
 from .scope_builder import ASGIScopeBuilder
 
 
+STATE_COMPLETED = 0
+STATE_HTTP_RESPONSE_START = 1
+STATE_HTTP_RESPONSE_TRAILERS = 2
+STATE_HTTP_RESPONSE_BODY = 3
+STATE_WEBSOCKET_HANDSHAKE = 4
+STATE_WEBSOCKET_CONNECTED = 5
+
+SendHandler = Callable[["ASGIEventManager", Any], Awaitable[None]]
+T = TypeVar("T")
+
+
+class RequestBodyTooLarge(Exception):
+    pass
+
+
+def open_for_sendfile(path: str) -> BinaryIO:
+    return open(path, "rb")
+
+
 class ASGIEventManager:
-    expected_events: list[str]
+    state: int
+    body_spool: IO[bytes] | None
+    body_spool_io: asyncio.Future[Any] | None
     _scope: "Scope" | None
+    _metadata: RequestMetadata | None
 
     def __init__(
         self,
@@ -42,22 +77,56 @@ class ASGIEventManager:
         logger: logging.Logger,
         http_protocol: HTTPProtocol,
         websocket_protocol: WebsocketProtocol | None,
+        body_read_timeout_s: float | None = None,
+        scope_builder: ASGIScopeBuilder | None = None,
+        body_buffer_size: int = 65536,
+        body_spool_threshold: int | None = None,
+        body_spool_chunk_size: int = 1048576,
+        max_body_size: int | None = None,
     ) -> None:
         self.app = app
+        self.body_read_timeout_s = body_read_timeout_s
+        self.body_buffer_size = body_buffer_size
+        self.body_spool_threshold = body_spool_threshold
+        self.body_spool_chunk_size = body_spool_chunk_size
+        self.max_body_size = max_body_size
+        self.body_spool = None
+        self.body_spool_io = None
+        self.body_spooled = False
+        self.body_size = 0
         self._scope = None
+        self._metadata = None
         self.logger = logger
-        self.expected_events = []
+        self.state = STATE_COMPLETED
+        self.is_websocket_scope = False
         self._is_keepalive = False
+        self.app_cancelled = False
         self.event_bus = event_bus
         self.http = http_protocol
         self._websocket = websocket_protocol
-        self.scope_builder = ASGIScopeBuilder()
+        self.scope_builder = scope_builder or ASGIScopeBuilder()
+
+    def reset(self) -> None:
+        self.close_body_spool()
+        self.body_spooled = False
+        self.body_size = 0
+        self._scope = None
+        self._metadata = None
+        self.state = STATE_COMPLETED
+        self.is_websocket_scope = False
+        self._is_keepalive = False
+        self.app_cancelled = False
 
     @property
     def scope(self) -> "Scope":
         assert self._scope is not None
         return self._scope
 
+    @property
+    def metadata(self) -> RequestMetadata:
+        assert self._metadata is not None
+        return self._metadata
+
     @property
     def websocket(self) -> WebsocketProtocol:
         assert self._websocket is not None
@@ -69,34 +138,57 @@ class ASGIEventManager:
         if metadata is None:
             self.send_predefined_response(RESPONSE_400)
             return
+        self._metadata = metadata
         self._is_keepalive = metadata.is_keepalive()
         self._scope = self.scope_builder.build(metadata, client)
-        if self.scope["type"] == "http":
-            self.expected_events = ["http.response.start"]
-        if self.scope["type"] == "websocket":
+        if self._scope["type"] == "websocket":
             if self._websocket is None:
                 self.send_predefined_response(
                     RESPONSE_WEBSOCKETS_IS_NOT_SUPPORTED
                 )
                 return
-            self.expected_events = ["websocket.accept", "websocket.close"]
+            self.is_websocket_scope = True
+            self.state = STATE_WEBSOCKET_HANDSHAKE
+        elif self.is_body_too_large(metadata):
+            self._is_keepalive = False
+            self.send_predefined_response(RESPONSE_413)
+            return
+        else:
+            self.state = STATE_HTTP_RESPONSE_START
         try:
-            await self.app(self.scope, self.receive, self.send)
+            await self.app(self._scope, self.receive, self.send)
             if not self.is_response_completed():
                 raise RuntimeError(
                     "ASGICallable returns before finishing the response"
                 )
-        except BaseException:
+        except RequestBodyTooLarge:
+            if self.state == STATE_HTTP_RESPONSE_START:
+                self.send_predefined_response(RESPONSE_413)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                self.app_cancelled = True
             self.logger.exception("ASGICallable raised an exception")
             self.send_predefined_response(RESPONSE_500)
+        finally:
+            self.close_body_spool()
+
+    def is_body_too_large(self, metadata: RequestMetadata) -> bool:
+        return (
+            self.max_body_size is not None
+            and metadata.content_length is not None
+            and metadata.content_length > self.max_body_size
+        )
+
+    def is_app_cancelled(self) -> bool:
+        return self.app_cancelled
 
     def is_response_completed(self) -> bool:
-        return len(self.expected_events) == 0
+        return self.state == STATE_COMPLETED
 
     def send_predefined_response(self, response: PredefinedResponse) -> None:
-        data = self.http.serializer.serialize_metadata(
-            response.metadata
-        ) + self.http.serializer.serialize_body(response.body)
+        data = self.http.serializer.serialize_static_response(
+            response.metadata, response.body
+        )
         self.log_response(response.metadata.status)
         self.event_bus.send(data)
 
@@ -107,27 +199,122 @@ class ASGIEventManager:
         self.logger.info(f"[{status}] - {path}")
 
     async def receive(self) -> "ASGIReceiveEvent":
-        if self.scope["type"] == "http":
-            return await self.receive_http()
-        else:
+        if self.is_websocket_scope:
             return await self.receive_websocket()
+        return await self.receive_http()
 
     async def receive_http(self) -> "ASGIReceiveEvent":
-        data = self.http.parser.get_body()
+        if not self.body_spooled and self.should_spool_body():
+            self.body_spooled = True
+            body = await self.spool_body()
+            if body is None:
+                return {"type": "http.disconnect"}
+            if self.body_spool is None:
+                return {
+                    "type": "http.request",
+                    "body": body,
+                    "more_body": False,
+                }
+        if self.body_spool is not None:
+            return await self.receive_spooled_body(self.body_spool)
+        parser = self.http.parser
+        data = parser.get_body()
         if data is None:
-            if s_data := await self.event_bus.receive():
-                self.http.parser.feed_data(s_data)
-            data = self.http.parser.get_body()
+            await self.read_body()
+            data = parser.get_body()
         if data is None:
             return {"type": "http.disconnect"}
+        self.count_body(len(data))
+        return {
+            "type": "http.request",
+            "body": data,
+            "more_body": parser.is_more_body(),
+        }
+
+    async def read_body(self) -> bool:
+        data = await self.event_bus.receive(
+            count=self.body_buffer_size, timeout=self.body_read_timeout_s
+        )
+        if not data:
+            return False
+        self.http.parser.feed_data(data)
+        return True
+
+    def count_body(self, size: int) -> None:
+        self.body_size += size
+        if (
+            self.max_body_size is not None
+            and self.body_size > self.max_body_size
+        ):
+            self._is_keepalive = False
+            raise RequestBodyTooLarge()
+
+    def should_spool_body(self) -> bool:
+        if self.body_spool_threshold is None:
+            return False
+        content_length = self.metadata.content_length
+        if content_length is None:
+            return self.http.parser.is_more_body()
+        return content_length > self.body_spool_threshold
+
+    async def spool_body(self) -> bytes | None:
+        assert self.body_spool_threshold is not None
+        parser = self.http.parser
+        chunks: list[bytes] = []
+        while True:
+            data = parser.get_body()
+            if data is None:
+                if not await self.read_body():
+                    self.close_body_spool()
+                    return None
+                continue
+            self.count_body(len(data))
+            chunks.append(data)
+            if self.body_size > self.body_spool_threshold:
+                if self.body_spool is None:
+                    self.body_spool = tempfile.TemporaryFile()
+                await self.run_spool_io(
+                    self.body_spool.write, b"".join(chunks)
+                )
+                chunks.clear()
+            if not parser.is_more_body():
+                break
+        if self.body_spool is not None:
+            self.body_spool.seek(0)
+        return b"".join(chunks)
+
+    async def run_spool_io(self, func: Callable[..., T], *args: Any) -> T:
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        self.body_spool_io = future
+        return await asyncio.shield(future)
+
+    async def receive_spooled_body(
+        self, spool: IO[bytes]
+    ) -> "ASGIReceiveEvent":
+        data = await self.run_spool_io(spool.read, self.body_spool_chunk_size)
+        more_body = spool.tell() < self.body_size
+        if not more_body:
+            self.close_body_spool()
         return {
             "type": "http.request",
             "body": data,
-            "more_body": self.http.parser.is_more_body(),
+            "more_body": more_body,
         }
 
+    def close_body_spool(self) -> None:
+        spool = self.body_spool
+        io = self.body_spool_io
+        self.body_spool = None
+        self.body_spool_io = None
+        if spool is None:
+            return
+        if io is not None and not io.done():
+            io.add_done_callback(lambda _: spool.close())
+        else:
+            spool.close()
+
     async def receive_websocket(self) -> "ASGIReceiveEvent":
-        if "websocket.send" not in self.expected_events:
+        if self.state != STATE_WEBSOCKET_CONNECTED:
             return {"type": "websocket.connect"}
         data = self.websocket.parser.get_data()
         if data is None:
@@ -151,115 +338,139 @@ class ASGIEventManager:
             raise ValueError(f"Unhandled data type: {type(data)}")
 
     async def send(self, event: "ASGISendEvent") -> None:
-        self.validate_event_type(event["type"])
-        if self.scope["type"] == "http":
-            await self.send_http(event)
-        else:
-            await self.send_websocket(event)
+        handler = SEND_HANDLERS[self.state].get(event["type"])
+        if handler is None:
+            self.raise_unexpected_event(event["type"])
+        await handler(self, event)
 
-    async def send_http(
-        self,
-        event: "ASGISendEvent",
+    def raise_unexpected_event(self, event_type: str) -> NoReturn:
+        if self.state == STATE_COMPLETED:
+            raise RuntimeError("No events was expected")
+        if event_type not in ALL_SEND_EVENTS:
+            raise RuntimeError(f"Unhandled event type: {event_type}")
+        raise RuntimeError(f"Unexpected event {event_type}")
+
+    async def send_response_start(
+        self, event: "HTTPResponseStartEvent"
     ) -> None:
-        match event["type"]:
-            case "http.response.start":
-                event = cast("HTTPResponseStartEvent", event)
-                self.response_metadata = ResponseMetadata(
-                    status=event["status"],
-                    headers=event["headers"],
-                )
-                self.log_response(event["status"])
-                if event.get("trailers", False) is True:
-                    self.expected_events = ["http.response.trailers"]
-                else:
-                    self.expected_events = ["http.response.body"]
-                    self.event_bus.send(
-                        self.http.serializer.serialize_metadata(
-                            self.response_metadata
-                        ),
-                    )
-            case "http.response.trailers":
-                assert self.response_metadata is not None
-                event = cast("HTTPResponseTrailersEvent", event)
-                self.response_metadata.add_extra_headers(event["headers"])
-                if event.get("more_trailers", False) is False:
-                    self.expected_events = ["http.response.body"]
-                    self.event_bus.send(
-                        self.http.serializer.serialize_metadata(
-                            self.response_metadata
-                        ),
-                    )
-            case "http.response.body":
-                event = cast("HTTPResponseBodyEvent", event)
-                self.event_bus.send(
-                    self.http.serializer.serialize_body(event["body"])
-                )
-                if event.get("more_body", False) is False:
-                    self.expected_events = []
-            case _:
-                raise RuntimeError(f"Unhandled event type: {event['type']}")
-
-    async def send_websocket(self, event: "ASGISendEvent") -> None:
-        match event["type"]:
-            case "websocket.accept":
-                event = cast("WebSocketAcceptEvent", event)
-                client_token = (
-                    self.scope_builder.get_header(
-                        self.scope, b"sec-websocket-key"
-                    )
-                    or b""
-                )
-                headers = [
-                    (b"connection", b"Upgrade"),
-                    (b"upgrade", b"websocket"),
-                    (
-                        b"sec-websocket-accept",
-                        self.websocket.serializer.create_accept_token(
-                            client_token
-                        ),
-                    ),
-                ]
-                if subprotocol := event.get("subprotocol", None):
-                    headers.append(
-                        (b"sec-websocket-protocol", subprotocol.encode())
-                    )
-                data = self.http.serializer.serialize_metadata(
-                    ResponseMetadata(
-                        status=101,
-                        headers=headers,
-                    )
-                )
-                self.event_bus.send(data)
-                self.expected_events = ["websocket.send", "websocket.close"]
-            case "websocket.send":
-                event = cast("WebSocketSendEvent", event)
-                data_bytes = event.get("bytes", None)
-                data_text = event.get("text", None)
-                ws_data: str | bytes
-                if data_bytes is not None:
-                    ws_data = data_bytes
-                elif data_text is not None:
-                    ws_data = data_text
-                else:
-                    raise ValueError("bytes or text must be provided")
-                self.event_bus.send(
-                    self.websocket.serializer.serialize_data(ws_data)
-                )
-            case "websocket.close":
-                self.event_bus.send(
-                    self.websocket.serializer.build_close_frame()
-                )
-                self.expected_events = []
-                self._is_keepalive = False
-            case _:
-                raise ValueError(f"Unhandled event type {event['type']}")
-
-    def validate_event_type(self, event_type: str) -> str:
-        assert len(self.expected_events) != 0, "No events was expected"
-        assert (
-            event_type in self.expected_events
-        ), f"Unexpected event {event_type}"
-        return event_type
+        self.response_metadata = ResponseMetadata(
+            status=event["status"],
+            headers=event["headers"],
+        )
+        self.log_response(event["status"])
+        if event.get("trailers", False) is True:
+            self.state = STATE_HTTP_RESPONSE_TRAILERS
+            return
+        self.state = STATE_HTTP_RESPONSE_BODY
+        self.event_bus.send(
+            self.http.serializer.serialize_metadata(self.response_metadata)
+        )
+
+    async def send_response_trailers(
+        self, event: "HTTPResponseTrailersEvent"
+    ) -> None:
+        self.response_metadata.add_extra_headers(event["headers"])
+        if event.get("more_trailers", False) is False:
+            self.state = STATE_HTTP_RESPONSE_BODY
+            self.event_bus.send(
+                self.http.serializer.serialize_metadata(
+                    self.response_metadata
+                ),
+            )
+
+    async def send_response_body(self, event: "HTTPResponseBodyEvent") -> None:
+        self.event_bus.send(self.http.serializer.serialize_body(event["body"]))
+        if event.get("more_body", False) is False:
+            self.state = STATE_COMPLETED
+        await self.event_bus.drain()
+
+    async def send_response_pathsend(self, event: dict[str, Any]) -> None:
+        file = await asyncio.get_running_loop().run_in_executor(
+            None, open_for_sendfile, event["path"]
+        )
+        with file:
+            await self.event_bus.sendfile(file, 0, None)
+        self.state = STATE_COMPLETED
+
+    async def send_response_zerocopysend(self, event: dict[str, Any]) -> None:
+        file = event["file"]
+        offset = event.get("offset", None)
+        await self.event_bus.sendfile(
+            file,
+            file.tell() if offset is None else offset,
+            event.get("count", None),
+        )
+        if event.get("more_body", False) is False:
+            self.state = STATE_COMPLETED
+
+    async def send_websocket_accept(
+        self, event: "WebSocketAcceptEvent"
+    ) -> None:
+        client_token = self.metadata.get_header(b"sec-websocket-key") or b""
+        headers = [
+            (b"connection", b"Upgrade"),
+            (b"upgrade", b"websocket"),
+            (
+                b"sec-websocket-accept",
+                self.websocket.serializer.create_accept_token(client_token),
+            ),
+        ]
+        if subprotocol := event.get("subprotocol", None):
+            headers.append((b"sec-websocket-protocol", subprotocol.encode()))
+        data = self.http.serializer.serialize_metadata(
+            ResponseMetadata(
+                status=101,
+                headers=headers,
+            )
+        )
+        self.event_bus.send(data)
+        self.state = STATE_WEBSOCKET_CONNECTED
+
+    async def send_websocket_data(self, event: "WebSocketSendEvent") -> None:
+        data_bytes = event.get("bytes", None)
+        data_text = event.get("text", None)
+        ws_data: str | bytes
+        if data_bytes is not None:
+            ws_data = data_bytes
+        elif data_text is not None:
+            ws_data = data_text
+        else:
+            raise ValueError("bytes or text must be provided")
+        self.event_bus.send(self.websocket.serializer.serialize_data(ws_data))
+        await self.event_bus.drain()
+
+    async def send_websocket_close(self, event: "WebSocketCloseEvent") -> None:
+        self.event_bus.send(self.websocket.serializer.build_close_frame())
+        self.state = STATE_COMPLETED
+        self._is_keepalive = False
 
     def is_keepalive(self) -> bool:
         return self._is_keepalive
+
+
+HTTP_RESPONSE_BODY_HANDLERS: dict[str, SendHandler] = {
+    "http.response.body": ASGIEventManager.send_response_body,
+    "http.response.pathsend": ASGIEventManager.send_response_pathsend,
+    "http.response.zerocopysend": (
+        ASGIEventManager.send_response_zerocopysend
+    ),
+}
+
+SEND_HANDLERS: tuple[dict[str, SendHandler], ...] = (
+    {},
+    {"http.response.start": ASGIEventManager.send_response_start},
+    {"http.response.trailers": ASGIEventManager.send_response_trailers},
+    HTTP_RESPONSE_BODY_HANDLERS,
+    {
+        "websocket.accept": ASGIEventManager.send_websocket_accept,
+        "websocket.close": ASGIEventManager.send_websocket_close,
+    },
+    {
+        "websocket.send": ASGIEventManager.send_websocket_data,
+        "websocket.close": ASGIEventManager.send_websocket_close,
+    },
+)
+
+ALL_SEND_EVENTS = frozenset(
+    event_type for handlers in SEND_HANDLERS for event_type in handlers
+)
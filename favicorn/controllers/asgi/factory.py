@@ -11,6 +11,7 @@ from favicorn.i.protocols.http.protocol import HTTPProtocolFactory
 from favicorn.i.protocols.websocket.protocol import WebsocketProtocolFactory
 
 from .controller import ASGIController
+from .scope_builder import ASGIScopeBuilder
 
 
 class ASGIControllerFactory(IControllerFactory):
@@ -21,12 +22,31 @@ class ASGIControllerFactory(IControllerFactory):
         http_protocol_factory: HTTPProtocolFactory,
         websocket_protocol_factory: WebsocketProtocolFactory | None = None,
         logger: logging.Logger = logging.getLogger(__name__),
+        header_read_timeout_s: float | None = None,
+        body_read_timeout_s: float | None = None,
+        server: tuple[str, int | None] | None = None,
+        root_path: str = "",
+        eager_start: bool = False,
+        body_buffer_size: int = 65536,
+        body_spool_threshold: int | None = None,
+        body_spool_chunk_size: int = 1048576,
+        max_body_size: int | None = None,
     ) -> None:
         self.app = app
+        self.header_read_timeout_s = header_read_timeout_s
+        self.body_read_timeout_s = body_read_timeout_s
         self.logger = logger
         self.event_bus_factory = event_bus_factory
         self.http_protocol_factory = http_protocol_factory
         self.websocket_protocol_factory = websocket_protocol_factory
+        self.eager_start = eager_start
+        self.body_buffer_size = body_buffer_size
+        self.body_spool_threshold = body_spool_threshold
+        self.body_spool_chunk_size = body_spool_chunk_size
+        self.max_body_size = max_body_size
+        self.scope_builder = ASGIScopeBuilder(
+            server=server, root_path=root_path
+        )
 
     def build(self) -> IController:
         return ASGIController(
@@ -37,4 +57,12 @@ class ASGIControllerFactory(IControllerFactory):
             websocket_protocol=self.websocket_protocol_factory.build()
             if self.websocket_protocol_factory is not None
             else None,
+            header_read_timeout_s=self.header_read_timeout_s,
+            body_read_timeout_s=self.body_read_timeout_s,
+            scope_builder=self.scope_builder,
+            eager_start=self.eager_start,
+            body_buffer_size=self.body_buffer_size,
+            body_spool_threshold=self.body_spool_threshold,
+            body_spool_chunk_size=self.body_spool_chunk_size,
+            max_body_size=self.max_body_size,
         )
@@ -21,6 +21,19 @@ RESPONSE_400 = PredefinedResponse(
     body=RESPONSE_CONTENT_400,
 )
 
+RESPONSE_CONTENT_413 = b"Request body is too large"
+RESPONSE_413 = PredefinedResponse(
+    metadata=ResponseMetadata(
+        status=413,
+        headers=(
+            (b"Content-Type", b"text/plain; charset=utf-8"),
+            (b"Content-Length", str(len(RESPONSE_CONTENT_413)).encode()),
+            (b"Connection", b"close"),
+        ),
+    ),
+    body=RESPONSE_CONTENT_413,
+)
+
 RESPONSE_CONTENT_500 = b"Internal Server Error"
 RESPONSE_500 = PredefinedResponse(
     metadata=ResponseMetadata(
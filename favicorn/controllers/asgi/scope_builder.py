@@ -1,17 +1,23 @@
-from typing import TYPE_CHECKING, cast
+from typing import Any, TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from asgiref.typing import (
-        WWWScope,
-        HTTPScope,
-        Scope,
-        WebSocketScope,
-    )
+    from asgiref.typing import WWWScope
 
 from favicorn.i.protocols.http.request_metadata import RequestMetadata
 
 
+ASGI_VERSION = {"spec_version": "2.3", "version": "3.0"}
+HTTP_EXTENSIONS: dict[str, dict[object, object]] = {
+    "http.response.pathsend": {},
+    "http.response.zerocopysend": {},
+}
+WEBSOCKET_EXTENSIONS: dict[str, dict[object, object]] = {}
+
+
 class ASGIScopeBuilder:
+    http_template: dict[str, Any]
+    websocket_template: dict[str, Any]
+
     def __init__(
         self,
         server: tuple[str, int | None] | None = None,
@@ -19,38 +25,44 @@ class ASGIScopeBuilder:
     ) -> None:
         self.server = server
         self.root_path = root_path
+        self.http_template = self.build_template("http", "http")
+        self.websocket_template = self.build_template("websocket", "ws")
 
-    def build(
-        self, metadata: RequestMetadata, client: tuple[str, int] | None
-    ) -> "WWWScope":
-        base_scope = {
-            "path": metadata.path,
-            "asgi": {"spec_version": "2.3", "version": "3.0"},
-            "http_version": metadata.http_version,
-            "raw_path": metadata.raw_path,
-            "query_string": metadata.query_string or b"",
-            "headers": metadata.headers,
+    def build_template(self, scope_type: str, scheme: str) -> dict[str, Any]:
+        return {
+            "type": scope_type,
+            "scheme": scheme,
+            "asgi": None,
+            "extensions": None,
             "root_path": self.root_path,
             "server": self.server,
-            "client": client,
-            "extensions": {},
-            "method": metadata.method,
+            "path": None,
+            "http_version": None,
+            "raw_path": None,
+            "query_string": None,
+            "headers": None,
+            "client": None,
+            "method": None,
         }
+
+    def build(
+        self, metadata: RequestMetadata, client: tuple[str, int] | None
+    ) -> "WWWScope":
         if metadata.is_websocket():
-            return cast(
-                "WebSocketScope",
-                {**base_scope, "type": "websocket", "scheme": "ws"},
-            )
+            scope = self.websocket_template.copy()
+            extensions = WEBSOCKET_EXTENSIONS
         else:
-            return cast(
-                "HTTPScope", {**base_scope, "type": "http", "scheme": "http"}
-            )
-
-    def get_header(self, scope: "Scope", header: bytes) -> bytes | None:
-        if scope["type"] == "lifespan":
-            return None
-        for header_name, value in scope["headers"]:
-            if header_name != header:
-                continue
-            return value
-        return None
+            scope = self.http_template.copy()
+            extensions = HTTP_EXTENSIONS
+        scope["asgi"] = ASGI_VERSION.copy()
+        scope["extensions"] = {
+            name: options.copy() for name, options in extensions.items()
+        }
+        scope["path"] = metadata.path
+        scope["http_version"] = metadata.http_version
+        scope["raw_path"] = metadata.raw_path
+        scope["query_string"] = metadata.query_string or b""
+        scope["headers"] = metadata.headers
+        scope["client"] = client
+        scope["method"] = metadata.method
+        return cast("WWWScope", scope)
@@ -0,0 +1,16 @@
+from .events import NativeCommandType, NativeEventType
+from .protocol import NativeSocketProtocol
+from .reader import NativeSocketReader
+from .server import NativeServer
+from .transport import NativeTransport
+from .writer import NativeSocketWriter
+
+__all__ = (
+    "NativeCommandType",
+    "NativeEventType",
+    "NativeServer",
+    "NativeSocketProtocol",
+    "NativeSocketReader",
+    "NativeSocketWriter",
+    "NativeTransport",
+)
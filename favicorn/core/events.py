@@ -0,0 +1,19 @@
+from enum import IntEnum
+
+
+class NativeEventType(IntEnum):
+    CONNECTION_MADE = 0
+    DATA_RECEIVED = 1
+    EOF_RECEIVED = 2
+    DATA_WRITTEN = 3
+    CONNECTION_LOST = 4
+    IDLE_TIMEOUT = 5
+
+
+class NativeCommandType(IntEnum):
+    WRITE = 0
+    WRITE_EOF = 1
+    CLOSE = 2
+    PAUSE_READING = 3
+    RESUME_READING = 4
+    START_IDLE_TIMER = 5
@@ -0,0 +1,32 @@
+import asyncio
+from typing import cast
+
+from favicorn.buffered import (
+    BufferedSocketProtocol,
+    BufferedSocketReader,
+    BufferedSocketWriter,
+)
+from favicorn.timer_wheel import get_timer_wheel
+
+from .reader import NativeSocketReader
+from .transport import NativeTransport
+from .writer import NativeSocketWriter
+
+
+class NativeSocketProtocol(BufferedSocketProtocol):
+    def build_reader(
+        self, transport: asyncio.ReadTransport
+    ) -> BufferedSocketReader:
+        return NativeSocketReader(
+            cast(NativeTransport, transport), self.pool, get_timer_wheel()
+        )
+
+    def build_writer(
+        self, transport: asyncio.WriteTransport
+    ) -> BufferedSocketWriter:
+        return NativeSocketWriter(
+            transport,
+            cork=self.cork,
+            high_water_mark=self.write_high_water_mark,
+            low_water_mark=self.write_low_water_mark,
+        )
@@ -0,0 +1,15 @@
+from favicorn.buffered import BufferedSocketReader
+
+from .transport import NativeTransport
+
+
+class NativeSocketReader(BufferedSocketReader):
+    transport: NativeTransport
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        self.release()
+        if self.start == self.end and not self.eof:
+            if timeout is not None:
+                self.transport.start_idle_timer(timeout)
+            await self.wait_for_data(None)
+        return self.start != self.end
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from types import ModuleType
+from typing import Any
+
+from favicorn.buffered import ReadBufferPool
+from favicorn.i.connection import IConnectionFactory
+from favicorn.i.server import IServer
+from favicorn.i.socket_provider import ISocketProvider
+
+from .events import NativeCommandType, NativeEventType
+from .protocol import NativeSocketProtocol
+from .transport import CommandPayload, NativeTransport
+
+
+class NativeServer(IServer):
+    logger: logging.Logger
+    socket_provider: ISocketProvider
+    connection_factory: IConnectionFactory
+    core: Any | None
+    transports: dict[int, NativeTransport]
+    commands: list[tuple[int, NativeCommandType, CommandPayload]]
+    closed: asyncio.Future[None] | None
+
+    def __init__(
+        self,
+        favicorn_core: ModuleType,
+        socket_provider: ISocketProvider,
+        connection_factory: IConnectionFactory,
+        logger: logging.Logger = logging.getLogger(__name__),
+        loops_count: int = 1,
+        min_read_buffer_size: int = 8192,
+        max_read_buffer_size: int = 262144,
+        write_high_water_mark: int = 65536,
+        write_low_water_mark: int = 16384,
+    ) -> None:
+        self.favicorn_core = favicorn_core
+        self.logger = logger
+        self.socket_provider = socket_provider
+        self.connection_factory = connection_factory
+        self.loops_count = loops_count
+        self.pool = ReadBufferPool(
+            min_size=min_read_buffer_size, max_size=max_read_buffer_size
+        )
+        self.write_high_water_mark = write_high_water_mark
+        self.write_low_water_mark = write_low_water_mark
+        self.core = None
+        self.transports = {}
+        self.commands = []
+        self.exchange_scheduled = False
+        self.serving = False
+        self.closed = None
+
+    async def init(self) -> None:
+        self.logger.debug("Start initializing native server")
+        sock = self.socket_provider.acquire()
+        self.core = self.favicorn_core.Server(sock.fileno(), self.loops_count)
+        self.core.set_log_level(self.logger.getEffectiveLevel())
+        self.loop = asyncio.get_running_loop()
+        self.closed = self.loop.create_future()
+        self.logger.info(
+            f"Socket {sock.getsockname()} acquired successfully "
+            f"using {type(self.socket_provider)}, "
+            f"serving it from {self.loops_count} native loops"
+        )
+
+    async def start_serving(self) -> None:
+        self.logger.debug("Start serving...")
+        if not self.serving and self.core is not None:
+            self.serving = True
+            self.loop.add_reader(self.core.fileno(), self.exchange)
+            self.exchange()
+
+    async def serve_forever(self) -> None:
+        self.logger.info("Serve forever...")
+        await self.start_serving()
+        assert self.closed is not None, "Server is not initialized"
+        await self.closed
+
+    def send_command(
+        self,
+        connection_id: int,
+        command_type: NativeCommandType,
+        data: CommandPayload,
+    ) -> None:
+        self.commands.append((connection_id, command_type, data))
+        if not self.exchange_scheduled:
+            self.exchange_scheduled = True
+            self.loop.call_soon(self.exchange)
+
+    def exchange(self) -> None:
+        self.exchange_scheduled = False
+        if self.core is None:
+            return
+        commands, self.commands = self.commands, []
+        for connection_id, event_type, payload in self.core.exchange_events(
+            commands
+        ):
+            self.dispatch(connection_id, event_type, payload)
+        self.drain_logs()
+
+    def drain_logs(self) -> None:
+        assert self.core is not None
+        for level, connection_id, message in self.core.drain_logs():
+            if connection_id != 0:
+                message = f"Connection {connection_id}: {message}"
+            self.logger.log(level, message)
+
+    def dispatch(
+        self, connection_id: int, event_type: int, payload: Any
+    ) -> None:
+        match event_type:
+            case NativeEventType.CONNECTION_MADE:
+                self.connection_made(connection_id, payload)
+            case NativeEventType.DATA_RECEIVED:
+                self.transports[connection_id].data_received(payload)
+            case NativeEventType.EOF_RECEIVED:
+                self.transports[connection_id].eof_received()
+            case NativeEventType.DATA_WRITTEN:
+                self.transports[connection_id].data_written(payload)
+            case NativeEventType.IDLE_TIMEOUT:
+                self.transports[connection_id].idle_timeout()
+            case NativeEventType.CONNECTION_LOST:
+                self.transports.pop(connection_id).connection_lost()
+            case _:
+                raise ValueError(f"Unhandled native event type {event_type}")
+
+    def connection_made(
+        self, connection_id: int, peername: tuple[str, int]
+    ) -> None:
+        protocol = NativeSocketProtocol(
+            connection_factory=self.connection_factory,
+            pool=self.pool,
+            write_high_water_mark=self.write_high_water_mark,
+            write_low_water_mark=self.write_low_water_mark,
+        )
+        transport = NativeTransport(connection_id, self.send_command, peername)
+        transport.set_protocol(protocol)
+        self.transports[connection_id] = transport
+        protocol.connection_made(transport)
+
+    async def close(self) -> None:
+        self.logger.debug("Closing native server...")
+        if self.serving and self.core is not None:
+            self.serving = False
+            self.loop.remove_reader(self.core.fileno())
+        if self.core is not None:
+            self.core.close()
+            self.exchange()
+            self.core = None
+        if self.closed is not None and not self.closed.done():
+            self.closed.set_result(None)
+        self.socket_provider.cleanup()
+        self.logger.info("Native server closed successfully")
@@ -0,0 +1,165 @@
+import asyncio
+from collections import deque
+from typing import Callable, Iterable
+
+from favicorn.buffered import BufferedSocketProtocol
+
+from .events import NativeCommandType
+
+Chunk = bytes | bytearray | memoryview
+CommandPayload = bytes | tuple[int, int] | None
+SendCommand = Callable[[int, NativeCommandType, CommandPayload], None]
+
+
+class NativeTransport(asyncio.Transport):
+    protocol: BufferedSocketProtocol
+    pending: deque[memoryview]
+
+    def __init__(
+        self,
+        connection_id: int,
+        send_command: SendCommand,
+        peername: tuple[str, int] | None,
+    ) -> None:
+        super().__init__(extra={"peername": peername})
+        self.connection_id = connection_id
+        self.send_command = send_command
+        self.closing = False
+        self.reading = True
+        self.write_buffer_size = 0
+        self.high_water_mark = 65536
+        self.low_water_mark = 16384
+        self.writing_paused = False
+        self.bytes_received = 0
+        self.pending = deque()
+        self.eof_pending = False
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        assert isinstance(protocol, BufferedSocketProtocol)
+        self.protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self.protocol
+
+    def write(self, data: Chunk) -> None:
+        if self.closing or not data:
+            return
+        self.write_buffer_size += len(data)
+        self.send_command(
+            self.connection_id, NativeCommandType.WRITE, bytes(data)
+        )
+        if (
+            not self.writing_paused
+            and self.write_buffer_size > self.high_water_mark
+        ):
+            self.writing_paused = True
+            self.protocol.pause_writing()
+
+    def writelines(self, list_of_data: Iterable[Chunk]) -> None:
+        self.write(b"".join(list_of_data))
+
+    def can_write_eof(self) -> bool:
+        return True
+
+    def write_eof(self) -> None:
+        self.send_command(
+            self.connection_id, NativeCommandType.WRITE_EOF, None
+        )
+
+    def get_write_buffer_size(self) -> int:
+        return self.write_buffer_size
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return (self.low_water_mark, self.high_water_mark)
+
+    def set_write_buffer_limits(
+        self, high: int | None = None, low: int | None = None
+    ) -> None:
+        if high is not None:
+            self.high_water_mark = high
+        if low is not None:
+            self.low_water_mark = low
+
+    def is_reading(self) -> bool:
+        return self.reading
+
+    def pause_reading(self) -> None:
+        if self.reading and not self.closing:
+            self.reading = False
+            self.send_command(
+                self.connection_id, NativeCommandType.PAUSE_READING, None
+            )
+
+    def resume_reading(self) -> None:
+        if not self.reading and not self.closing:
+            self.reading = True
+            self.feed_pending()
+            if self.reading:
+                self.send_command(
+                    self.connection_id, NativeCommandType.RESUME_READING, None
+                )
+
+    def is_closing(self) -> bool:
+        return self.closing
+
+    def close(self) -> None:
+        if not self.closing:
+            self.closing = True
+            self.send_command(
+                self.connection_id, NativeCommandType.CLOSE, None
+            )
+
+    def abort(self) -> None:
+        self.close()
+
+    def start_idle_timer(self, timeout: float) -> None:
+        self.send_command(
+            self.connection_id,
+            NativeCommandType.START_IDLE_TIMER,
+            (int(timeout * 1000), self.bytes_received),
+        )
+
+    def data_received(self, data: bytes) -> None:
+        self.bytes_received += len(data)
+        self.pending.append(memoryview(data))
+        if len(self.pending) == 1:
+            self.feed_pending()
+
+    def feed_pending(self) -> None:
+        while self.pending:
+            view = self.pending[0]
+            while view:
+                buffer = self.protocol.get_buffer(len(view))
+                if not buffer:
+                    self.pending[0] = view
+                    return
+                nbytes = min(len(buffer), len(view))
+                buffer[:nbytes] = view[:nbytes]
+                self.protocol.buffer_updated(nbytes)
+                view = view[nbytes:]
+            self.pending.popleft()
+        if self.eof_pending:
+            self.eof_pending = False
+            self.eof_received()
+
+    def eof_received(self) -> None:
+        if self.pending:
+            self.eof_pending = True
+        elif not self.protocol.eof_received():
+            self.close()
+
+    def data_written(self, nbytes: int) -> None:
+        self.write_buffer_size -= nbytes
+        if (
+            self.writing_paused
+            and self.write_buffer_size <= self.low_water_mark
+        ):
+            self.writing_paused = False
+            self.protocol.resume_writing()
+
+    def idle_timeout(self) -> None:
+        self.protocol.reader.wakeup()
+
+    def connection_lost(self) -> None:
+        self.closing = True
+        self.protocol.connection_lost(None)
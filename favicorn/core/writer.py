@@ -0,0 +1,24 @@
+from typing import BinaryIO
+
+from favicorn.buffered import BufferedSocketWriter
+
+
+class NativeSocketWriter(BufferedSocketWriter):
+    async def sendfile(
+        self,
+        file: BinaryIO,
+        offset: int,
+        count: int | None,
+        chunk_size: int = 65536,
+    ) -> None:
+        file.seek(offset)
+        while count is None or count > 0:
+            chunk = file.read(
+                chunk_size if count is None else min(count, chunk_size)
+            )
+            if not chunk or self.transport.is_closing():
+                return
+            if count is not None:
+                count -= len(chunk)
+            self.write(chunk)
+            await self.drain()
@@ -1,3 +1,9 @@
 from .deque import DequeEventBus, DequeEventBusFactory
+from .direct import DirectEventBus, DirectEventBusFactory
 
-__all__ = ("DequeEventBus", "DequeEventBusFactory")
+__all__ = (
+    "DequeEventBus",
+    "DequeEventBusFactory",
+    "DirectEventBus",
+    "DirectEventBusFactory",
+)
@@ -1,6 +1,6 @@
 import asyncio
 from collections import deque
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, BinaryIO
 
 from favicorn.i.event_bus import (
     ControllerEvent,
@@ -9,34 +9,63 @@ from favicorn.i.event_bus import (
     IEventBus,
     IEventBusFactory,
 )
+from favicorn.i.reader import ReadData
+
+from .sendfile import send_file_in_chunks
 
 
 class DequeEventBus(IEventBus):
     provider_event: asyncio.Event
     controller_event: asyncio.Event
-    provider_queue: deque[bytes | None]
+    provider_queue: deque[ReadData | None]
     controller_queue: deque[ControllerEvent | None]
+    drain_waiter: asyncio.Future[None] | None
 
-    def __init__(self) -> None:
+    def __init__(self, max_queued_size: int = 65536) -> None:
         self.provider_queue = deque()
         self.controller_queue = deque()
         self.provider_event = asyncio.Event()
         self.controller_event = asyncio.Event()
+        self.queued_size = 0
+        self.max_queued_size = max_queued_size
+        self.drain_waiter = None
+
+    def reset(self) -> None:
+        self.provider_queue.clear()
+        self.controller_queue.clear()
+        self.provider_event.clear()
+        self.controller_event.clear()
+        self.queued_size = 0
 
     def push_to_controller_queue(self, event: ControllerEvent | None) -> None:
         self.controller_queue.append(event)
         self.controller_event.set()
 
-    def push_to_provider_queue(self, data: bytes | None) -> None:
+    def push_to_provider_queue(self, data: ReadData | None) -> None:
         self.provider_queue.append(data)
         self.provider_event.set()
 
     def send(self, data: bytes) -> None:
+        self.queued_size += len(data)
         self.push_to_controller_queue(ControllerSendEvent(data=data))
 
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        await send_file_in_chunks(self, file, offset, count)
+
+    async def drain(self) -> None:
+        if self.queued_size <= self.max_queued_size:
+            return
+        self.drain_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.drain_waiter
+        finally:
+            self.drain_waiter = None
+
     async def receive(
         self, count: int | None = None, timeout: float | None = None
-    ) -> bytes | None:
+    ) -> ReadData | None:
         event = ControllerReceiveEvent(count=count, timeout=timeout)
         if event not in self.controller_queue:
             self.push_to_controller_queue(event)
@@ -58,11 +87,23 @@ class DequeEventBus(IEventBus):
     async def get_event(self) -> ControllerEvent | None:
         await self.controller_event.wait()
         if len(self.controller_queue) != 0:
-            return self.controller_queue.popleft()
+            return self.pop_event()
         self.controller_event.clear()
         return await self.get_event()
 
-    def provide_for_receive(self, data: bytes | None) -> None:
+    def pop_event(self) -> ControllerEvent | None:
+        event = self.controller_queue.popleft()
+        if isinstance(event, ControllerSendEvent):
+            self.queued_size -= len(event.data)
+            if (
+                self.drain_waiter is not None
+                and not self.drain_waiter.done()
+                and self.queued_size <= self.max_queued_size
+            ):
+                self.drain_waiter.set_result(None)
+        return event
+
+    def provide_for_receive(self, data: ReadData | None) -> None:
         self.push_to_provider_queue(data)
 
     def close(self) -> None:
@@ -73,5 +114,8 @@ class DequeEventBus(IEventBus):
 
 
 class DequeEventBusFactory(IEventBusFactory):
+    def __init__(self, max_queued_size: int = 65536) -> None:
+        self.max_queued_size = max_queued_size
+
     def build(self) -> IEventBus:
-        return DequeEventBus()
+        return DequeEventBus(max_queued_size=self.max_queued_size)
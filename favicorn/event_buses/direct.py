@@ -0,0 +1,143 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncGenerator, BinaryIO
+
+from favicorn.i.event_bus import (
+    ControllerEvent,
+    ControllerReceiveEvent,
+    ControllerSendEvent,
+    IEventBus,
+    IEventBusFactory,
+)
+from favicorn.i.reader import ISocketReader, ReadData
+from favicorn.i.writer import ISocketWriter
+
+from .sendfile import send_file_in_chunks
+
+
+class DirectEventBus(IEventBus):
+    reader: ISocketReader | None
+    writer: ISocketWriter | None
+    events: deque[ControllerEvent]
+    events_waiter: asyncio.Future[None] | None
+    provided_data: deque[ReadData | None]
+    receive_waiters: deque[asyncio.Future[ReadData | None]]
+    drain_waiter: asyncio.Future[None] | None
+
+    def __init__(self, max_queued_size: int = 65536) -> None:
+        self.reader = None
+        self.writer = None
+        self.closed = False
+        self.events = deque()
+        self.events_waiter = None
+        self.provided_data = deque()
+        self.receive_waiters = deque()
+        self.queued_size = 0
+        self.max_queued_size = max_queued_size
+        self.drain_waiter = None
+
+    def reset(self) -> None:
+        self.closed = False
+        self.events.clear()
+        self.provided_data.clear()
+        self.receive_waiters.clear()
+        self.queued_size = 0
+
+    def attach(self, reader: ISocketReader, writer: ISocketWriter) -> bool:
+        self.reader = reader
+        self.writer = writer
+        return True
+
+    def send(self, data: bytes) -> None:
+        if self.writer is not None:
+            self.writer.write(data)
+        else:
+            self.queued_size += len(data)
+            self.push_event(ControllerSendEvent(data=data))
+
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        if self.writer is not None:
+            await self.writer.sendfile(file, offset, count)
+        else:
+            await send_file_in_chunks(self, file, offset, count)
+
+    async def drain(self) -> None:
+        if self.writer is not None:
+            await self.writer.drain()
+            return
+        if self.queued_size <= self.max_queued_size:
+            return
+        self.drain_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.drain_waiter
+        finally:
+            self.drain_waiter = None
+
+    async def receive(
+        self, count: int | None = None, timeout: float | None = None
+    ) -> ReadData | None:
+        if self.reader is not None:
+            return await self.reader.read(count=count, timeout=timeout)
+        if self.provided_data:
+            return self.provided_data.popleft()
+        waiter: asyncio.Future[ReadData | None]
+        waiter = asyncio.get_running_loop().create_future()
+        self.receive_waiters.append(waiter)
+        self.push_event(ControllerReceiveEvent(count=count, timeout=timeout))
+        return await waiter
+
+    def provide_for_receive(self, data: ReadData | None) -> None:
+        while self.receive_waiters:
+            waiter = self.receive_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(data)
+                return
+        self.provided_data.append(data)
+
+    def push_event(self, event: ControllerEvent) -> None:
+        self.events.append(event)
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        if self.events_waiter is not None and not self.events_waiter.done():
+            self.events_waiter.set_result(None)
+
+    def close(self) -> None:
+        self.closed = True
+        self.wakeup()
+
+    def __aiter__(self) -> AsyncGenerator[ControllerEvent, None]:
+        return self
+
+    async def asend(self, _: None) -> ControllerEvent:
+        while not self.events:
+            if self.closed:
+                raise StopAsyncIteration()
+            self.events_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self.events_waiter
+            finally:
+                self.events_waiter = None
+        event = self.events.popleft()
+        if isinstance(event, ControllerSendEvent):
+            self.queued_size -= len(event.data)
+            if (
+                self.drain_waiter is not None
+                and not self.drain_waiter.done()
+                and self.queued_size <= self.max_queued_size
+            ):
+                self.drain_waiter.set_result(None)
+        return event
+
+    async def athrow(self, *args: Any, **kwargs: Any) -> ControllerEvent:
+        return await super().athrow(*args, **kwargs)
+
+
+class DirectEventBusFactory(IEventBusFactory):
+    def __init__(self, max_queued_size: int = 65536) -> None:
+        self.max_queued_size = max_queued_size
+
+    def build(self) -> IEventBus:
+        return DirectEventBus(max_queued_size=self.max_queued_size)
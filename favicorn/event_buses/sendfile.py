@@ -0,0 +1,23 @@
+from typing import BinaryIO
+
+from favicorn.i.event_bus import IEventBus
+
+
+async def send_file_in_chunks(
+    event_bus: IEventBus,
+    file: BinaryIO,
+    offset: int,
+    count: int | None,
+    chunk_size: int = 65536,
+) -> None:
+    file.seek(offset)
+    while count is None or count > 0:
+        chunk = file.read(
+            chunk_size if count is None else min(count, chunk_size)
+        )
+        if not chunk:
+            return
+        if count is not None:
+            count -= len(chunk)
+        event_bus.send(chunk)
+        await event_bus.drain()
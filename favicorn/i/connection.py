@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
-from ..reader import SocketReader
-from ..writer import SocketWriter
+from .reader import ISocketReader
+from .writer import ISocketWriter
 
 
 class IConnection(ABC):
@@ -18,7 +18,7 @@ class IConnectionFactory(ABC):
     @abstractmethod
     def build(
         self,
-        reader: SocketReader,
-        writer: SocketWriter,
+        reader: ISocketReader,
+        writer: ISocketWriter,
     ) -> IConnection:
         raise NotImplementedError
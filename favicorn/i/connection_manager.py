@@ -0,0 +1,19 @@
+import asyncio
+import socket
+from abc import ABC, abstractmethod
+
+from .connection import IConnectionFactory
+
+
+class IConnectionManager(ABC):
+    @abstractmethod
+    async def create_server(self, sock: socket.socket) -> asyncio.Server:
+        raise NotImplementedError
+
+
+class IConnectionManagerFactory(ABC):
+    @abstractmethod
+    def build(
+        self, connection_factory: IConnectionFactory
+    ) -> IConnectionManager:
+        raise NotImplementedError
@@ -11,6 +11,13 @@ class IController(ABC):
     ) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def run(
+        self,
+        client: tuple[str, int] | None,
+    ) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_event_bus(self) -> IEventBus:
         raise NotImplementedError
@@ -23,6 +30,14 @@ class IController(ABC):
     async def stop(self) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_buffered_data(self) -> bool:
+        raise NotImplementedError
+
 
 class IControllerFactory(ABC):
     @abstractmethod
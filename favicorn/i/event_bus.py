@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import AsyncGenerator
+from typing import AsyncGenerator, BinaryIO
+
+from .reader import ISocketReader, ReadData
+from .writer import ISocketWriter
 
 
 @dataclass
@@ -22,20 +25,37 @@ class IEventBus(ABC, AsyncGenerator[ControllerEvent, None]):
     def send(self, data: bytes) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def drain(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def receive(
         self, count: int | None = None, timeout: float | None = None
-    ) -> bytes | None:
+    ) -> ReadData | None:
         raise NotImplementedError
 
     @abstractmethod
-    def provide_for_receive(self, data: bytes | None) -> None:
+    def provide_for_receive(self, data: ReadData | None) -> None:
         raise NotImplementedError
 
     @abstractmethod
     def close(self) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def attach(self, reader: ISocketReader, writer: ISocketWriter) -> bool:
+        return False
+
 
 class IEventBusFactory(ABC):
     @abstractmethod
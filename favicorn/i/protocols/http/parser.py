@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from .request_metadata import RequestMetadata
+from ...reader import ReadData
 
 
 class HTTPParsingException(BaseException):
@@ -9,7 +10,7 @@ class HTTPParsingException(BaseException):
 
 class IHTTPParser(ABC):
     @abstractmethod
-    def feed_data(self, data: bytes) -> None:
+    def feed_data(self, data: ReadData) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -32,6 +33,14 @@ class IHTTPParser(ABC):
     def is_more_body(self) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_buffered_data(self) -> bool:
+        raise NotImplementedError
+
 
 class IHTTPParserFactory(ABC):
     @abstractmethod
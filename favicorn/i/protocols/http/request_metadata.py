@@ -1,7 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable
 
 
+def is_keepalive_connection(
+    http_version: str, connection: bytes | None
+) -> bool:
+    if connection is not None:
+        value = connection.lower()
+        if value == b"keep-alive":
+            return True
+        elif value == b"close":
+            return False
+    return http_version != "1.0"
+
+
+def is_websocket_upgrade(upgrade: bytes | None) -> bool:
+    return upgrade is not None and upgrade.lower() == b"websocket"
+
+
 @dataclass
 class RequestMetadata:
     path: str
@@ -10,24 +26,34 @@ class RequestMetadata:
     http_version: str
     query_string: bytes | None
     headers: Iterable[tuple[bytes, bytes]]
+    keep_alive: bool | None = None
+    websocket: bool | None = None
+    content_length: int | None = None
+    expect_continue: bool = False
+    host: bytes | None = None
+    _header_index: dict[bytes, bytes] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_header_index(self) -> dict[bytes, bytes]:
+        if self._header_index is None:
+            index: dict[bytes, bytes] = {}
+            for name, value in self.headers:
+                index.setdefault(name, value)
+            self._header_index = index
+        return self._header_index
+
+    def get_header(self, name: bytes) -> bytes | None:
+        return self.get_header_index().get(name)
 
     def is_keepalive(self) -> bool:
-        if connection_header := next(
-            filter(lambda h: h[0] == b"connection", self.headers), None
-        ):
-            _, value_bytes = connection_header
-            value = value_bytes.decode().lower()
-            if value == "keep-alive":
-                return True
-            elif value == "close":
-                return False
-        if self.http_version == "1.0":
-            return False
-        return True
+        if self.keep_alive is None:
+            self.keep_alive = is_keepalive_connection(
+                self.http_version, self.get_header(b"connection")
+            )
+        return self.keep_alive
 
     def is_websocket(self) -> bool:
-        for header, value in self.headers:
-            if header != b"upgrade":
-                continue
-            return value.decode().lower() == "websocket"
-        return False
+        if self.websocket is None:
+            self.websocket = is_websocket_upgrade(self.get_header(b"upgrade"))
+        return self.websocket
@@ -15,6 +15,11 @@ class IHTTPSerializer(ABC):
     def serialize_body(self, body: bytes) -> bytes:
         raise NotImplementedError
 
+    def serialize_static_response(
+        self, metadata: ResponseMetadata, body: bytes
+    ) -> bytes:
+        return self.serialize_metadata(metadata) + self.serialize_body(body)
+
 
 class IHTTPSerializerFactory(ABC):
     @abstractmethod
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 
+from ...reader import ReadData
+
 
 class IWebsocketParser(ABC):
     @abstractmethod
-    def feed_data(self, data: bytes) -> None:
+    def feed_data(self, data: ReadData) -> None:
         pass
 
     @abstractmethod
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+# A memoryview returned by read() is a slice of the reader's buffer and is
+# only valid until the next read() or wait() call on the same reader
+ReadData = bytes | memoryview
+
+
+class ISocketReader(ABC):
+    @abstractmethod
+    async def read(
+        self, timeout: float | None = None, count: int | None = None
+    ) -> ReadData | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait(self, timeout: float | None = None) -> bool:
+        raise NotImplementedError
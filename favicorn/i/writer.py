@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+
+class ISocketWriter(ABC):
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def drain(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def flush(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_closing(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_address(self) -> tuple[str, int] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
@@ -1,9 +1,12 @@
 from .h11_parser import H11HTTPParser, H11HTTPParserFactory
 from .httptools_parser import HTTPToolsParser, HTTPToolsParserFactory
+from .llhttp_parser import LLHTTPParser, LLHTTPParserFactory
 
 __all__ = (
     "HTTPToolsParser",
     "HTTPToolsParserFactory",
     "H11HTTPParser",
     "H11HTTPParserFactory",
+    "LLHTTPParser",
+    "LLHTTPParserFactory",
 )
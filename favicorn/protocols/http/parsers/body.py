@@ -0,0 +1,26 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BodyQueue:
+    chunks: deque[bytes] = field(default_factory=deque)
+    completed: bool = False
+
+    def add(self, body: bytes) -> None:
+        self.chunks.append(body)
+
+    def complete(self) -> None:
+        self.completed = True
+
+    def take(self) -> bytes | None:
+        chunks = self.chunks
+        if not chunks:
+            if not self.completed:
+                return None
+            self.completed = False
+            return b""
+        body = chunks.popleft() if len(chunks) == 1 else b"".join(chunks)
+        chunks.clear()
+        self.completed = False
+        return body
@@ -6,7 +6,15 @@ from favicorn.i.protocols.http.parser import (
     IHTTPParser,
     IHTTPParserFactory,
 )
-from favicorn.i.protocols.http.request_metadata import RequestMetadata
+from favicorn.i.protocols.http.request_metadata import (
+    RequestMetadata,
+    is_keepalive_connection,
+    is_websocket_upgrade,
+)
+from favicorn.i.reader import ReadData
+
+from ..body import BodyQueue
+from ..headers import RequestFlags
 
 
 class H11HTTPParser(IHTTPParser):
@@ -16,24 +24,45 @@ class H11HTTPParser(IHTTPParser):
     headers: list[tuple[bytes, bytes]]
     http_version: str | None
     query_string: bytes | None
-    body: bytes | None
-    connection_header: str | None
+    body: BodyQueue
+    flags: RequestFlags
     more_body: bool
 
     def __init__(self, h11: ModuleType) -> None:
         self.h11 = h11
-        self.parser = h11.Connection(our_role=h11.SERVER)
+        self.init_state()
+
+    def reset(self) -> None:
+        buffered_data = self.get_buffered_data()
+        self.init_state()
+        if buffered_data:
+            self.feed_data(buffered_data)
+
+    def init_state(self) -> None:
+        self.parser = self.h11.Connection(our_role=self.h11.SERVER)
         self.error = None
         self.path = None
-        self.body = None
+        self.body = BodyQueue()
         self.method = None
         self.headers = []
         self.http_version = None
         self.query_string = None
-        self.connection_header = None
+        self.flags = RequestFlags()
         self.more_body = True
 
-    def feed_data(self, data: bytes) -> None:
+    def get_buffered_data(self) -> bytes:
+        if self.parser.their_state not in (self.h11.DONE, self.h11.MUST_CLOSE):
+            return b""
+        data, _ = self.parser.trailing_data
+        return bytes(data)
+
+    def has_buffered_data(self) -> bool:
+        return (
+            self.parser.their_state is not self.h11.IDLE
+            or len(self.parser.trailing_data[0]) > 0
+        )
+
+    def feed_data(self, data: ReadData) -> None:
         self.parser.receive_data(data)
         self.process_event()
 
@@ -56,11 +85,10 @@ class H11HTTPParser(IHTTPParser):
             self.set_headers(event.headers)
             self.set_http_version(event.http_version.decode())
         elif isinstance(event, self.h11.Data):
-            self.set_body(event.data)
+            self.body.add(event.data)
         elif isinstance(event, self.h11.EndOfMessage):
             self.more_body = False
-            if self.body is None:
-                self.set_body(b"")
+            self.body.complete()
             return
         return self.process_event()
 
@@ -74,23 +102,13 @@ class H11HTTPParser(IHTTPParser):
         self.method = method.upper()
 
     def set_headers(self, headers: Iterable[tuple[bytes, bytes]]) -> None:
-        for header, value in map(
-            lambda item: (
-                item[0].lower(),
-                item[1],
-            ),
-            headers,
-        ):
+        for header, value in headers:
             self.headers.append((header, value))
-            if header == b"connection":
-                self.connection_header = value.decode()
+            self.flags.add_header(header, value)
 
     def set_http_version(self, http_version: str) -> None:
         self.http_version = http_version
 
-    def set_body(self, body: bytes) -> None:
-        self.body = body
-
     def is_metadata_ready(self) -> bool:
         return (
             self.method is not None
@@ -113,15 +131,20 @@ class H11HTTPParser(IHTTPParser):
             raw_path=self.path.encode(),
             http_version=self.http_version,
             query_string=self.query_string,
+            keep_alive=is_keepalive_connection(
+                self.http_version, self.flags.connection
+            ),
+            websocket=is_websocket_upgrade(self.flags.upgrade),
+            content_length=self.flags.content_length,
+            expect_continue=self.flags.expect_continue,
+            host=self.flags.host,
         )
 
     def get_error(self) -> HTTPParsingException | None:
         return self.error
 
     def get_body(self) -> bytes | None:
-        body = self.body
-        self.body = None
-        return body
+        return self.body.take()
 
     def is_more_body(self) -> bool:
         return self.more_body
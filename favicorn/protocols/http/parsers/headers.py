@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+
+COMMON_HEADER_NAMES = (
+    b"accept",
+    b"accept-charset",
+    b"accept-encoding",
+    b"accept-language",
+    b"access-control-request-headers",
+    b"access-control-request-method",
+    b"authorization",
+    b"cache-control",
+    b"connection",
+    b"content-encoding",
+    b"content-length",
+    b"content-type",
+    b"cookie",
+    b"dnt",
+    b"expect",
+    b"forwarded",
+    b"host",
+    b"if-match",
+    b"if-modified-since",
+    b"if-none-match",
+    b"if-range",
+    b"if-unmodified-since",
+    b"keep-alive",
+    b"origin",
+    b"pragma",
+    b"priority",
+    b"range",
+    b"referer",
+    b"sec-ch-ua",
+    b"sec-ch-ua-mobile",
+    b"sec-ch-ua-platform",
+    b"sec-fetch-dest",
+    b"sec-fetch-mode",
+    b"sec-fetch-site",
+    b"sec-fetch-user",
+    b"sec-websocket-extensions",
+    b"sec-websocket-key",
+    b"sec-websocket-protocol",
+    b"sec-websocket-version",
+    b"te",
+    b"transfer-encoding",
+    b"upgrade",
+    b"upgrade-insecure-requests",
+    b"user-agent",
+    b"via",
+    b"x-forwarded-for",
+    b"x-forwarded-host",
+    b"x-forwarded-proto",
+    b"x-real-ip",
+    b"x-request-id",
+    b"x-requested-with",
+)
+
+HEADER_NAMES: dict[bytes, bytes] = {
+    variant: name
+    for name in COMMON_HEADER_NAMES
+    for variant in (
+        name,
+        name.title(),
+        name.upper(),
+        name.title().replace(b"Websocket", b"WebSocket"),
+    )
+}
+
+
+def intern_header_name(name: bytes) -> bytes:
+    return HEADER_NAMES.get(name) or name.lower()
+
+
+@dataclass
+class RequestFlags:
+    connection: bytes | None = None
+    upgrade: bytes | None = None
+    content_length: int | None = None
+    expect_continue: bool = False
+    host: bytes | None = None
+    hosts_count: int = 0
+
+    def add_header(self, name: bytes, value: bytes) -> None:
+        match name:
+            case b"connection":
+                if self.connection is None:
+                    self.connection = value
+            case b"upgrade":
+                if self.upgrade is None:
+                    self.upgrade = value
+            case b"content-length":
+                if self.content_length is None and value.isdigit():
+                    self.content_length = int(value)
+            case b"expect":
+                self.expect_continue = value.lower() == b"100-continue"
+            case b"host":
+                self.hosts_count += 1
+                if self.host is None:
+                    self.host = value
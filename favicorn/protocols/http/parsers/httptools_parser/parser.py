@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from types import ModuleType
 from typing import Any
 
 from favicorn.i.protocols.http.parser import HTTPParsingException, IHTTPParser
-from favicorn.i.protocols.http.request_metadata import RequestMetadata
+from favicorn.i.protocols.http.request_metadata import (
+    RequestMetadata,
+    is_keepalive_connection,
+    is_websocket_upgrade,
+)
+from favicorn.i.reader import ReadData
+
+from ..body import BodyQueue
+from ..headers import RequestFlags, intern_header_name
 
 
 @dataclass
 class HTTPParserState:
+    started: bool = False
     more_body: bool = True
-    body: bytes | None = None
+    keep_alive: bool = False
+    body: BodyQueue = field(default_factory=BodyQueue)
     method: str | None = None
     raw_url: bytes | None = None
     http_version: str | None = None
     headers: list[tuple[bytes, bytes]] = field(default_factory=list)
     request_connection_close: bool | None = None
+    error: HTTPParsingException | None = None
+    flags: RequestFlags = field(default_factory=RequestFlags)
 
     def is_metadata_ready(self) -> bool:
         return (
@@ -30,6 +43,7 @@ class HTTPParserState:
         assert self.method is not None
         assert self.http_version is not None
         url = httptools.parse_url(self.raw_url)
+        flags = self.flags
         return RequestMetadata(
             raw_path=url.path,
             method=self.method,
@@ -37,58 +51,87 @@ class HTTPParserState:
             path=url.path.decode(),
             query_string=url.query,
             http_version=self.http_version,
+            keep_alive=is_keepalive_connection(
+                self.http_version, flags.connection
+            ),
+            websocket=is_websocket_upgrade(flags.upgrade),
+            content_length=flags.content_length,
+            expect_continue=flags.expect_continue,
+            host=flags.host,
         )
 
     def add_header(self, name: bytes, value: bytes) -> None:
-        self.headers.append((name.decode().lower().encode(), value))
+        name = intern_header_name(name)
+        self.headers.append((name, value))
+        self.flags.add_header(name, value)
 
 
 class HTTPToolsParser(IHTTPParser):
     httptools: ModuleType
     state: HTTPParserState
+    states: deque[HTTPParserState]
     parser: Any
-    error: HTTPParsingException | None
 
     def __init__(self, httptools: ModuleType) -> None:
         self.httptools = httptools
         self.parser = httptools.HttpRequestParser(self)
         self.state = HTTPParserState()
+        self.states = deque((self.state,))
         self.disconnected = False
-        self.error = None
-        self.is_host_present = False
+
+    @property
+    def parsing_state(self) -> HTTPParserState:
+        return self.states[-1]
+
+    def reset(self) -> None:
+        if not self.state.keep_alive:
+            self.parser = self.httptools.HttpRequestParser(self)
+            self.states.clear()
+        elif self.states:
+            self.states.popleft()
+        if not self.states:
+            self.states.append(HTTPParserState())
+        self.state = self.states[0]
+
+    def has_buffered_data(self) -> bool:
+        return self.state.started
+
+    def on_message_begin(self) -> None:
+        if self.parsing_state.started:
+            self.states.append(HTTPParserState())
+        self.parsing_state.started = True
 
     def on_url(self, url: bytes) -> None:
-        self.state.raw_url = url
+        state = self.parsing_state
+        state.raw_url = url if state.raw_url is None else state.raw_url + url
 
     def on_header(self, name: bytes, value: bytes) -> None:
-        self.state.add_header(name, value)
-        if name.decode().lower() == "host":
-            if self.is_host_present:
-                self.error = HTTPParsingException("Host have multiple entries")
-            else:
-                self.is_host_present = True
+        state = self.parsing_state
+        state.add_header(name, value)
+        if state.flags.hosts_count > 1 and state.error is None:
+            state.error = HTTPParsingException("Host have multiple entries")
 
     def on_headers_complete(self) -> None:
-        self.state.http_version = self.parser.get_http_version()
-        self.state.method = self.parser.get_method().decode().upper()
-        if not self.is_host_present and self.state.http_version == "1.1":
-            self.error = HTTPParsingException("Host header is abscent")
+        state = self.parsing_state
+        state.http_version = self.parser.get_http_version()
+        state.method = self.parser.get_method().decode().upper()
+        if state.flags.hosts_count == 0 and state.http_version == "1.1":
+            state.error = HTTPParsingException("Host header is abscent")
 
     def on_body(self, body: bytes) -> None:
-        self.state.body = body
+        self.parsing_state.body.add(body)
 
     def on_message_complete(self) -> None:
-        if self.state.body is None:
-            self.state.body = b""
-        self.state.more_body = False
+        state = self.parsing_state
+        state.body.complete()
+        state.more_body = False
+        state.keep_alive = self.parser.should_keep_alive()
 
     def get_error(self) -> HTTPParsingException | None:
-        return self.error
+        return self.state.error
 
     def get_body(self) -> bytes | None:
-        body = self.state.body
-        self.state.body = None
-        return body
+        return self.state.body.take()
 
     def is_metadata_ready(self) -> bool:
         return self.state.is_metadata_ready()
@@ -99,10 +142,15 @@ class HTTPToolsParser(IHTTPParser):
     def is_more_body(self) -> bool:
         return self.state.more_body
 
-    def feed_data(self, data: bytes) -> None:
+    def feed_data(self, data: ReadData) -> None:
         try:
             self.parser.feed_data(data)
         except self.httptools.HttpParserInvalidMethodError:
-            self.error = HTTPParsingException("Invalid method encountered")
+            self.parsing_state.error = HTTPParsingException(
+                "Invalid method encountered"
+            )
         except self.httptools.HttpParserUpgrade:
             pass
+        except self.httptools.HttpParserError as error:
+            if self.parsing_state.more_body:
+                self.parsing_state.error = HTTPParsingException(error)
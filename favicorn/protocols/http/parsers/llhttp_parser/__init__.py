@@ -0,0 +1,4 @@
+from .factory import LLHTTPParserFactory
+from .parser import LLHTTPParser
+
+__all__ = ("LLHTTPParser", "LLHTTPParserFactory")
@@ -0,0 +1,13 @@
+from types import ModuleType
+
+from favicorn.i.protocols.http.parser import IHTTPParser, IHTTPParserFactory
+
+from .parser import LLHTTPParser
+
+
+class LLHTTPParserFactory(IHTTPParserFactory):
+    def __init__(self, favicorn_core: ModuleType) -> None:
+        self.favicorn_core = favicorn_core
+
+    def build(self) -> IHTTPParser:
+        return LLHTTPParser(self.favicorn_core)
@@ -0,0 +1,39 @@
+from types import ModuleType
+from typing import Any
+
+from favicorn.i.protocols.http.parser import HTTPParsingException, IHTTPParser
+from favicorn.i.protocols.http.request_metadata import RequestMetadata
+from favicorn.i.reader import ReadData
+
+
+class LLHTTPParser(IHTTPParser):
+    parser: Any
+
+    def __init__(self, favicorn_core: ModuleType) -> None:
+        self.parser = favicorn_core.RequestParser(RequestMetadata)
+
+    def feed_data(self, data: ReadData) -> None:
+        self.parser.feed_data(data)
+
+    def is_metadata_ready(self) -> bool:
+        return self.parser.is_metadata_ready()  # type: ignore[no-any-return]
+
+    def get_metadata(self) -> RequestMetadata:
+        return self.parser.get_metadata()  # type: ignore[no-any-return]
+
+    def get_error(self) -> HTTPParsingException | None:
+        if (error := self.parser.get_error()) is None:
+            return None
+        return HTTPParsingException(error)
+
+    def get_body(self) -> bytes | None:
+        return self.parser.get_body()  # type: ignore[no-any-return]
+
+    def is_more_body(self) -> bool:
+        return self.parser.is_more_body()  # type: ignore[no-any-return]
+
+    def reset(self) -> None:
+        self.parser.reset()
+
+    def has_buffered_data(self) -> bool:
+        return self.parser.has_buffered_data()  # type: ignore[no-any-return]
@@ -1,4 +1,17 @@
 from .base import HTTPBaseSerializer, HTTPBaseSerializerFactory
+from .native import HTTPNativeSerializer, HTTPNativeSerializerFactory
+from .precompiled import (
+    DateHeader,
+    HTTPPrecompiledSerializer,
+    HTTPPrecompiledSerializerFactory,
+)
 
-
-__all__ = ("HTTPBaseSerializer", "HTTPBaseSerializerFactory")
+__all__ = (
+    "DateHeader",
+    "HTTPBaseSerializer",
+    "HTTPBaseSerializerFactory",
+    "HTTPNativeSerializer",
+    "HTTPNativeSerializerFactory",
+    "HTTPPrecompiledSerializer",
+    "HTTPPrecompiledSerializerFactory",
+)
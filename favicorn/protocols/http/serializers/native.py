@@ -0,0 +1,60 @@
+from types import ModuleType
+from typing import Any, Sequence
+
+from favicorn.i.protocols.http.response_metadata import ResponseMetadata
+from favicorn.i.protocols.http.serializer import (
+    IHTTPSerializer,
+    IHTTPSerializerFactory,
+)
+
+
+class HTTPNativeSerializer(IHTTPSerializer):
+    serializer: Any
+
+    def __init__(
+        self,
+        favicorn_core: ModuleType,
+        include_server: bool = True,
+        include_timestamp: bool = True,
+        include_status_text: bool = True,
+        default_headers: Sequence[tuple[bytes, bytes]] = [],
+    ) -> None:
+        self.serializer = favicorn_core.ResponseSerializer(
+            include_server=include_server,
+            include_timestamp=include_timestamp,
+            include_status_text=include_status_text,
+            default_headers=list(default_headers),
+        )
+
+    def serialize_metadata(
+        self,
+        metadata: ResponseMetadata,
+    ) -> bytes:
+        head: bytes = self.serializer.serialize_metadata(
+            metadata.status, metadata.headers
+        )
+        return head
+
+    def serialize_body(self, body: bytes) -> bytes:
+        return body
+
+
+class HTTPNativeSerializerFactory(IHTTPSerializerFactory):
+    def __init__(
+        self,
+        favicorn_core: ModuleType,
+        include_server: bool = True,
+        include_timestamp: bool = True,
+        include_status_text: bool = True,
+        default_headers: Sequence[tuple[bytes, bytes]] = [],
+    ) -> None:
+        self.serializer = HTTPNativeSerializer(
+            favicorn_core,
+            include_server=include_server,
+            include_timestamp=include_timestamp,
+            include_status_text=include_status_text,
+            default_headers=default_headers,
+        )
+
+    def build(self) -> IHTTPSerializer:
+        return self.serializer
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Sequence
+
+from favicorn.i.protocols.http.response_metadata import ResponseMetadata
+from favicorn.i.protocols.http.serializer import (
+    IHTTPSerializer,
+    IHTTPSerializerFactory,
+)
+
+
+class DateHeader:
+    value: bytes
+    loop: asyncio.AbstractEventLoop | None
+    timer: asyncio.TimerHandle | None
+
+    def __init__(self) -> None:
+        self.loop = None
+        self.timer = None
+        self.value = self.render()
+
+    def render(self) -> bytes:
+        return b"date: " + formatdate(usegmt=True).encode() + b"\r\n"
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.loop is loop:
+            return
+        if self.timer is not None:
+            self.timer.cancel()
+        self.loop = loop
+        self.refresh()
+
+    def refresh(self) -> None:
+        assert self.loop is not None
+        self.value = self.render()
+        self.timer = self.loop.call_at(
+            self.loop.time() + 1 - time.time() % 1, self.refresh
+        )
+
+    def get(self) -> bytes:
+        if self.loop is None or self.loop.is_closed():
+            return self.render()
+        return self.value
+
+
+class HTTPPrecompiledSerializer(IHTTPSerializer):
+    date_header: DateHeader | None
+    status_lines: dict[int, bytes]
+    default_headers: bytes
+    static_responses: dict[int, tuple[ResponseMetadata, bytes, bytes]]
+
+    def __init__(
+        self,
+        date_header: DateHeader | None,
+        include_server: bool = True,
+        include_status_text: bool = True,
+        default_headers: Sequence[tuple[bytes, bytes]] = [],
+    ) -> None:
+        self.date_header = date_header
+        self.include_status_text = include_status_text
+        self.status_lines = {
+            status.value: self.build_status_line(status.value)
+            for status in HTTPStatus
+        }
+        headers = list(default_headers)
+        if include_server:
+            headers.append((b"Server", b"favicorn"))
+        self.default_headers = b"".join(
+            name.lower() + b": " + value + b"\r\n" for name, value in headers
+        )
+        self.static_responses = {}
+
+    def build_status_line(self, status_code: int) -> bytes:
+        if self.include_status_text:
+            phrase = HTTPStatus(status_code).phrase
+            return f"HTTP/1.1 {status_code} {phrase}\r\n".encode()
+        return f"HTTP/1.1 {status_code}\r\n".encode()
+
+    def serialize_metadata(
+        self,
+        metadata: ResponseMetadata,
+    ) -> bytes:
+        status_line = self.status_lines.get(metadata.status)
+        if status_line is None:
+            status_line = self.build_status_line(metadata.status)
+        head = bytearray(status_line)
+        head += self.default_headers
+        if self.date_header is not None:
+            head += self.date_header.get()
+        for name, value in metadata.headers:
+            head += name.lower()
+            head += b": "
+            head += value
+            head += b"\r\n"
+        head += b"\r\n"
+        return bytes(head)
+
+    def serialize_body(self, body: bytes) -> bytes:
+        return body
+
+    def serialize_static_response(
+        self, metadata: ResponseMetadata, body: bytes
+    ) -> bytes:
+        date = self.date_header.get() if self.date_header else b""
+        cached = self.static_responses.get(id(metadata))
+        if cached is not None and cached[0] is metadata and cached[1] == date:
+            return cached[2]
+        data = self.serialize_metadata(metadata) + body
+        self.static_responses[id(metadata)] = (metadata, date, data)
+        return data
+
+
+class HTTPPrecompiledSerializerFactory(IHTTPSerializerFactory):
+    date_header: DateHeader | None
+
+    def __init__(
+        self,
+        include_server: bool = True,
+        include_timestamp: bool = True,
+        include_status_text: bool = True,
+        default_headers: Sequence[tuple[bytes, bytes]] = [],
+    ) -> None:
+        self.date_header = DateHeader() if include_timestamp else None
+        self.serializer = HTTPPrecompiledSerializer(
+            date_header=self.date_header,
+            include_server=include_server,
+            include_status_text=include_status_text,
+            default_headers=default_headers,
+        )
+
+    def build(self) -> IHTTPSerializer:
+        if self.date_header is not None:
+            try:
+                self.date_header.start(asyncio.get_running_loop())
+            except RuntimeError:
+                pass
+        return self.serializer
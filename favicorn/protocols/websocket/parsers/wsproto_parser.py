@@ -4,6 +4,7 @@ from favicorn.i.protocols.websocket.parser import (
     IWebsocketParser,
     IWebsocketParserFactory,
 )
+from favicorn.i.reader import ReadData
 
 
 class WSProtoWebsocketParser(IWebsocketParser):
@@ -14,7 +15,7 @@ class WSProtoWebsocketParser(IWebsocketParser):
         )
         self.Opcode = wsproto.frame_protocol.Opcode
 
-    def feed_data(self, data: bytes) -> None:
+    def feed_data(self, data: ReadData) -> None:
         self.parser.receive_bytes(data)
 
     def get_data(self) -> str | bytes | int | None:
@@ -1,39 +1,61 @@
 import asyncio
 
+from .i.reader import ISocketReader
+from .timer_wheel import TimerWheel
 
-class SocketReader:
+
+class SocketReader(ISocketReader):
     buffered_data: bytes | None
     stream_reader: asyncio.StreamReader
     default_read_count: int
 
     def __init__(
-        self, stream_reader: asyncio.StreamReader, default_read_count: int
+        self,
+        stream_reader: asyncio.StreamReader,
+        default_read_count: int,
+        timer_wheel: TimerWheel,
     ) -> None:
         self.buffered_data = None
         self.stream_reader = stream_reader
         self.default_read_count = default_read_count
+        self.timer_wheel = timer_wheel
 
     async def read(
         self, timeout: float | None = None, count: int | None = None
     ) -> bytes | None:
         if self.buffered_data is not None:
             data = self.buffered_data
+            if count is not None and count < len(data):
+                self.buffered_data = data[count:]
+                return data[:count]
             self.buffered_data = None
             return data
         if timeout is None:
             return await self._read(count=count)
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        read_task = loop.create_task(self._read(count=count))
+        read_task.add_done_callback(lambda _: wakeup(waiter))
+        timer = self.timer_wheel.schedule(timeout, lambda: wakeup(waiter))
         try:
-            return await asyncio.wait_for(
-                self._read(count=count), timeout=timeout
-            )
-        except asyncio.TimeoutError:
+            await waiter
+        except BaseException:
+            read_task.cancel()
+            raise
+        finally:
+            timer.cancel()
+        if not read_task.done():
+            read_task.cancel()
+            await asyncio.wait((read_task,))
+        if read_task.cancelled():
             return None
+        return read_task.result()
 
     async def _read(self, count: int | None = None) -> bytes | None:
         if count is None:
             count = self.default_read_count
         data = await self.stream_reader.read(count)
-        if self.stream_reader.at_eof():
+        if not data:
             return None
         return data
 
@@ -42,3 +64,8 @@ class SocketReader:
             self.buffered_data = data
             return True
         return False
+
+
+def wakeup(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -1,8 +1,8 @@
-import asyncio
 import logging
 
-from .connection_manager import ConnectionManager
+from .connection_manager import ConnectionManagerFactory
 from .i.connection import IConnectionFactory
+from .i.connection_manager import IConnectionManagerFactory
 from .i.server import IServer
 from .i.socket_provider import ISocketProvider
 
@@ -11,16 +11,21 @@ class Server(IServer):
     logger: logging.Logger
     socket_provider: ISocketProvider
     connection_factory: IConnectionFactory
+    connection_manager_factory: IConnectionManagerFactory
 
     def __init__(
         self,
         socket_provider: ISocketProvider,
         connection_factory: IConnectionFactory,
         logger: logging.Logger = logging.getLogger(__name__),
+        connection_manager_factory: IConnectionManagerFactory = (
+            ConnectionManagerFactory()
+        ),
     ) -> None:
         self.logger = logger
         self.socket_provider = socket_provider
         self.connection_factory = connection_factory
+        self.connection_manager_factory = connection_manager_factory
 
     async def init(self) -> None:
         self.logger.debug("Start initializing server")
@@ -29,12 +34,10 @@ class Server(IServer):
             f"Socket {sock.getsockname()} acquired successfully "
             f"using {type(self.socket_provider)}"
         )
-        manager = ConnectionManager(self.connection_factory)
-        self._server = await asyncio.start_server(
-            manager.handler,
-            sock=sock,
-            start_serving=False,
+        manager = self.connection_manager_factory.build(
+            self.connection_factory
         )
+        self._server = await manager.create_server(sock)
         self.logger.debug("Initialization is complete")
 
     async def start_serving(self) -> None:
@@ -16,6 +16,7 @@ class InetSocketProvider(ISocketProvider):
     family: INET_FAMILY
     sock: socket.socket | None
     reuse_address: bool
+    reuse_port: bool
 
     def __init__(
         self,
@@ -23,12 +24,14 @@ class InetSocketProvider(ISocketProvider):
         port: int,
         family: INET_FAMILY = socket.AddressFamily.AF_INET,
         reuse_address: bool = False,
+        reuse_port: bool = False,
     ) -> None:
         self.host = host
         self.port = port
         self.family = family
         self.sock = None
         self.reuse_address = reuse_address
+        self.reuse_port = reuse_port
 
     def acquire(self) -> socket.socket:
         if self.sock is None:
@@ -45,6 +48,8 @@ class InetSocketProvider(ISocketProvider):
         sock.setsockopt(
             socket.SOL_SOCKET, socket.SO_REUSEADDR, int(self.reuse_address)
         )
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
     def cleanup(self) -> None:
         pass
@@ -0,0 +1,175 @@
+import asyncio
+import gc
+import logging
+import os
+import signal
+import time
+from types import FrameType
+from typing import Callable
+
+from .i.server import IServer
+from .i.socket_provider import ISocketProvider
+
+
+async def serve(server: IServer) -> None:
+    await server.init()
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+class Supervisor:
+    logger: logging.Logger
+    server_factory: Callable[[], IServer]
+    socket_provider: ISocketProvider
+    workers: dict[int, int]
+    started_at: dict[int, float]
+    quick_failures: dict[int, int]
+    pending_restarts: dict[int, float]
+
+    def __init__(
+        self,
+        server_factory: Callable[[], IServer],
+        socket_provider: ISocketProvider,
+        workers_count: int,
+        reuse_port: bool = False,
+        monitor_interval_s: float = 0.5,
+        shutdown_timeout_s: float = 10,
+        min_worker_uptime_s: float = 5,
+        restart_backoff_s: float = 0.5,
+        max_restart_backoff_s: float = 30,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        assert workers_count > 0, "At least one worker is required"
+        self.logger = logger
+        self.server_factory = server_factory
+        self.socket_provider = socket_provider
+        self.workers_count = workers_count
+        self.reuse_port = reuse_port
+        self.monitor_interval_s = monitor_interval_s
+        self.shutdown_timeout_s = shutdown_timeout_s
+        self.min_worker_uptime_s = min_worker_uptime_s
+        self.restart_backoff_s = restart_backoff_s
+        self.max_restart_backoff_s = max_restart_backoff_s
+        self.workers = {}
+        self.started_at = {}
+        self.quick_failures = {}
+        self.pending_restarts = {}
+        self.should_exit = False
+
+    def run(self) -> None:
+        signal.signal(signal.SIGINT, self.handle_exit)
+        signal.signal(signal.SIGTERM, self.handle_exit)
+        self.start()
+        try:
+            while not self.should_exit:
+                self.reap_workers()
+                time.sleep(self.monitor_interval_s)
+        finally:
+            self.stop()
+
+    def handle_exit(self, signum: int, frame: FrameType | None) -> None:
+        self.should_exit = True
+
+    def start(self) -> None:
+        if not self.reuse_port:
+            sock = self.socket_provider.acquire()
+            self.logger.info(
+                f"Socket {sock.getsockname()} is shared "
+                f"between {self.workers_count} workers"
+            )
+        gc.collect()
+        gc.freeze()
+        for index in range(self.workers_count):
+            self.spawn_worker(index)
+
+    def spawn_worker(self, index: int) -> int:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(self.run_worker())
+        self.workers[pid] = index
+        self.started_at[index] = time.monotonic()
+        self.logger.info(f"Worker #{index} started with pid {pid}")
+        return pid
+
+    def run_worker(self) -> int:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            asyncio.run(self.worker_main())
+        except BaseException:
+            self.logger.exception(f"Worker {os.getpid()} crashed")
+            return 1
+        return 0
+
+    async def worker_main(self) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, task.cancel
+        )
+        try:
+            await serve(self.server_factory())
+        except asyncio.CancelledError:
+            pass
+
+    def reap_workers(self) -> None:
+        for pid in list(self.workers):
+            waited_pid, status = os.waitpid(pid, os.WNOHANG)
+            if waited_pid == 0:
+                continue
+            index = self.workers.pop(pid)
+            log = self.logger.info if self.should_exit else self.logger.warning
+            log(
+                f"Worker #{index} with pid {pid} exited "
+                f"with code {os.waitstatus_to_exitcode(status)}"
+            )
+            if not self.should_exit:
+                self.schedule_restart(index)
+        self.restart_workers()
+
+    def schedule_restart(self, index: int) -> None:
+        now = time.monotonic()
+        if now - self.started_at[index] < self.min_worker_uptime_s:
+            failures = self.quick_failures.get(index, 0) + 1
+        else:
+            failures = 0
+        self.quick_failures[index] = failures
+        delay = 0.0
+        if failures > 1:
+            delay = min(
+                self.restart_backoff_s * 2 ** (failures - 2),
+                self.max_restart_backoff_s,
+            )
+            self.logger.warning(
+                f"Worker #{index} failed {failures} times in a row, "
+                f"restarting in {delay:.1f}s"
+            )
+        self.pending_restarts[index] = now + delay
+
+    def restart_workers(self) -> None:
+        if self.should_exit:
+            self.pending_restarts.clear()
+            return
+        now = time.monotonic()
+        for index, restart_at in list(self.pending_restarts.items()):
+            if restart_at <= now:
+                del self.pending_restarts[index]
+                self.spawn_worker(index)
+
+    def stop(self) -> None:
+        self.should_exit = True
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.shutdown_timeout_s
+        while self.workers and time.monotonic() < deadline:
+            self.reap_workers()
+            time.sleep(0.05)
+        for pid in self.workers:
+            self.logger.warning(f"Worker {pid} is not responding, killing")
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.workers.clear()
+        self.socket_provider.cleanup()
+        self.logger.info("Supervisor stopped")
@@ -0,0 +1,84 @@
+import asyncio
+import math
+import weakref
+from typing import Callable
+
+
+class Timer:
+    __slots__ = ("tick", "callback", "wheel")
+
+    def __init__(
+        self, tick: int, callback: Callable[[], None], wheel: "TimerWheel"
+    ) -> None:
+        self.tick = tick
+        self.callback = callback
+        self.wheel = wheel
+
+    def cancel(self) -> None:
+        self.wheel.cancel(self)
+
+
+class TimerWheel:
+    loop: asyncio.AbstractEventLoop
+    buckets: dict[int, set[Timer]]
+    handle: asyncio.TimerHandle | None
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, resolution: float = 0.25
+    ) -> None:
+        self.loop = loop
+        self.resolution = resolution
+        self.buckets = {}
+        self.handle = None
+        self.last_tick = self.get_current_tick()
+
+    def get_current_tick(self) -> int:
+        return math.floor(self.loop.time() / self.resolution)
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        if self.handle is None:
+            self.last_tick = self.get_current_tick()
+            self.schedule_run()
+        tick = max(
+            math.ceil((self.loop.time() + delay) / self.resolution),
+            self.last_tick + 1,
+        )
+        timer = Timer(tick, callback, self)
+        if bucket := self.buckets.get(tick):
+            bucket.add(timer)
+        else:
+            self.buckets[tick] = {timer}
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        if bucket := self.buckets.get(timer.tick):
+            bucket.discard(timer)
+            if not bucket:
+                del self.buckets[timer.tick]
+
+    def schedule_run(self) -> None:
+        self.handle = self.loop.call_at(
+            (self.last_tick + 1) * self.resolution, self.run
+        )
+
+    def run(self) -> None:
+        self.handle = None
+        current_tick = self.get_current_tick()
+        for tick in range(self.last_tick + 1, current_tick + 1):
+            for timer in self.buckets.pop(tick, ()):
+                timer.callback()
+        self.last_tick = current_tick
+        if self.buckets:
+            self.schedule_run()
+
+
+timer_wheels: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, TimerWheel
+] = weakref.WeakKeyDictionary()
+
+
+def get_timer_wheel() -> TimerWheel:
+    loop = asyncio.get_running_loop()
+    if (timer_wheel := timer_wheels.get(loop)) is None:
+        timer_wheel = timer_wheels[loop] = TimerWheel(loop)
+    return timer_wheel
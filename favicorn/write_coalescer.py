@@ -0,0 +1,63 @@
+import asyncio
+import socket
+
+Chunk = bytes | bytearray | memoryview
+
+
+class WriteCoalescer:
+    transport: asyncio.WriteTransport
+    pending: list[Chunk]
+    sock: socket.socket | None
+
+    def __init__(
+        self,
+        transport: asyncio.WriteTransport,
+        cork: bool,
+        max_pending_size: int = 65536,
+    ) -> None:
+        self.transport = transport
+        self.pending = []
+        self.pending_size = 0
+        self.max_pending_size = max_pending_size
+        self.scheduled = False
+        self.corked = False
+        self.sock = None
+        if cork and hasattr(socket, "TCP_CORK"):
+            self.sock = transport.get_extra_info("socket")
+
+    def write(self, data: Chunk) -> None:
+        if not data or self.transport.is_closing():
+            return
+        if not self.scheduled:
+            self.scheduled = True
+            asyncio.get_running_loop().call_soon(self.uncork)
+            self.set_cork(True)
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if self.pending_size >= self.max_pending_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        if not self.transport.is_closing():
+            if len(self.pending) == 1:
+                self.transport.write(self.pending[0])
+            else:
+                self.transport.writelines(self.pending)
+        self.pending.clear()
+        self.pending_size = 0
+
+    def uncork(self) -> None:
+        self.scheduled = False
+        self.flush()
+        self.set_cork(False)
+
+    def set_cork(self, corked: bool) -> None:
+        if self.sock is None or self.corked is corked:
+            return
+        try:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, corked)
+            self.corked = corked
+        except OSError:
+            self.sock = None
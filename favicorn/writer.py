@@ -1,20 +1,50 @@
 import asyncio
+from typing import BinaryIO
 
+from .i.writer import ISocketWriter
+from .write_coalescer import WriteCoalescer
 
-class SocketWriter:
+
+class SocketWriter(ISocketWriter):
     stream_writer: asyncio.StreamWriter
+    coalescer: WriteCoalescer
 
-    def __init__(self, stream_writer: asyncio.StreamWriter) -> None:
+    def __init__(
+        self,
+        stream_writer: asyncio.StreamWriter,
+        cork: bool = False,
+        high_water_mark: int = 65536,
+        low_water_mark: int = 16384,
+    ) -> None:
         self.stream_writer = stream_writer
+        stream_writer.transport.set_write_buffer_limits(
+            high=high_water_mark, low=low_water_mark
+        )
+        self.coalescer = WriteCoalescer(
+            stream_writer.transport, cork, max_pending_size=high_water_mark
+        )
 
     def write(self, data: bytes) -> None:
+        self.coalescer.write(data)
+
+    async def sendfile(
+        self, file: BinaryIO, offset: int, count: int | None
+    ) -> None:
+        self.coalescer.uncork()
         if not self.stream_writer.is_closing():
-            self.stream_writer.write(data)
+            await asyncio.get_running_loop().sendfile(
+                self.stream_writer.transport, file, offset, count
+            )
 
-    async def flush(self) -> None:
+    async def drain(self) -> None:
         if not self.stream_writer.is_closing():
+            self.coalescer.uncork()
             await self.stream_writer.drain()
 
+    async def flush(self) -> None:
+        self.coalescer.uncork()
+        await self.drain()
+
     def is_closing(self) -> bool:
         return self.stream_writer.is_closing()
 
@@ -27,6 +57,7 @@ class SocketWriter:
         return None
 
     async def close(self) -> None:
+        self.coalescer.flush()
         if self.stream_writer.is_closing():
             return
         if self.stream_writer.can_write_eof():
@@ -1,9 +1,15 @@
+#include "src/http_parser/request_parser.hpp"
+#include "src/http_serializer/response_serializer.hpp"
 #include "src/server/server.hpp"
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <cstddef>
 #include <cstdint>
+#include <string>
+#include <utility>
+#include <vector>
 
 #include "pybind11/detail/common.h"
 #include "pybind11/pytypes.h"
@@ -11,7 +17,39 @@
 PYBIND11_MODULE(favicorn_core, module) {
     namespace py = ::pybind11;
     pybind11::class_<Server>(module, "Server")
-        .def(py::init<const py::object &, const uint16_t &>())
-        .def("get_request", &Server::get_request)
-        .def("exchange_events", &Server::exchange_events);
+        .def(py::init<const int &, const size_t &>(), py::arg("fd"),
+             py::arg("loops_count") = 1)
+        .def(py::init<const py::object &, const uint16_t &, const size_t &>(),
+             py::arg("host"), py::arg("port"), py::arg("loops_count") = 1)
+        .def("exchange_events", &Server::exchange_events)
+        .def("receive", &Server::receive)
+        .def("fileno", &Server::fileno)
+        .def("get_stats", &Server::get_stats)
+        .def("set_log_level", &Server::set_log_level, py::arg("level"))
+        .def("drain_logs", &Server::drain_logs)
+        .def_property_readonly("loops_count", &Server::get_loops_count)
+        .def("close", &Server::close,
+             py::call_guard<py::gil_scoped_release>());
+    pybind11::class_<RequestParser>(module, "RequestParser")
+        .def(py::init<const py::object &>(), py::arg("metadata_class"))
+        .def("feed_data", &RequestParser::feed_data)
+        .def("is_metadata_ready", &RequestParser::is_metadata_ready)
+        .def("get_metadata", &RequestParser::get_metadata)
+        .def("get_error", &RequestParser::get_error)
+        .def("get_body", &RequestParser::get_body)
+        .def("is_more_body", &RequestParser::is_more_body)
+        .def("is_upgrade", &RequestParser::is_upgrade)
+        .def("should_keep_alive", &RequestParser::should_keep_alive)
+        .def("has_buffered_data", &RequestParser::has_buffered_data)
+        .def("reset", &RequestParser::reset);
+    pybind11::class_<ResponseSerializer>(module, "ResponseSerializer")
+        .def(py::init<const bool &, const bool &, const bool &,
+                      const std::vector<std::pair<std::string, std::string>>
+                          &>(),
+             py::arg("include_server") = true,
+             py::arg("include_timestamp") = true,
+             py::arg("include_status_text") = true,
+             py::arg("default_headers") =
+                 std::vector<std::pair<std::string, std::string>>())
+        .def("serialize_metadata", &ResponseSerializer::serialize_metadata);
 }
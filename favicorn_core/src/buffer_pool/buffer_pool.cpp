@@ -0,0 +1,81 @@
+#include "src/buffer_pool/buffer_pool.hpp"
+
+#include <cstddef>
+#include <cstdlib>
+#include <cstring>
+#include <mutex>
+#include <new>
+
+BufferPool::BufferPool(const size_t &max_free_buffers)
+    : max_free_buffers{max_free_buffers} {};
+
+size_t BufferPool::get_size_class(const size_t &size) noexcept {
+    size_t size_class = 0;
+    while ((min_size << size_class) < size) {
+        size_class++;
+    };
+    return size_class;
+};
+
+Buffer BufferPool::acquire(const size_t &size) {
+    if (size > max_size) {
+        oversized++;
+        const auto base = (char *)malloc(size);
+        if (base == nullptr) throw std::bad_alloc();
+        return {base, size, size};
+    };
+    const auto size_class = get_size_class(size);
+    const size_t capacity = min_size << size_class;
+    {
+        const std::lock_guard<std::mutex> lock(mutex);
+        auto &free_list = free_buffers[size_class];
+        if (free_list.size() != 0) {
+            const auto base = free_list.back();
+            free_list.pop_back();
+            free_bytes -= capacity;
+            hits++;
+            return {base, size, capacity};
+        };
+    }
+    misses++;
+    const auto base = (char *)malloc(capacity);
+    if (base == nullptr) throw std::bad_alloc();
+    return {base, size, capacity};
+};
+
+Buffer BufferPool::copy(const char *data, const size_t &size) {
+    auto buffer = acquire(size);
+    memcpy(buffer.base, data, size);
+    return buffer;
+};
+
+void BufferPool::release(Buffer &buffer) noexcept {
+    if (buffer.base == nullptr) return;
+    released++;
+    if (buffer.capacity <= max_size) {
+        const std::lock_guard<std::mutex> lock(mutex);
+        auto &free_list = free_buffers[get_size_class(buffer.capacity)];
+        if (free_list.size() < max_free_buffers) {
+            free_list.push_back(buffer.base);
+            free_bytes += buffer.capacity;
+            buffer = {};
+            return;
+        };
+    };
+    discarded++;
+    free(buffer.base);
+    buffer = {};
+};
+
+BufferPoolStats BufferPool::get_stats() {
+    const std::lock_guard<std::mutex> lock(mutex);
+    return {hits, misses, oversized, released, discarded, free_bytes};
+};
+
+BufferPool::~BufferPool() {
+    for (const auto &free_list : free_buffers) {
+        for (const auto base : free_list) {
+            free(base);
+        };
+    };
+};
@@ -0,0 +1,51 @@
+#ifndef INCLUDE_BUFFER_POOL_H_
+#define INCLUDE_BUFFER_POOL_H_
+
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <vector>
+
+struct Buffer {
+    char *base = nullptr;
+    size_t size = 0;
+    size_t capacity = 0;
+};
+
+struct BufferPoolStats {
+    uint64_t hits;
+    uint64_t misses;
+    uint64_t oversized;
+    uint64_t released;
+    uint64_t discarded;
+    size_t free_bytes;
+};
+
+class BufferPool {
+private:
+    static constexpr size_t min_size = 512;
+    static constexpr size_t classes_count = 8;
+    std::mutex mutex;
+    std::array<std::vector<char *>, classes_count> free_buffers;
+    size_t max_free_buffers;
+    size_t free_bytes = 0;
+    std::atomic<uint64_t> hits = 0;
+    std::atomic<uint64_t> misses = 0;
+    std::atomic<uint64_t> oversized = 0;
+    std::atomic<uint64_t> released = 0;
+    std::atomic<uint64_t> discarded = 0;
+    static size_t get_size_class(const size_t &size) noexcept;
+
+public:
+    static constexpr size_t max_size = min_size << (classes_count - 1);
+    explicit BufferPool(const size_t &max_free_buffers = 1024);
+    Buffer acquire(const size_t &size);
+    Buffer copy(const char *data, const size_t &size);
+    void release(Buffer &buffer) noexcept;
+    BufferPoolStats get_stats();
+    ~BufferPool();
+};
+
+#endif
@@ -1,81 +1,174 @@
-#include <stdio.h>
-#include <stdlib.h>
-#include <string.h>
 #include "src/http_parser/http_parser.hpp"
 
-	
-HTTPRequest::HTTPRequest() : headers{} {};
-
-int on_url(llhttp_t* parser, const char* buffer, size_t length) {
-	HTTPRequest* request = ((parse_settings_t*) (parser -> settings)) -> request;
-	request -> url = std::make_unique<char[]>(length + 1);
-	memcpy((void*)request -> url.get(), buffer, length);
-	return 0;
-};
-
-int on_method(llhttp_t* parser, const char* buffer, size_t length) {
-	HTTPRequest* request = ((parse_settings_t*) (parser -> settings)) -> request;
-	if (length > sizeof(request -> method) - 1) return -1;
-	memcpy((void*)request -> method, buffer, length);
-	return 0;
-};
-
-int on_version(llhttp_t* parser, const char* buffer, size_t length) {
-	HTTPRequest* request = ((parse_settings_t*) (parser -> settings)) -> request;
-	if (length > sizeof(request -> http_version) - 1) return -1;
-	memcpy((void*)request -> http_version, buffer, length);
-	return 0;
-};
-int on_header_field(llhttp_t* parser, const char* buffer, size_t length) {
-	parse_settings_t* settings = (parse_settings_t*) parser -> settings;
-	char* field = new char[length + 1];
-	memcpy((void*) field, buffer, length);
-	settings -> current_header_key = field;
-	return 0;
-};
-int on_header_value(llhttp_t* parser, const char* buffer, size_t length) {
-	parse_settings_t* settings = (parse_settings_t*) parser -> settings;
-	if (settings -> current_header_key == nullptr) return -1;
-	HTTPRequest* request = settings -> request;
-	char* value = new char[length + 1];
-	memcpy((void*) value, buffer, length);
-	request -> headers[settings -> current_header_key] = value;
-	return 0;
-};
-HTTPParser::HTTPParser() : parser{}, settings {} {
+#include <cctype>
+#include <cstddef>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include "llhttp.h"
+
+void append_span(HTTPSpan &span, const std::string &head, const char *at,
+                 const size_t &length) {
+    if (span.length == 0) {
+        span.offset = at - head.data();
+    };
+    span.length += length;
+}
+
+int HTTPParser::on_method(llhttp_t *parser, const char *at, size_t length) {
+    const auto self = (HTTPParser *)parser->data;
+    append_span(self->method, self->head, at, length);
+    return 0;
+};
+
+int HTTPParser::on_url(llhttp_t *parser, const char *at, size_t length) {
+    const auto self = (HTTPParser *)parser->data;
+    append_span(self->url, self->head, at, length);
+    return 0;
+};
+
+int HTTPParser::on_version(llhttp_t *parser, const char *at, size_t length) {
+    const auto self = (HTTPParser *)parser->data;
+    append_span(self->version, self->head, at, length);
+    return 0;
+};
+
+int HTTPParser::on_header_field(llhttp_t *parser, const char *at,
+                                size_t length) {
+    const auto self = (HTTPParser *)parser->data;
+    if (self->state != HTTPParserState::HEAD) return 0;
+    if (self->header_complete) {
+        self->headers.push_back({});
+        self->header_complete = false;
+    };
+    append_span(self->headers.back().name, self->head, at, length);
+    const auto name = const_cast<char *>(at);
+    for (size_t index = 0; index < length; index++) {
+        name[index] = std::tolower((unsigned char)name[index]);
+    };
+    return 0;
+};
+
+int HTTPParser::on_header_value(llhttp_t *parser, const char *at,
+                                size_t length) {
+    const auto self = (HTTPParser *)parser->data;
+    if (self->state != HTTPParserState::HEAD) return 0;
+    append_span(self->headers.back().value, self->head, at, length);
+    return 0;
+};
+
+int HTTPParser::on_header_value_complete(llhttp_t *parser) {
+    ((HTTPParser *)parser->data)->header_complete = true;
+    return 0;
+};
+
+int HTTPParser::on_headers_complete(llhttp_t *parser) {
+    ((HTTPParser *)parser->data)->state = HTTPParserState::BODY;
+    return 0;
+};
+
+int HTTPParser::on_body(llhttp_t *parser, const char *at, size_t length) {
+    ((HTTPParser *)parser->data)->body.append(at, length);
+    return 0;
+};
+
+int HTTPParser::on_message_complete(llhttp_t *parser) {
+    ((HTTPParser *)parser->data)->state =
+        parser->upgrade ? HTTPParserState::UPGRADE : HTTPParserState::COMPLETE;
+    return HPE_PAUSED;
+};
+
+HTTPParser::HTTPParser() : parser{}, settings{} {
     llhttp_settings_init(&settings);
-    settings.on_url = on_url;
     settings.on_method = on_method;
+    settings.on_url = on_url;
     settings.on_version = on_version;
     settings.on_header_field = on_header_field;
     settings.on_header_value = on_header_value;
+    settings.on_header_value_complete = on_header_value_complete;
+    settings.on_headers_complete = on_headers_complete;
+    settings.on_body = on_body;
+    settings.on_message_complete = on_message_complete;
     llhttp_init(&parser, HTTP_REQUEST, &settings);
+    parser.data = this;
+};
+
+size_t HTTPParser::feed(const char *data, const size_t &length) {
+    switch (state) {
+        case HTTPParserState::HEAD: {
+            const auto start = head.size();
+            head.append(data, length);
+            const auto consumed = execute(head.data() + start, length);
+            head.resize(start + consumed);
+            return consumed;
+        }
+        case HTTPParserState::BODY:
+            return execute(data, length);
+        default:
+            return 0;
+    };
 };
-std::tuple<HTTPRequest*, const char*>HTTPParser::parse_request(
-	const char* buffer,
-	size_t length
-) {
-	if (length == 0) {
-		char* error_msg = new char[40];
-		error_msg = "Length is zero";
-		return {nullptr, error_msg};
-	};
-	HTTPRequest* request = new HTTPRequest();
-    settings.request = request;
-    enum llhttp_errno err = llhttp_execute(&parser, buffer, length);
+
+size_t HTTPParser::execute(const char *data, const size_t &length) {
+    const auto status = llhttp_execute(&parser, data, length);
+    switch (status) {
+        case HPE_OK:
+            return length;
+        case HPE_PAUSED:
+        case HPE_PAUSED_UPGRADE:
+            return llhttp_get_error_pos(&parser) - data;
+        default:
+            state = HTTPParserState::FAILED;
+            error = std::string(llhttp_errno_name(status)) + ": " +
+                    llhttp_get_error_reason(&parser);
+            return length;
+    };
+};
+
+void HTTPParser::reset() {
     llhttp_reset(&parser);
-    if (err == HPE_OK) {
-        return {request, nullptr};
-    } else {
-    	char* error_msg = new char[200];
-    	snprintf(
-    		error_msg,
-    		sizeof(error_msg),
-    		"Parse Error: %s %s\n",
-    		llhttp_errno_name(err),
-    		parser.reason
-    	);
-    	return {nullptr, error_msg};
-    }
+    state = HTTPParserState::HEAD;
+    head.clear();
+    method = {};
+    url = {};
+    version = {};
+    headers.clear();
+    header_complete = true;
+    body.clear();
+    error.clear();
+};
+
+HTTPParserState HTTPParser::get_state() const noexcept { return state; };
+
+std::string_view HTTPParser::view(const HTTPSpan &span) const noexcept {
+    return std::string_view(head).substr(span.offset, span.length);
+};
+
+std::string_view HTTPParser::get_method() const noexcept {
+    return view(method);
+};
+
+std::string_view HTTPParser::get_url() const noexcept { return view(url); };
+
+std::string_view HTTPParser::get_version() const noexcept {
+    return view(version);
+};
+
+const std::vector<HTTPHeader> &HTTPParser::get_headers() const noexcept {
+    return headers;
+};
+
+std::string HTTPParser::take_body() {
+    std::string chunk;
+    chunk.swap(body);
+    return chunk;
+};
+
+bool HTTPParser::has_body() const noexcept { return body.size() != 0; };
+
+bool HTTPParser::should_keep_alive() const noexcept {
+    return llhttp_should_keep_alive(&parser) != 0;
 };
 
+const std::string &HTTPParser::get_error() const noexcept { return error; };
@@ -2,34 +2,74 @@
 #define INCLUDE_HTTP_PARSER_H_
 
 #include <cstddef>
-#include <tuple>
-#include <unordered_map>
-#include <memory>
-#include "llhttp.h"
+#include <cstdint>
+#include <string>
+#include <string_view>
+#include <vector>
 
+#include "llhttp.h"
 
-struct HTTPRequest {
-	std::unique_ptr<char[]> url;
-	char method[6] = "\n";
-	char http_version[4] = "\n";
-	std::unordered_map<const char*, const char*> headers;
+enum HTTPParserState : uint8_t {
+    HEAD = 0,
+    BODY = 1,
+    COMPLETE = 2,
+    UPGRADE = 3,
+    FAILED = 4,
+};
 
-	HTTPRequest();
+struct HTTPSpan {
+    size_t offset = 0;
+    size_t length = 0;
 };
 
-struct parse_settings_t : llhttp_settings_t {
-	HTTPRequest* request;
-	char* current_header_key;
+struct HTTPHeader {
+    HTTPSpan name;
+    HTTPSpan value;
 };
+
 class HTTPParser {
-	llhttp_t parser;
-	parse_settings_t settings;
+private:
+    llhttp_t parser;
+    llhttp_settings_t settings;
+    HTTPParserState state = HTTPParserState::HEAD;
+    std::string head;
+    HTTPSpan method;
+    HTTPSpan url;
+    HTTPSpan version;
+    std::vector<HTTPHeader> headers;
+    bool header_complete = true;
+    std::string body;
+    std::string error;
+    size_t execute(const char *data, const size_t &length);
+
 public:
-	HTTPParser();
-	std::tuple<HTTPRequest*, const char*> parse_request(
-		const char* buffer,
-		size_t length
-	);
+    HTTPParser();
+    HTTPParser(const HTTPParser &) = delete;
+    HTTPParser &operator=(const HTTPParser &) = delete;
+    size_t feed(const char *data, const size_t &length);
+    void reset();
+    HTTPParserState get_state() const noexcept;
+    std::string_view view(const HTTPSpan &span) const noexcept;
+    std::string_view get_method() const noexcept;
+    std::string_view get_url() const noexcept;
+    std::string_view get_version() const noexcept;
+    const std::vector<HTTPHeader> &get_headers() const noexcept;
+    std::string take_body();
+    bool has_body() const noexcept;
+    bool should_keep_alive() const noexcept;
+    const std::string &get_error() const noexcept;
 
+    static int on_method(llhttp_t *parser, const char *at, size_t length);
+    static int on_url(llhttp_t *parser, const char *at, size_t length);
+    static int on_version(llhttp_t *parser, const char *at, size_t length);
+    static int on_header_field(llhttp_t *parser, const char *at,
+                               size_t length);
+    static int on_header_value(llhttp_t *parser, const char *at,
+                               size_t length);
+    static int on_header_value_complete(llhttp_t *parser);
+    static int on_headers_complete(llhttp_t *parser);
+    static int on_body(llhttp_t *parser, const char *at, size_t length);
+    static int on_message_complete(llhttp_t *parser);
 };
+
 #endif
@@ -0,0 +1,299 @@
+#include "src/http_parser/request_parser.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cctype>
+#include <cstddef>
+#include <string>
+#include <string_view>
+#include <unordered_map>
+
+#include "pybind11/cast.h"
+#include "pybind11/pytypes.h"
+
+#include "src/http_parser/http_parser.hpp"
+
+namespace py = ::pybind11;
+
+constexpr std::array<std::string_view, 51> common_header_names = {
+    "accept",
+    "accept-charset",
+    "accept-encoding",
+    "accept-language",
+    "access-control-request-headers",
+    "access-control-request-method",
+    "authorization",
+    "cache-control",
+    "connection",
+    "content-encoding",
+    "content-length",
+    "content-type",
+    "cookie",
+    "dnt",
+    "expect",
+    "forwarded",
+    "host",
+    "if-match",
+    "if-modified-since",
+    "if-none-match",
+    "if-range",
+    "if-unmodified-since",
+    "keep-alive",
+    "origin",
+    "pragma",
+    "priority",
+    "range",
+    "referer",
+    "sec-ch-ua",
+    "sec-ch-ua-mobile",
+    "sec-ch-ua-platform",
+    "sec-fetch-dest",
+    "sec-fetch-mode",
+    "sec-fetch-site",
+    "sec-fetch-user",
+    "sec-websocket-extensions",
+    "sec-websocket-key",
+    "sec-websocket-protocol",
+    "sec-websocket-version",
+    "te",
+    "transfer-encoding",
+    "upgrade",
+    "upgrade-insecure-requests",
+    "user-agent",
+    "via",
+    "x-forwarded-for",
+    "x-forwarded-host",
+    "x-forwarded-proto",
+    "x-real-ip",
+    "x-request-id",
+    "x-requested-with",
+};
+
+constexpr std::array<const char *, 11> metadata_fields = {
+    "path",
+    "method",
+    "raw_path",
+    "http_version",
+    "query_string",
+    "headers",
+    "keep_alive",
+    "websocket",
+    "content_length",
+    "expect_continue",
+    "host",
+};
+
+PyObject *get_metadata_kwnames() {
+    static const auto kwnames = [] {
+        const auto names = PyTuple_New(metadata_fields.size());
+        Py_ssize_t index = 0;
+        for (const auto &field : metadata_fields) {
+            PyTuple_SET_ITEM(names, index++, PyUnicode_InternFromString(field));
+        };
+        return names;
+    }();
+    return kwnames;
+};
+
+using InternedHeaderNames = std::unordered_map<std::string_view, PyObject *>;
+
+py::bytes get_header_name(const std::string_view &name) {
+    static const auto *interned = [] {
+        const auto table = new InternedHeaderNames();
+        for (const auto &common_name : common_header_names) {
+            table->emplace(common_name,
+                           PyBytes_FromStringAndSize(common_name.data(),
+                                                     common_name.size()));
+        };
+        return table;
+    }();
+    const auto it = interned->find(name);
+    if (it == interned->end()) return py::bytes(name.data(), name.size());
+    return py::reinterpret_borrow<py::bytes>(it->second);
+};
+
+bool equals_ignore_case(const std::string_view &value,
+                        const std::string_view &expected) {
+    return value.size() == expected.size() &&
+           std::equal(value.begin(), value.end(), expected.begin(),
+                      [](const char &a, const char &b) {
+                          return std::tolower((unsigned char)a) == b;
+                      });
+};
+
+py::object parse_content_length(const std::string_view &value) {
+    if (value.size() == 0 || value.size() > 18) return py::none();
+    long long length = 0;
+    for (const auto &c : value) {
+        if (c < '0' || c > '9') return py::none();
+        length = length * 10 + (c - '0');
+    };
+    return py::int_(length);
+};
+
+RequestParser::RequestParser(const py::object &metadata_class)
+    : metadata_class{metadata_class} {};
+
+void RequestParser::feed_data(const py::buffer &data) {
+    const auto info = data.request();
+    feed((const char *)info.ptr, info.size * info.itemsize);
+};
+
+void RequestParser::feed(const char *data, const size_t &length) {
+    started |= length != 0;
+    if (is_complete() || parser.get_state() == HTTPParserState::FAILED) {
+        buffered.append(data, length);
+        return;
+    };
+    const auto consumed = parser.feed(data, length);
+    buffered.append(data + consumed, length - consumed);
+    const auto state = parser.get_state();
+    if (state == HTTPParserState::FAILED) {
+        error = parser.get_error();
+    } else if (!metadata_ready && state != HTTPParserState::HEAD) {
+        metadata_ready = true;
+        validate_host();
+    };
+};
+
+void RequestParser::validate_host() {
+    size_t hosts_count = 0;
+    for (const auto &header : parser.get_headers()) {
+        hosts_count += parser.view(header.name) == "host";
+    };
+    if (hosts_count > 1) {
+        error = "Host have multiple entries";
+    } else if (hosts_count == 0 && parser.get_version() == "1.1") {
+        error = "Host header is abscent";
+    };
+};
+
+bool RequestParser::is_complete() const noexcept {
+    const auto state = parser.get_state();
+    return state == HTTPParserState::COMPLETE ||
+           state == HTTPParserState::UPGRADE;
+};
+
+bool RequestParser::is_metadata_ready() const noexcept {
+    return metadata_ready;
+};
+
+py::object RequestParser::get_metadata() const {
+    const auto url = parser.get_url();
+    size_t path_start = 0;
+    if (url.size() != 0 && url[0] != '/' && url[0] != '*') {
+        const auto scheme_end = url.find("://");
+        if (scheme_end != std::string_view::npos) {
+            path_start = std::min(url.find('/', scheme_end + 3), url.size());
+        };
+    };
+    auto path = url.substr(path_start);
+    const auto fragment_start = path.find('#');
+    if (fragment_start != std::string_view::npos) {
+        path = path.substr(0, fragment_start);
+    };
+    py::object query_string = py::none();
+    const auto query_start = path.find('?');
+    if (query_start != std::string_view::npos) {
+        const auto query = path.substr(query_start + 1);
+        query_string = py::bytes(query.data(), query.size());
+        path = path.substr(0, query_start);
+    };
+    const auto version = parser.get_version();
+    bool keep_alive = version != "1.0";
+    bool connection_seen = false;
+    bool websocket = false;
+    bool upgrade_seen = false;
+    bool expect_continue = false;
+    py::object content_length = py::none();
+    py::object host = py::none();
+    py::list headers;
+    for (const auto &header : parser.get_headers()) {
+        const auto name = parser.view(header.name);
+        const auto value = parser.view(header.value);
+        const auto value_bytes = py::bytes(value.data(), value.size());
+        headers.append(py::make_tuple(get_header_name(name), value_bytes));
+        if (name == "connection" && !connection_seen) {
+            connection_seen = true;
+            if (equals_ignore_case(value, "keep-alive")) {
+                keep_alive = true;
+            } else if (equals_ignore_case(value, "close")) {
+                keep_alive = false;
+            };
+        } else if (name == "upgrade" && !upgrade_seen) {
+            upgrade_seen = true;
+            websocket = equals_ignore_case(value, "websocket");
+        } else if (name == "content-length" && content_length.is_none()) {
+            content_length = parse_content_length(value);
+        } else if (name == "expect") {
+            expect_continue = equals_ignore_case(value, "100-continue");
+        } else if (name == "host" && host.is_none()) {
+            host = value_bytes;
+        };
+    };
+    const auto method = parser.get_method();
+    const std::array<py::object, metadata_fields.size()> values = {
+        py::str(path.data(), path.size()),
+        py::str(method.data(), method.size()),
+        py::bytes(path.data(), path.size()),
+        py::str(version.data(), version.size()),
+        query_string,
+        headers,
+        py::bool_(keep_alive),
+        py::bool_(websocket),
+        content_length,
+        py::bool_(expect_continue),
+        host,
+    };
+    std::array<PyObject *, metadata_fields.size()> args;
+    for (size_t index = 0; index < values.size(); index++) {
+        args[index] = values[index].ptr();
+    };
+    const auto metadata = PyObject_Vectorcall(
+        metadata_class.ptr(), args.data(), 0, get_metadata_kwnames());
+    if (metadata == nullptr) throw py::error_already_set();
+    return py::reinterpret_steal<py::object>(metadata);
+};
+
+py::object RequestParser::get_error() const {
+    if (error.size() == 0) return py::none();
+    return py::str(error);
+};
+
+py::object RequestParser::get_body() {
+    if (parser.has_body()) {
+        body_returned = is_complete();
+        return py::bytes(parser.take_body());
+    };
+    if (is_complete() && !body_returned) {
+        body_returned = true;
+        return py::bytes("");
+    };
+    return py::none();
+};
+
+bool RequestParser::is_more_body() const noexcept {
+    const auto state = parser.get_state();
+    return state == HTTPParserState::HEAD || state == HTTPParserState::BODY;
+};
+
+bool RequestParser::is_upgrade() const noexcept {
+    return parser.get_state() == HTTPParserState::UPGRADE;
+};
+
+bool RequestParser::should_keep_alive() const noexcept {
+    return parser.should_keep_alive();
+};
+
+bool RequestParser::has_buffered_data() const noexcept { return started; };
+
+void RequestParser::reset() {
+    std::string data;
+    data.swap(buffered);
+    parser.reset();
+    error.clear();
+    started = false;
+    metadata_ready = false;
+    body_returned = false;
+    feed(data.data(), data.size());
+};
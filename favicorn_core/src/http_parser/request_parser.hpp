@@ -0,0 +1,37 @@
+#ifndef INCLUDE_REQUEST_PARSER_H_
+#define INCLUDE_REQUEST_PARSER_H_
+
+#include <pybind11/pybind11.h>
+
+#include <string>
+
+#include "src/http_parser/http_parser.hpp"
+
+class RequestParser {
+private:
+    HTTPParser parser;
+    pybind11::object metadata_class;
+    std::string buffered;
+    std::string error;
+    bool started = false;
+    bool metadata_ready = false;
+    bool body_returned = false;
+    void feed(const char *data, const size_t &length);
+    void validate_host();
+    bool is_complete() const noexcept;
+
+public:
+    explicit RequestParser(const pybind11::object &metadata_class);
+    void feed_data(const pybind11::buffer &data);
+    bool is_metadata_ready() const noexcept;
+    pybind11::object get_metadata() const;
+    pybind11::object get_error() const;
+    pybind11::object get_body();
+    bool is_more_body() const noexcept;
+    bool is_upgrade() const noexcept;
+    bool should_keep_alive() const noexcept;
+    bool has_buffered_data() const noexcept;
+    void reset();
+};
+
+#endif
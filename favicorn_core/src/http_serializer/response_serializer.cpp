@@ -0,0 +1,260 @@
+#include "src/http_serializer/response_serializer.hpp"
+
+#include <cctype>
+#include <cstddef>
+#include <cstdio>
+#include <cstring>
+#include <ctime>
+#include <string>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+#include "pybind11/pytypes.h"
+
+namespace py = ::pybind11;
+
+const char *get_reason_phrase(const int &status) noexcept {
+    switch (status) {
+        case 100:
+            return "Continue";
+        case 101:
+            return "Switching Protocols";
+        case 102:
+            return "Processing";
+        case 103:
+            return "Early Hints";
+        case 200:
+            return "OK";
+        case 201:
+            return "Created";
+        case 202:
+            return "Accepted";
+        case 203:
+            return "Non-Authoritative Information";
+        case 204:
+            return "No Content";
+        case 205:
+            return "Reset Content";
+        case 206:
+            return "Partial Content";
+        case 207:
+            return "Multi-Status";
+        case 208:
+            return "Already Reported";
+        case 226:
+            return "IM Used";
+        case 300:
+            return "Multiple Choices";
+        case 301:
+            return "Moved Permanently";
+        case 302:
+            return "Found";
+        case 303:
+            return "See Other";
+        case 304:
+            return "Not Modified";
+        case 305:
+            return "Use Proxy";
+        case 307:
+            return "Temporary Redirect";
+        case 308:
+            return "Permanent Redirect";
+        case 400:
+            return "Bad Request";
+        case 401:
+            return "Unauthorized";
+        case 402:
+            return "Payment Required";
+        case 403:
+            return "Forbidden";
+        case 404:
+            return "Not Found";
+        case 405:
+            return "Method Not Allowed";
+        case 406:
+            return "Not Acceptable";
+        case 407:
+            return "Proxy Authentication Required";
+        case 408:
+            return "Request Timeout";
+        case 409:
+            return "Conflict";
+        case 410:
+            return "Gone";
+        case 411:
+            return "Length Required";
+        case 412:
+            return "Precondition Failed";
+        case 413:
+            return "Request Entity Too Large";
+        case 414:
+            return "Request-URI Too Long";
+        case 415:
+            return "Unsupported Media Type";
+        case 416:
+            return "Requested Range Not Satisfiable";
+        case 417:
+            return "Expectation Failed";
+        case 418:
+            return "I'm a Teapot";
+        case 421:
+            return "Misdirected Request";
+        case 422:
+            return "Unprocessable Entity";
+        case 423:
+            return "Locked";
+        case 424:
+            return "Failed Dependency";
+        case 425:
+            return "Too Early";
+        case 426:
+            return "Upgrade Required";
+        case 428:
+            return "Precondition Required";
+        case 429:
+            return "Too Many Requests";
+        case 431:
+            return "Request Header Fields Too Large";
+        case 451:
+            return "Unavailable For Legal Reasons";
+        case 500:
+            return "Internal Server Error";
+        case 501:
+            return "Not Implemented";
+        case 502:
+            return "Bad Gateway";
+        case 503:
+            return "Service Unavailable";
+        case 504:
+            return "Gateway Timeout";
+        case 505:
+            return "HTTP Version Not Supported";
+        case 506:
+            return "Variant Also Negotiates";
+        case 507:
+            return "Insufficient Storage";
+        case 508:
+            return "Loop Detected";
+        case 510:
+            return "Not Extended";
+        case 511:
+            return "Network Authentication Required";
+        default:
+            return nullptr;
+    };
+}
+
+void append_header(std::string &headers, const std::string_view &name,
+                   const std::string_view &value) {
+    for (const auto character : name) {
+        headers += std::tolower((unsigned char)character);
+    };
+    headers += ": ";
+    headers += value;
+    headers += "\r\n";
+}
+
+ResponseSerializer::ResponseSerializer(
+    const bool &include_server, const bool &include_timestamp,
+    const bool &include_status_text,
+    const std::vector<std::pair<std::string, std::string>> &default_headers)
+    : include_timestamp{include_timestamp},
+      include_status_text{include_status_text} {
+    for (int status = min_status; status <= max_status; status++) {
+        status_lines[status - min_status] = build_status_line(status);
+    };
+    for (const auto &[name, value] : default_headers) {
+        append_header(this->default_headers, name, value);
+    };
+    if (include_server) {
+        append_header(this->default_headers, "server", "favicorn");
+    };
+};
+
+std::string ResponseSerializer::build_status_line(const int &status) const {
+    auto line = "HTTP/1.1 " + std::to_string(status);
+    const auto phrase = get_reason_phrase(status);
+    if (include_status_text && phrase != nullptr) {
+        line += " ";
+        line += phrase;
+    };
+    return line + "\r\n";
+};
+
+const std::string &ResponseSerializer::get_date_header() {
+    static constexpr const char *days[] = {"Sun", "Mon", "Tue", "Wed",
+                                           "Thu", "Fri", "Sat"};
+    static constexpr const char *months[] = {"Jan", "Feb", "Mar", "Apr",
+                                             "May", "Jun", "Jul", "Aug",
+                                             "Sep", "Oct", "Nov", "Dec"};
+    const auto now = time(nullptr);
+    if (now != date_timestamp) {
+        tm date;
+        gmtime_r(&now, &date);
+        char value[64];
+        snprintf(value, sizeof(value),
+                 "date: %s, %02d %s %04d %02d:%02d:%02d GMT\r\n",
+                 days[date.tm_wday], date.tm_mday, months[date.tm_mon],
+                 date.tm_year + 1900, date.tm_hour, date.tm_min, date.tm_sec);
+        date_header = value;
+        date_timestamp = now;
+    };
+    return date_header;
+};
+
+py::bytes ResponseSerializer::serialize_metadata(const int &status,
+                                                 const py::object &headers) {
+    std::string custom_status_line;
+    const std::string *status_line;
+    if (status >= min_status && status <= max_status) {
+        status_line = &status_lines[status - min_status];
+    } else {
+        custom_status_line = build_status_line(status);
+        status_line = &custom_status_line;
+    };
+    const auto date = include_timestamp ? std::string_view(get_date_header())
+                                        : std::string_view();
+    const auto items = py::reinterpret_steal<py::object>(
+        PySequence_Fast(headers.ptr(), "Headers must be iterable"));
+    if (!items) throw py::error_already_set();
+    const auto count = PySequence_Fast_GET_SIZE(items.ptr());
+    const auto headers_array = PySequence_Fast_ITEMS(items.ptr());
+    size_t size = status_line->size() + default_headers.size() +
+                  date.size() + 2;
+    for (Py_ssize_t index = 0; index < count; index++) {
+        const auto header = headers_array[index];
+        if (!PyTuple_Check(header) || PyTuple_GET_SIZE(header) != 2 ||
+            !PyBytes_Check(PyTuple_GET_ITEM(header, 0)) ||
+            !PyBytes_Check(PyTuple_GET_ITEM(header, 1))) {
+            throw py::type_error("Header must be a tuple of 2 bytes objects");
+        };
+        size += PyBytes_GET_SIZE(PyTuple_GET_ITEM(header, 0)) +
+                PyBytes_GET_SIZE(PyTuple_GET_ITEM(header, 1)) + 4;
+    };
+    auto result = py::reinterpret_steal<py::bytes>(
+        PyBytes_FromStringAndSize(nullptr, size));
+    if (!result) throw py::error_already_set();
+    auto output = PyBytes_AS_STRING(result.ptr());
+    const auto write = [&output](const char *data, const size_t &length) {
+        memcpy(output, data, length);
+        output += length;
+    };
+    write(status_line->data(), status_line->size());
+    write(default_headers.data(), default_headers.size());
+    write(date.data(), date.size());
+    for (Py_ssize_t index = 0; index < count; index++) {
+        const auto name = PyTuple_GET_ITEM(headers_array[index], 0);
+        const auto value = PyTuple_GET_ITEM(headers_array[index], 1);
+        const auto name_data = PyBytes_AS_STRING(name);
+        for (Py_ssize_t position = 0; position < PyBytes_GET_SIZE(name);
+             position++) {
+            *output++ = std::tolower((unsigned char)name_data[position]);
+        };
+        write(": ", 2);
+        write(PyBytes_AS_STRING(value), PyBytes_GET_SIZE(value));
+        write("\r\n", 2);
+    };
+    write("\r\n", 2);
+    return result;
+};
@@ -0,0 +1,38 @@
+#ifndef INCLUDE_RESPONSE_SERIALIZER_H_
+#define INCLUDE_RESPONSE_SERIALIZER_H_
+
+#include <pybind11/pybind11.h>
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+const char *get_reason_phrase(const int &status) noexcept;
+
+class ResponseSerializer {
+private:
+    static constexpr int min_status = 100;
+    static constexpr int max_status = 599;
+    std::array<std::string, max_status - min_status + 1> status_lines;
+    std::string default_headers;
+    bool include_timestamp;
+    bool include_status_text;
+    time_t date_timestamp = -1;
+    std::string date_header;
+    std::string build_status_line(const int &status) const;
+    const std::string &get_date_header();
+
+public:
+    ResponseSerializer(
+        const bool &include_server, const bool &include_timestamp,
+        const bool &include_status_text,
+        const std::vector<std::pair<std::string, std::string>>
+            &default_headers);
+    pybind11::bytes serialize_metadata(const int &status,
+                                       const pybind11::object &headers);
+};
+
+#endif
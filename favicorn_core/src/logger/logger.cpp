@@ -0,0 +1,27 @@
+#include "src/logger/logger.hpp"
+
+#include <cstdarg>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+
+void LogRing::push(const LogLevel &level, const uint64_t &connection_id,
+                   const char *format, ...) noexcept {
+    const auto position = head.load(std::memory_order_relaxed);
+    if (position - tail.load(std::memory_order_acquire) == capacity) {
+        dropped.fetch_add(1, std::memory_order_relaxed);
+        return;
+    };
+    auto &record = records[position % capacity];
+    record.level = level;
+    record.connection_id = connection_id;
+    va_list args;
+    va_start(args, format);
+    vsnprintf(record.message, sizeof(record.message), format, args);
+    va_end(args);
+    head.store(position + 1, std::memory_order_release);
+};
+
+uint64_t LogRing::take_dropped() noexcept {
+    return dropped.exchange(0, std::memory_order_relaxed);
+};
@@ -0,0 +1,46 @@
+#ifndef INCLUDE_LOGGER_H_
+#define INCLUDE_LOGGER_H_
+
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+
+enum class LogLevel : uint8_t {
+    debug = 10,
+    info = 20,
+    warning = 30,
+    error = 40,
+};
+
+struct LogRecord {
+    LogLevel level;
+    uint64_t connection_id;
+    char message[112];
+};
+
+class LogRing {
+private:
+    static constexpr size_t capacity = 1024;
+    std::array<LogRecord, capacity> records;
+    std::atomic<size_t> head = 0;
+    std::atomic<size_t> tail = 0;
+    std::atomic<uint64_t> dropped = 0;
+
+public:
+    void push(const LogLevel &level, const uint64_t &connection_id,
+              const char *format, ...) noexcept
+        __attribute__((format(printf, 4, 5)));
+    template <typename Consumer>
+    void drain(Consumer &&consumer) {
+        const auto end = head.load(std::memory_order_acquire);
+        auto start = tail.load(std::memory_order_relaxed);
+        for (; start != end; start++) {
+            consumer(records[start % capacity]);
+            tail.store(start + 1, std::memory_order_release);
+        };
+    };
+    uint64_t take_dropped() noexcept;
+};
+
+#endif
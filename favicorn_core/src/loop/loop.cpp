@@ -9,24 +9,30 @@
 
 #include "uv.h"
 
+void on_uv_stop(uv_async_t *handle) { uv_stop(handle->loop); }
+
 UVLoop::UVLoop() {
     int error = uv_loop_init(this);
     if (error != 0) {
         throw std::runtime_error(uv_strerror(error));
     };
+    uv_async_init(this, &stop_handle, on_uv_stop);
 };
 
 void UVLoop::run_forever() noexcept {
     while (!shouldStop) {
-        uv_run(this, UV_RUN_NOWAIT);
+        uv_run(this, UV_RUN_DEFAULT);
     };
 };
 
 void UVLoop::stop() noexcept {
-    shouldStop = true; 
+    shouldStop = true;
+    uv_async_send(&stop_handle);
 };
 
-void on_uv_walk(uv_handle_t *handle, void *arg) { uv_close(handle, NULL); }
+void on_uv_walk(uv_handle_t *handle, void *arg) {
+    if (!uv_is_closing(handle)) uv_close(handle, NULL);
+}
 
 std::optional<std::runtime_error> UVLoop::close() noexcept {
     uv_walk(this, on_uv_walk, NULL);
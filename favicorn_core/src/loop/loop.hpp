@@ -1,13 +1,15 @@
 #ifndef UVLOOP
 #define UVLOOP
 
+#include <atomic>
 #include <optional>
 #include <stdexcept>
 #include "uv.h"
 
 class UVLoop: public uv_loop_t {
 private:
-    bool shouldStop = false;
+    std::atomic<bool> shouldStop = false;
+    uv_async_t stop_handle;
 public:
     explicit UVLoop();
     void run_forever() noexcept;
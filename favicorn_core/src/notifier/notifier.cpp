@@ -0,0 +1,59 @@
+#include "src/notifier/notifier.hpp"
+
+#include <fcntl.h>
+#include <unistd.h>
+
+#include <cerrno>
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+
+#ifdef __linux__
+#include <sys/eventfd.h>
+#endif
+
+Notifier::Notifier() {
+#ifdef __linux__
+    read_fd = write_fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (read_fd == -1) {
+        throw std::runtime_error(std::string("Error creating eventfd: ") +
+                                 strerror(errno));
+    };
+#else
+    int fds[2];
+    if (pipe(fds) == -1) {
+        throw std::runtime_error(std::string("Error creating pipe: ") +
+                                 strerror(errno));
+    };
+    for (const auto fd : fds) {
+        fcntl(fd, F_SETFL, fcntl(fd, F_GETFL) | O_NONBLOCK);
+        fcntl(fd, F_SETFD, FD_CLOEXEC);
+    };
+    read_fd = fds[0];
+    write_fd = fds[1];
+#endif
+};
+
+void Notifier::notify() noexcept {
+    const uint64_t value = 1;
+    while (::write(write_fd, &value, sizeof(value)) == -1 && errno == EINTR) {
+    };
+};
+
+void Notifier::drain() noexcept {
+    uint64_t buffer[16];
+    while (true) {
+        const auto nread = ::read(read_fd, buffer, sizeof(buffer));
+        if (nread <= 0 && !(nread == -1 && errno == EINTR)) return;
+    };
+};
+
+int Notifier::fileno() const noexcept { return read_fd; };
+
+Notifier::~Notifier() {
+    close(read_fd);
+    if (write_fd != read_fd) {
+        close(write_fd);
+    };
+};
@@ -0,0 +1,17 @@
+#ifndef INCLUDE_NOTIFIER_H_
+#define INCLUDE_NOTIFIER_H_
+
+class Notifier {
+private:
+    int read_fd;
+    int write_fd;
+
+public:
+    Notifier();
+    void notify() noexcept;
+    void drain() noexcept;
+    int fileno() const noexcept;
+    ~Notifier();
+};
+
+#endif
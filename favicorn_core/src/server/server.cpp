@@ -1,242 +1,325 @@
 #include "src/server/server.hpp"
 
 #include <netinet/in.h>
-#include <sys/_endian.h>
-#include <sys/_types/_ssize_t.h>
 #include <sys/socket.h>
 #include <unistd.h>
 
+#include <algorithm>
+#include <cerrno>
 #include <cstddef>
 #include <cstdint>
-#include <cstdio>
-#include <cstdlib>
-#include <cstring>
-#include <functional>
-#include <iostream>
+#include <deque>
+#include <initializer_list>
 #include <memory>
-#include <optional>
-#include <sstream>
 #include <stdexcept>
 #include <string>
-#include <thread>
-#include <tuple>
-#include <unordered_map>
+#include <vector>
 
 #include "pybind11/cast.h"
 #include "pybind11/pytypes.h"
-#include "uuid.hpp"
 #include "uv.h"
-#include "uv/unix.h"
 
-#include "src/http_parser/http_parser.hpp"
-#include "src/loop/loop.hpp"
+#include "src/server/worker.hpp"
 
-#define RAISE_ON_ERROR(error)                         \
-    if (error != 0) {                                 \
-        throw std::runtime_error(uv_strerror(error)); \
+void raise_socket_error(const char *message, const int &fd) {
+    const int error = uv_translate_sys_error(errno);
+    if (fd != -1) {
+        ::close(fd);
     };
-struct write_handle : uv_write_t {
-    bool more_body = true;
+    throw std::runtime_error(std::string(message) + ": " +
+                             uv_strerror(error));
+}
+
+void set_socket_option(const int &fd, const int &option) {
+    const int value = 1;
+    if (setsockopt(fd, SOL_SOCKET, option, &value, sizeof(value)) == -1) {
+        raise_socket_error("Error configuring socket", fd);
+    };
+}
+
+bool has_reuse_port(const int &fd) {
+    int value = 0;
+    socklen_t length = sizeof(value);
+    return getsockopt(fd, SOL_SOCKET, SO_REUSEPORT, &value, &length) == 0 &&
+           value != 0;
+}
+
+int open_reuse_port_socket(const int &fd) {
+    sockaddr_storage addr{};
+    socklen_t addr_len = sizeof(addr);
+    if (getsockname(fd, (sockaddr *)&addr, &addr_len) == -1) {
+        raise_socket_error("Error reading socket address", -1);
+    };
+    const int new_fd = socket(addr.ss_family, SOCK_STREAM | SOCK_CLOEXEC, 0);
+    if (new_fd == -1) {
+        raise_socket_error("Error creating socket", -1);
+    };
+    set_socket_option(new_fd, SO_REUSEADDR);
+    set_socket_option(new_fd, SO_REUSEPORT);
+    if (bind(new_fd, (sockaddr *)&addr, addr_len) == -1) {
+        raise_socket_error("Error binding socket", new_fd);
+    };
+    return new_fd;
+}
+
+Server::Server(const pybind11::object &host, const uint16_t &port,
+               const size_t &loops_count) {
+    sockaddr_in addr{};
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(host.attr("__int__")().cast<uint32_t>());
+    addr.sin_port = htons(port);
+    const int fd = socket(AF_INET, SOCK_STREAM | SOCK_CLOEXEC, 0);
+    if (fd == -1) {
+        raise_socket_error("Error creating socket", -1);
+    };
+    set_socket_option(fd, SO_REUSEADDR);
+    if (loops_count > 1) {
+        set_socket_option(fd, SO_REUSEPORT);
+    };
+    if (bind(fd, (sockaddr *)&addr, sizeof(addr)) == -1) {
+        raise_socket_error("Error binding socket", fd);
+    };
+    try {
+        start(fd, loops_count);
+    } catch (...) {
+        ::close(fd);
+        throw;
+    };
+    ::close(fd);
 };
-void alloc_buffer(uv_handle_t *handle, size_t suggested_size, uv_buf_t *buf) {
-    buf->base = (char *)malloc(suggested_size);
-    buf->len = suggested_size;
+
+Server::Server(const int &fd, const size_t &loops_count) {
+    start(fd, loops_count);
 };
 
-void on_close(uv_handle_t *handle) {
-    std::cout << "On close: " << (void*) handle << std::endl;
-    free(handle);
-}
+void Server::start(const int &fd, const size_t &loops_count) {
+    if (loops_count == 0) {
+        throw std::invalid_argument("At least one loop is required");
+    };
+    routed.resize(loops_count);
+    const bool reuse_port = loops_count > 1 && has_reuse_port(fd);
+    for (size_t index = 0; index < loops_count; index++) {
+        workers.push_back(
+            std::make_unique<Worker>(this, index, loops_count));
+        workers.back()->listen(index != 0 && reuse_port
+                                   ? open_reuse_port_socket(fd)
+                                   : dup(fd));
+    };
+};
+
+void Server::notify() noexcept {
+    if (!notified.exchange(true)) {
+        notifier.notify();
+    };
+};
 
-void server_write(uv_write_t *req, int status) {
-    if (status == -1) {
-        std::cerr << "Write error!\n" << std::endl;
-    }
-    if (!((write_handle *)req)->more_body) {
-        uv_close((uv_handle_t *)req->handle, on_close);
+uint64_t read_integer(PyObject *value) {
+    const auto integer = PyLong_AsUnsignedLongLong(value);
+    if (integer == (unsigned long long)-1 && PyErr_Occurred()) {
+        throw pybind11::error_already_set();
     };
-    char *base = (char *)req->data;
-    free(base);
-    free(req);
+    return integer;
 }
-void on_read(uv_stream_t *client, ssize_t nread, const uv_buf_t *buf) {
-    if (nread > 0) {
-        const auto buffer = uv_buf_init(buf->base, nread);
-        const auto &server = (Server *)client->loop->data;
-        const auto &[request, error] =
-            server->parser.parse_request(buf->base, nread);
-        if (error != nullptr) {
-            std::cerr << error << std::endl;
-            delete error;
+
+void Server::read_command(PyObject *item) {
+    if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 3) {
+        throw pybind11::type_error("Command must be a tuple of 3 items");
+    };
+    const auto connection_id = read_integer(PyTuple_GET_ITEM(item, 0));
+    const auto index = (connection_id - 1) % workers.size();
+    const auto type = read_integer(PyTuple_GET_ITEM(item, 1));
+    if (type > ServerCommandType::START_IDLE_TIMER) {
+        throw pybind11::value_error("Unknown command type");
+    };
+    auto &command =
+        routed[index].emplace_back(connection_id, (ServerCommandType)type);
+    const auto payload = PyTuple_GET_ITEM(item, 2);
+    if (command.type == ServerCommandType::START_IDLE_TIMER) {
+        if (!PyTuple_Check(payload) || PyTuple_GET_SIZE(payload) != 2) {
+            throw pybind11::type_error("Idle timer must be a tuple of 2 items");
+        };
+        command.timeout_ms = read_integer(PyTuple_GET_ITEM(payload, 0));
+        command.bytes_received = read_integer(PyTuple_GET_ITEM(payload, 1));
+    } else if (payload != Py_None) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(payload, &view, PyBUF_SIMPLE) != 0) {
+            throw pybind11::error_already_set();
+        };
+        command.buffer =
+            workers[index]->pool.copy((const char *)view.buf, view.len);
+        PyBuffer_Release(&view);
+    };
+};
+
+PyObject *build_tuple(std::initializer_list<PyObject *> items) {
+    const auto tuple = std::find(items.begin(), items.end(), nullptr) ==
+                               items.end()
+                           ? PyTuple_New(items.size())
+                           : nullptr;
+    Py_ssize_t index = 0;
+    for (const auto item : items) {
+        if (tuple == nullptr) {
+            Py_XDECREF(item);
         } else {
-            server->add_request(request, client);
-            uv_read_stop(client);
+            PyTuple_SET_ITEM(tuple, index++, item);
         };
-    }
-    if (nread < 0) {
-        std::cerr << "Read error: " << uv_strerror(nread) << std::endl;
-        std::cout << "read before uv_close" << std::endl;
-        uv_close((uv_handle_t *)client, on_close);
-    }
+    };
+    return tuple;
+}
 
-    if (buf->base != nullptr) {
-        free(buf->base);
+PyObject *build_event(ServerEvent &event, BufferPool &pool) {
+    PyObject *payload;
+    switch (event.type) {
+        case ServerEventType::CONNECTION_MADE:
+            payload = build_tuple({PyUnicode_FromStringAndSize(
+                                       event.host.data(), event.host.size()),
+                                   PyLong_FromSize_t(event.size)});
+            break;
+        case ServerEventType::DATA_RECEIVED:
+            payload = PyBytes_FromStringAndSize(event.buffer.base,
+                                                event.buffer.size);
+            pool.release(event.buffer);
+            break;
+        case ServerEventType::DATA_WRITTEN:
+            payload = PyLong_FromSize_t(event.size);
+            break;
+        default:
+            Py_INCREF(Py_None);
+            payload = Py_None;
+            break;
     };
+    return build_tuple({PyLong_FromUnsignedLongLong(event.connection_id),
+                        PyLong_FromLong(event.type), payload});
 }
 
-void loop_visitor(uv_check_t *handle) {
-    const auto server = (Server *)handle->data;
-    while (server->transport_queue.size() != 0) {
-        const auto [request_id, length, buffer, more_body] =
-            server->transport_queue.front();
-        const auto client = server->request_id_to_client[request_id];
-        const auto new_request_id = request_id;
-        if (length == -1) {
-            if (!uv_is_closing((uv_handle_t *)client)) {
-                std::cout << "Closing client: " << (void *)client;
-                uv_close((uv_handle_t *)client, on_close);
+pybind11::list Server::exchange_events(const pybind11::list &new_commands) {
+    const auto commands = new_commands.ptr();
+    try {
+        for (Py_ssize_t index = 0; index < PyList_GET_SIZE(commands);
+             index++) {
+            read_command(PyList_GET_ITEM(commands, index));
+        };
+    } catch (...) {
+        for (size_t index = 0; index < workers.size(); index++) {
+            for (auto &command : routed[index]) {
+                workers[index]->pool.release(command.buffer);
             };
-            delete server->request_id_to_client[request_id];
-        } else {
-            write_handle *req = (write_handle *)malloc(sizeof(write_handle));
-            uv_buf_t wrbuf = uv_buf_init((char *)buffer, length);
-            req->more_body = more_body;
-            std::cout << (void *)client << " uv_write: " << client->type
-                      << ", request_id: " << request_id << std::endl;
-            uv_write(req, (uv_stream_t *)client, &wrbuf, 1, server_write);
-        }
-        server->transport_queue.pop_front();
-        const auto t = std::make_tuple(new_request_id, std::nullopt);
-        server->controller_queue.push_back(t);
-    }
+            routed[index].clear();
+        };
+        throw;
+    };
+    for (size_t index = 0; index < workers.size(); index++) {
+        if (routed[index].size() != 0) {
+            workers[index]->push_commands(routed[index]);
+            routed[index].clear();
+        };
+    };
+    if (notified) {
+        notifier.drain();
+        notified = false;
+    };
+    for (const auto &worker : workers) {
+        worker->pop_events(ready_events);
+    };
+    auto result = pybind11::reinterpret_steal<pybind11::list>(
+        PyList_New(ready_events.size()));
+    if (!result) {
+        release_events();
+        throw pybind11::error_already_set();
+    };
+    for (size_t index = 0; index < ready_events.size(); index++) {
+        auto &event = ready_events[index];
+        const auto item = build_event(
+            event, workers[(event.connection_id - 1) % workers.size()]->pool);
+        if (item == nullptr) {
+            release_events();
+            throw pybind11::error_already_set();
+        };
+        PyList_SET_ITEM(result.ptr(), index, item);
+    };
+    ready_events.clear();
+    return result;
 };
 
-void on_new_connection(uv_stream_t *server, int status) {
-    if (status != 0) {
-        std::cerr << uv_strerror(status) << std::endl;
-        return;
-    };
-    uv_tcp_t *client = (uv_tcp_t *)malloc(sizeof(uv_tcp_t));
-    uv_tcp_init(server->loop, client);
-    if (uv_accept(server, (uv_stream_t *)client) == 0) {
-        std::cout << "Accept client: " << (void *)client
-                  << ", type: " << client->type << std::endl;
-        uv_read_start((uv_stream_t *)client, alloc_buffer, on_read);
-    } else {
-        uv_close((uv_handle_t *)client, on_close);
-    }
-}
-
-Server::Server(const pybind11::object &host, const uint16_t &port)
-    : buffer{""}, parser{} {
-    addr.sin_family = AF_INET;
-    addr.sin_addr.s_addr = htonl(host.attr("__int__")().cast<int>());
-    addr.sin_port = htons(port);
-    loop.data = this;
-    t = std::thread(&Server::thread_main, this);
+void Server::release_events() noexcept {
+    for (auto &event : ready_events) {
+        workers[(event.connection_id - 1) % workers.size()]->pool.release(
+            event.buffer);
+    };
+    ready_events.clear();
 };
 
-void Server::thread_main() {
-    std::cout << "Successfully initialized the loop" << std::endl;
-    uv_tcp_t server;
-    int error = uv_tcp_init(&loop, &server);
-    RAISE_ON_ERROR(error)
-    std::cout << "Successfully initialized tcp server" << std::endl;
-    error = uv_tcp_bind(&server, (const struct sockaddr *)&addr, 0);
-    RAISE_ON_ERROR(error)
-    std::cout << "Binded tcp server" << std::endl;
-    error = uv_listen((uv_stream_t *)&server, 5, on_new_connection);
-    RAISE_ON_ERROR(error)
-    std::cout << "Tcp server started listening" << std::endl;
-    uv_check_t check_handler;
-    uv_check_init(&loop, &check_handler);
-    check_handler.data = this;
-    uv_check_start(&check_handler, (uv_check_cb)loop_visitor);
-    loop.run_forever();
-    const auto exc = loop.close();
-    if (exc.has_value()) {
-        std::cout << "Error closing event loop: " << exc->what() << std::endl;
-    }
+pybind11::object Server::receive() {
+    const auto loop =
+        pybind11::module_::import("asyncio").attr("get_running_loop")();
+    const auto future = loop.attr("create_future")();
+    const auto ready_events = exchange_events(pybind11::list());
+    if (ready_events.size() != 0) {
+        future.attr("set_result")(ready_events);
+        return future;
+    };
+    const auto self = pybind11::cast(this);
+    const int fd = fileno();
+    loop.attr("add_reader")(
+        fd, pybind11::cpp_function([self, loop, future, fd]() {
+            loop.attr("remove_reader")(fd);
+            if (future.attr("done")().cast<bool>()) return;
+            future.attr("set_result")(
+                self.cast<Server *>()->exchange_events(pybind11::list()));
+        }));
+    return future;
 };
 
-const pybind11::object Server::get_request() {
-    if (requests_queue.size() == 0) return pybind11::none();
-    const auto &[request_id, request] = requests_queue.front();
-    const auto scope = request_to_asgi_scope(request);
-    const auto tuple = pybind11::make_tuple(request_id, scope);
-    delete request;
-    requests_queue.pop_front();
-    return tuple;
-};
+int Server::fileno() const noexcept { return notifier.fileno(); };
+
+size_t Server::get_loops_count() const noexcept { return workers.size(); };
 
-const pybind11::dict Server::request_to_asgi_scope(
-    const HTTPRequest *const request) {
-    const auto headers = pybind11::tuple(request->headers.size());
-    int index = 0;
-    for (const auto &[key, value] : request->headers) {
-        headers[index] = pybind11::make_tuple(key, value);
-        index++;
-    };
-    const auto dict = pybind11::dict();
-    dict["type"] = "http";
-    dict["version"] = "3.0";
-    dict["http_version"] = request->http_version;
-    dict["method"] = request->method;
-    dict["path"] = request->url.get();
-    dict["headers"] = headers;
-    return dict;
+pybind11::list Server::get_stats() const {
+    pybind11::list result;
+    for (const auto &worker : workers) {
+        const auto stats = worker->get_stats();
+        pybind11::dict loop_stats;
+        loop_stats["buffer_hits"] = stats.buffers.hits;
+        loop_stats["buffer_misses"] = stats.buffers.misses;
+        loop_stats["buffer_oversized"] = stats.buffers.oversized;
+        loop_stats["buffer_released"] = stats.buffers.released;
+        loop_stats["buffer_discarded"] = stats.buffers.discarded;
+        loop_stats["buffer_free_bytes"] = stats.buffers.free_bytes;
+        loop_stats["write_request_hits"] = stats.write_request_hits;
+        loop_stats["write_request_misses"] = stats.write_request_misses;
+        result.append(loop_stats);
+    };
+    return result;
 };
 
-void Server::add_request(const HTTPRequest *request,
-                         const uv_stream_t *client) {
-    const auto request_id = std::to_string(std::hash<void*>{}((void*)client));
-    std::cout << "Add request: request_id: " << request_id
-              << ", client: " << (void *)client << std::endl;
-    request_id_to_client[request_id] = client;
-    requests_queue.push_back(std::make_tuple(request_id, request));
+void Server::set_log_level(const uint8_t &level) noexcept {
+    for (const auto &worker : workers) {
+        worker->set_log_level((LogLevel)level);
+    };
 };
 
-const pybind11::object Server::exchange_events(const pybind11::list events) {
-    for (const auto &el : events) {
-        const pybind11::tuple tuple = el.cast<pybind11::tuple>();
-        const std::string request_id = tuple[0].cast<std::string>();
-        const std::string event_type = tuple[1]["type"].cast<std::string>();
-        if (event_type == "http.response.start") {
-            const int status = tuple[1]["status"].cast<int>();
-            std::ostringstream oss;
-            oss << "HTTP/1.1 " << std::to_string(status) << " OK\r\n";
-            const auto py_headers = tuple[1]["headers"].cast<pybind11::list>();
-            for (int i = 0; i < py_headers.size(); i++) {
-                const pybind11::tuple py_tuple = py_headers[i];
-                std::string header_key = py_tuple[0].cast<std::string>();
-                std::string header_value = py_tuple[1].cast<std::string>();
-                oss << header_key << ": " << header_value << "\r\n";
-            }
-            oss << "\r\n";
-            char *buf = (char *)malloc(oss.str().size());
-            memcpy(buf, oss.str().c_str(), oss.str().size());
-            transport_queue.push_back(
-                std::make_tuple(request_id, oss.str().size(), buf, true));
-        } else if (event_type == "http.response.body") {
-            const bool more_body = tuple[1]["more_body"].cast<bool>();
-            const std::string body = tuple[1]["body"].cast<std::string>();
-            char *buf = (char *)malloc(body.size());
-            memcpy(buf, body.c_str(), body.size());
-            transport_queue.push_back(
-                std::make_tuple(request_id, body.size(), buf, more_body));
-        }
-    }
-    pybind11::list new_events = pybind11::list();
-    while (controller_queue.size() != 0) {
-        const auto &[request_id, data] = controller_queue.front();
-        new_events.append(pybind11::make_tuple(request_id, data));
-        controller_queue.pop_front();
-    };
-    return new_events;
-}
+pybind11::list Server::drain_logs() {
+    pybind11::list result;
+    for (const auto &worker : workers) {
+        worker->logs.drain([&result](const LogRecord &record) {
+            result.append(pybind11::make_tuple((uint8_t)record.level,
+                                               record.connection_id,
+                                               record.message));
+        });
+        const auto dropped = worker->logs.take_dropped();
+        if (dropped != 0) {
+            result.append(pybind11::make_tuple(
+                (uint8_t)LogLevel::warning, 0,
+                std::to_string(dropped) + " log records were dropped"));
+        };
+    };
+    return result;
+};
 
-Server::~Server() {
-    std::cout << "Destructor" << std::endl;
-    loop.stop();
-    t.join();
+void Server::close() {
+    for (const auto &worker : workers) {
+        worker->stop();
+    };
 };
+
+Server::~Server() { close(); };
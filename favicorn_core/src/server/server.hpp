@@ -1,46 +1,42 @@
 #ifndef INCLUDE_SERVER_H_
 #define INCLUDE_SERVER_H_
 
-#include <Python.h>
-#include <netinet/in.h>
 #include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
 
+#include <atomic>
+#include <cstddef>
 #include <cstdint>
 #include <deque>
-#include <optional>
-#include <string>
-#include <thread>
-#include <tuple>
-#include <unordered_map>
+#include <memory>
+#include <vector>
 
-#include "pybind11/pytypes.h"
-#include "uv.h"
-
-#include "src/http_parser/http_parser.hpp"
-#include "src/loop/loop.hpp"
+#include "src/notifier/notifier.hpp"
+#include "src/server/worker.hpp"
 
 class Server {
 private:
-    const char buffer[1500];
-    std::thread t;
-    void thread_main();
-    std::deque<std::tuple<std::string, const HTTPRequest* const>> requests_queue;
-    sockaddr_in addr;
-    UVLoop loop;
-    const pybind11::dict request_to_asgi_scope(
-        const HTTPRequest* const request);
+    Notifier notifier;
+    std::atomic<bool> notified = false;
+    std::vector<std::unique_ptr<Worker>> workers;
+    std::vector<std::deque<ServerCommand>> routed;
+    std::deque<ServerEvent> ready_events;
+    void start(const int &fd, const size_t &loops_count);
+    void read_command(PyObject *item);
+    void release_events() noexcept;
 
 public:
-    std::unordered_map<std::string, const uv_stream_t*>
-        request_id_to_client;
-    HTTPParser parser;
-    std::deque<std::tuple<std::string, int, const char*, bool>> transport_queue;
-    std::deque<std::tuple<std::string, std::optional<std::string>>> controller_queue;
-    Server(const pybind11::object& host, const uint16_t& port);
-    void add_request(const HTTPRequest* request, const uv_stream_t* client);
-    const pybind11::object get_request();
-    const pybind11::object exchange_events(const pybind11::list events);
+    Server(const pybind11::object &host, const uint16_t &port,
+           const size_t &loops_count);
+    Server(const int &fd, const size_t &loops_count);
+    void notify() noexcept;
+    pybind11::list exchange_events(const pybind11::list &new_commands);
+    pybind11::object receive();
+    int fileno() const noexcept;
+    size_t get_loops_count() const noexcept;
+    pybind11::list get_stats() const;
+    void set_log_level(const uint8_t &level) noexcept;
+    pybind11::list drain_logs();
+    void close();
     ~Server();
 };
 
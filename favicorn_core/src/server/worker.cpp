@@ -0,0 +1,364 @@
+#include "src/server/worker.hpp"
+
+#include <netinet/in.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#include <cstddef>
+#include <cstdint>
+#include <cstdlib>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <utility>
+
+#include "uv.h"
+
+#include "src/server/server.hpp"
+
+void alloc_buffer(uv_handle_t *handle, size_t suggested_size, uv_buf_t *buf) {
+    const auto worker = ((Connection *)handle)->worker;
+    buf->base = worker->read_buffer;
+    buf->len = Worker::read_buffer_size;
+};
+
+void on_connection_close(uv_handle_t *handle) {
+    const auto connection = (Connection *)handle;
+    connection->worker->forget_connection(connection);
+    delete connection;
+}
+
+void on_write(uv_write_t *req, int status) {
+    const auto request = (write_request *)req;
+    const auto connection = (Connection *)req->handle;
+    const auto worker = connection->worker;
+    worker->push_event({connection->id, ServerEventType::DATA_WRITTEN, {},
+                        request->buffer.size});
+    if (status < 0 && status != UV_ECANCELED) {
+        worker->log(LogLevel::warning, connection->id, "Write failed: %s",
+                    uv_strerror(status));
+        worker->close_connection(connection);
+    };
+    worker->release_write_request(request);
+}
+
+void on_shutdown(uv_shutdown_t *req, int status) {
+    const auto connection = (Connection *)req->handle;
+    connection->shutdown_complete = true;
+    if (status < 0 && status != UV_ECANCELED) {
+        connection->worker->log(LogLevel::warning, connection->id,
+                                "Shutdown failed: %s", uv_strerror(status));
+    };
+    if (status < 0 || connection->close_after_shutdown) {
+        connection->worker->close_connection(connection);
+    };
+    delete req;
+}
+
+void on_idle_timeout(uv_timer_t *timer) {
+    const auto connection = (Connection *)timer->data;
+    connection->worker->log(LogLevel::debug, connection->id,
+                            "Idle timeout expired");
+    connection->worker->push_event(
+        {connection->id, ServerEventType::IDLE_TIMEOUT});
+}
+
+void on_read(uv_stream_t *client, ssize_t nread, const uv_buf_t *buf) {
+    const auto connection = (Connection *)client;
+    const auto worker = connection->worker;
+    if (nread != 0 && connection->idle_timer != nullptr) {
+        uv_timer_stop(connection->idle_timer);
+    };
+    if (nread > 0) {
+        connection->bytes_received += nread;
+        worker->push_event({connection->id, ServerEventType::DATA_RECEIVED,
+                            worker->pool.copy(buf->base, nread)});
+    } else if (nread == UV_EOF) {
+        connection->eof = true;
+        worker->log(LogLevel::debug, connection->id, "EOF received");
+        worker->push_event({connection->id, ServerEventType::EOF_RECEIVED});
+    } else if (nread < 0) {
+        worker->log(LogLevel::warning, connection->id, "Read failed: %s",
+                    uv_strerror(nread));
+        worker->close_connection(connection);
+    };
+}
+
+void on_new_connection(uv_stream_t *listener, int status) {
+    const auto worker = (Worker *)listener->data;
+    if (status == 0) {
+        worker->accept();
+    } else {
+        worker->log(LogLevel::error, 0, "Accept failed: %s",
+                    uv_strerror(status));
+    };
+}
+
+void on_commands(uv_async_t *handle) {
+    ((Worker *)handle->data)->process_commands();
+};
+
+std::string get_peer_host(const sockaddr_storage &addr) {
+    char host[INET6_ADDRSTRLEN] = "";
+    if (addr.ss_family == AF_INET) {
+        uv_ip4_name((const sockaddr_in *)&addr, host, sizeof(host));
+    } else if (addr.ss_family == AF_INET6) {
+        uv_ip6_name((const sockaddr_in6 *)&addr, host, sizeof(host));
+    };
+    return host;
+}
+
+uint16_t get_peer_port(const sockaddr_storage &addr) {
+    if (addr.ss_family == AF_INET) {
+        return ntohs(((const sockaddr_in *)&addr)->sin_port);
+    } else if (addr.ss_family == AF_INET6) {
+        return ntohs(((const sockaddr_in6 *)&addr)->sin6_port);
+    };
+    return 0;
+}
+
+Worker::Worker(Server *server, const size_t &index, const size_t &count)
+    : server{server},
+      next_connection_id{index + 1},
+      connection_id_step{count} {
+    uv_tcp_init(&loop, &listener);
+    listener.data = this;
+    uv_async_init(&loop, &commands_handle, on_commands);
+    commands_handle.data = this;
+};
+
+void Worker::listen(const int &fd) {
+    int error = uv_tcp_open(&listener, fd);
+    if (error != 0) {
+        close(fd);
+        throw std::runtime_error(std::string("Error opening socket: ") +
+                                 uv_strerror(error));
+    };
+    error =
+        uv_listen((uv_stream_t *)&listener, SOMAXCONN, on_new_connection);
+    if (error != 0) {
+        throw std::runtime_error(std::string("Error listening on socket: ") +
+                                 uv_strerror(error));
+    };
+    started = true;
+    t = std::thread(&Worker::thread_main, this);
+};
+
+void Worker::thread_main() {
+    loop.run_forever();
+    process_commands();
+    for (const auto &[id, connection] : connections) {
+        close_connection(connection);
+    };
+    loop.close();
+};
+
+void Worker::accept() {
+    const auto connection = new Connection();
+    connection->worker = this;
+    connection->id = next_connection_id;
+    next_connection_id += connection_id_step;
+    uv_tcp_init(&loop, connection);
+    if (uv_accept((uv_stream_t *)&listener, (uv_stream_t *)connection) != 0) {
+        uv_close((uv_handle_t *)connection, [](uv_handle_t *handle) {
+            delete (Connection *)handle;
+        });
+        return;
+    };
+    connections[connection->id] = connection;
+    uv_tcp_nodelay(connection, 1);
+    sockaddr_storage addr{};
+    int addr_len = sizeof(addr);
+    uv_tcp_getpeername(connection, (sockaddr *)&addr, &addr_len);
+    const auto host = get_peer_host(addr);
+    const auto port = get_peer_port(addr);
+    log(LogLevel::debug, connection->id, "Connection accepted from %s:%u",
+        host.c_str(), (unsigned)port);
+    push_event({connection->id, ServerEventType::CONNECTION_MADE, {}, port,
+                host});
+    uv_read_start((uv_stream_t *)connection, alloc_buffer, on_read);
+};
+
+void Worker::push_event(ServerEvent &&event) {
+    {
+        const std::lock_guard<std::mutex> lock(mutex);
+        events.push_back(std::move(event));
+    }
+    server->notify();
+};
+
+void Worker::push_commands(std::deque<ServerCommand> &new_commands) {
+    {
+        const std::lock_guard<std::mutex> lock(mutex);
+        for (auto &command : new_commands) {
+            commands.push_back(std::move(command));
+        };
+    }
+    uv_async_send(&commands_handle);
+};
+
+void Worker::pop_events(std::deque<ServerEvent> &ready_events) {
+    const std::lock_guard<std::mutex> lock(mutex);
+    for (auto &event : events) {
+        ready_events.push_back(std::move(event));
+    };
+    events.clear();
+};
+
+void Worker::process_commands() {
+    std::deque<ServerCommand> pending;
+    {
+        const std::lock_guard<std::mutex> lock(mutex);
+        pending.swap(commands);
+    }
+    for (auto &command : pending) {
+        handle_command(command);
+    };
+};
+
+void Worker::handle_command(ServerCommand &command) {
+    const auto it = connections.find(command.connection_id);
+    if (it == connections.end() ||
+        uv_is_closing((uv_handle_t *)it->second)) {
+        pool.release(command.buffer);
+        return;
+    };
+    const auto connection = it->second;
+    switch (command.type) {
+        case ServerCommandType::WRITE:
+            write(connection, command.buffer);
+            break;
+        case ServerCommandType::WRITE_EOF:
+            shutdown(connection, false);
+            break;
+        case ServerCommandType::CLOSE:
+            shutdown(connection, true);
+            break;
+        case ServerCommandType::PAUSE_READING:
+            uv_read_stop((uv_stream_t *)connection);
+            break;
+        case ServerCommandType::RESUME_READING:
+            if (!connection->eof) {
+                uv_read_start((uv_stream_t *)connection, alloc_buffer,
+                              on_read);
+            };
+            break;
+        case ServerCommandType::START_IDLE_TIMER:
+            start_idle_timer(connection, command);
+            break;
+        default:
+            break;
+    };
+    if (command.type != ServerCommandType::WRITE) {
+        pool.release(command.buffer);
+    };
+};
+
+void Worker::start_idle_timer(Connection *connection,
+                              const ServerCommand &command) {
+    if (command.bytes_received != connection->bytes_received ||
+        connection->eof) {
+        return;
+    };
+    if (connection->idle_timer == nullptr) {
+        connection->idle_timer = new uv_timer_t();
+        uv_timer_init(&loop, connection->idle_timer);
+        connection->idle_timer->data = connection;
+    };
+    uv_timer_start(connection->idle_timer, on_idle_timeout,
+                   command.timeout_ms, 0);
+};
+
+void Worker::write(Connection *connection, Buffer &buffer) {
+    write_request *request;
+    if (free_write_requests.size() != 0) {
+        write_request_hits++;
+        request = free_write_requests.back();
+        free_write_requests.pop_back();
+    } else {
+        write_request_misses++;
+        request = new write_request();
+    };
+    request->buffer = buffer;
+    buffer = {};
+    const auto buf = uv_buf_init(request->buffer.base, request->buffer.size);
+    if (uv_write(request, (uv_stream_t *)connection, &buf, 1, on_write) != 0) {
+        push_event({connection->id, ServerEventType::DATA_WRITTEN, {},
+                    request->buffer.size});
+        release_write_request(request);
+        close_connection(connection);
+    };
+};
+
+void Worker::release_write_request(write_request *request) noexcept {
+    pool.release(request->buffer);
+    if (free_write_requests.size() < max_free_write_requests) {
+        free_write_requests.push_back(request);
+    } else {
+        delete request;
+    };
+};
+
+void Worker::set_log_level(const LogLevel &level) noexcept {
+    log_level.store(level, std::memory_order_relaxed);
+};
+
+WorkerStats Worker::get_stats() {
+    return {pool.get_stats(), write_request_hits, write_request_misses};
+};
+
+void Worker::shutdown(Connection *connection, bool close) {
+    connection->close_after_shutdown |= close;
+    if (connection->shutdown_complete) {
+        if (close) close_connection(connection);
+        return;
+    };
+    if (connection->shutting_down) return;
+    connection->shutting_down = true;
+    const auto request = new uv_shutdown_t();
+    if (uv_shutdown(request, (uv_stream_t *)connection, on_shutdown) != 0) {
+        delete request;
+        close_connection(connection);
+    };
+};
+
+void Worker::close_connection(Connection *connection) {
+    if (uv_is_closing((uv_handle_t *)connection)) return;
+    uv_close((uv_handle_t *)connection, on_connection_close);
+    if (connection->idle_timer != nullptr) {
+        uv_close((uv_handle_t *)connection->idle_timer,
+                 [](uv_handle_t *handle) { delete (uv_timer_t *)handle; });
+        connection->idle_timer = nullptr;
+    };
+};
+
+void Worker::forget_connection(Connection *connection) {
+    log(LogLevel::debug, connection->id, "Connection closed");
+    connections.erase(connection->id);
+    push_event({connection->id, ServerEventType::CONNECTION_LOST});
+};
+
+void Worker::stop() {
+    if (t.joinable()) {
+        loop.stop();
+        t.join();
+    } else if (!started && !closed) {
+        loop.close();
+    };
+    closed = true;
+};
+
+Worker::~Worker() {
+    stop();
+    for (const auto request : free_write_requests) {
+        delete request;
+    };
+    const std::lock_guard<std::mutex> lock(mutex);
+    for (auto &command : commands) {
+        pool.release(command.buffer);
+    };
+    for (auto &event : events) {
+        pool.release(event.buffer);
+    };
+};
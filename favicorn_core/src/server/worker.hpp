@@ -0,0 +1,133 @@
+#ifndef INCLUDE_WORKER_H_
+#define INCLUDE_WORKER_H_
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <unordered_map>
+#include <vector>
+
+#include "uv.h"
+
+#include "src/buffer_pool/buffer_pool.hpp"
+#include "src/logger/logger.hpp"
+#include "src/loop/loop.hpp"
+
+enum ServerEventType : uint8_t {
+    CONNECTION_MADE = 0,
+    DATA_RECEIVED = 1,
+    EOF_RECEIVED = 2,
+    DATA_WRITTEN = 3,
+    CONNECTION_LOST = 4,
+    IDLE_TIMEOUT = 5,
+};
+
+enum ServerCommandType : uint8_t {
+    WRITE = 0,
+    WRITE_EOF = 1,
+    CLOSE = 2,
+    PAUSE_READING = 3,
+    RESUME_READING = 4,
+    START_IDLE_TIMER = 5,
+};
+
+struct ServerEvent {
+    uint64_t connection_id;
+    ServerEventType type;
+    Buffer buffer = {};
+    size_t size = 0;
+    std::string host = "";
+};
+
+struct ServerCommand {
+    uint64_t connection_id;
+    ServerCommandType type;
+    Buffer buffer = {};
+    uint64_t timeout_ms = 0;
+    uint64_t bytes_received = 0;
+};
+
+struct WorkerStats {
+    BufferPoolStats buffers;
+    uint64_t write_request_hits;
+    uint64_t write_request_misses;
+};
+
+struct write_request : uv_write_t {
+    Buffer buffer;
+};
+
+class Server;
+class Worker;
+
+struct Connection : uv_tcp_t {
+    uint64_t id;
+    Worker *worker;
+    uv_timer_t *idle_timer = nullptr;
+    uint64_t bytes_received = 0;
+    bool eof = false;
+    bool shutting_down = false;
+    bool shutdown_complete = false;
+    bool close_after_shutdown = false;
+};
+
+class Worker {
+private:
+    Server *server;
+    std::thread t;
+    UVLoop loop;
+    uv_tcp_t listener;
+    uv_async_t commands_handle;
+    bool started = false;
+    bool closed = false;
+    std::mutex mutex;
+    std::deque<ServerEvent> events;
+    std::deque<ServerCommand> commands;
+    uint64_t next_connection_id;
+    uint64_t connection_id_step;
+    std::unordered_map<uint64_t, Connection *> connections;
+    std::vector<write_request *> free_write_requests;
+    std::atomic<uint64_t> write_request_hits = 0;
+    std::atomic<uint64_t> write_request_misses = 0;
+    std::atomic<LogLevel> log_level = LogLevel::warning;
+    void thread_main();
+    void handle_command(ServerCommand &command);
+    void write(Connection *connection, Buffer &buffer);
+    void shutdown(Connection *connection, bool close);
+    void start_idle_timer(Connection *connection,
+                          const ServerCommand &command);
+
+public:
+    static constexpr size_t read_buffer_size = 65536;
+    static constexpr size_t max_free_write_requests = 1024;
+    char read_buffer[read_buffer_size];
+    BufferPool pool;
+    LogRing logs;
+    Worker(Server *server, const size_t &index, const size_t &count);
+    void listen(const int &fd);
+    void accept();
+    void push_event(ServerEvent &&event);
+    void push_commands(std::deque<ServerCommand> &new_commands);
+    void pop_events(std::deque<ServerEvent> &ready_events);
+    void process_commands();
+    void close_connection(Connection *connection);
+    void forget_connection(Connection *connection);
+    void release_write_request(write_request *request) noexcept;
+    WorkerStats get_stats();
+    void set_log_level(const LogLevel &level) noexcept;
+    template <typename... Args>
+    void log(const LogLevel &level, const uint64_t &connection_id,
+             const char *format, Args... args) noexcept {
+        if (level >= log_level.load(std::memory_order_relaxed)) {
+            logs.push(level, connection_id, format, args...);
+        };
+    };
+    void stop();
+    ~Worker();
+};
+
+#endif
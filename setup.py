@@ -28,6 +28,7 @@ setup(
     packages=find_packages(exclude=["__tests__*"]),
     include_package_data=True,
     ext_modules=[favicorn_core],
+    entry_points={"console_scripts": ["favicorn=favicorn.cli:main"]},
     long_description=(Path(__file__).parent / "README.md").read_text(),
     long_description_content_type="text/markdown",
     cmdclass={"build_ext": cmake_build_extension.BuildExtension},